@@ -18,6 +18,12 @@ from manual_control_page import ManualControlPage
 from calibration_wizard import CalibrationManager
 from data_view_page import DataViewPage
 from device_controllers.serial_pad_reader import SerialPadReader
+from acquisition.sample_broker import SampleBroker, register_rig_sources
+from acquisition.test_journal import close_journal, find_unfinished_journal
+from acquisition.acq_process import RemoteTestManager
+from acquisition.rig import rig_spec_from_devices
+from acquisition.stations import StationSupervisor
+from station_overview_page import StationOverviewPage
 from triaxial_test_manager import TriaxialTestManager
 from test_set_up_page import TestSetupPage
 from test_view_page import TestViewPage
@@ -96,11 +102,15 @@ class MainWindow(QMainWindow):
         self.test_manager = None
         self._last_plot_ts = 0.0
         self._polling_enabled = False
+        self._rig_released = False      # devices handed to the acquisition process
         self._prefs = {}
         if hasattr(self, "_load_prefs"):
             self._load_prefs()
 
 
+        # one producer per connected device; dashboard, manager and stages share its board
+        self.broker = SampleBroker(log=self.log)
+
         self.PRESSURE_SAMPLE_MS = 300  # 0.3 s
         self.pressure_timer = QTimer(self)
         self.pressure_timer.setInterval(self.PRESSURE_SAMPLE_MS)
@@ -164,6 +174,7 @@ class MainWindow(QMainWindow):
         self.sidebar.addItem(QListWidgetItem(move_icon, "Manual Control"))
         self.sidebar.addItem(QListWidgetItem(data_view_icon, "Data View"))
         self.sidebar.addItem(QListWidgetItem(data_settings_icon, "Device Settings"))
+        self.sidebar.addItem(QListWidgetItem(chart_icon, "Stations"))
 
         self.sidebar.setFixedWidth(210)
         main_layout.addWidget(self.sidebar)
@@ -202,6 +213,11 @@ class MainWindow(QMainWindow):
         self.view_page.start_test_clicked.connect(self.start_test)
         self.manual_page = ManualControlPage()
 
+        # extra test stations, each run in its own acquisition process
+        self.station_supervisor = StationSupervisor(log=self.log)
+        self.station_supervisor.load(self._prefs.get("stations") or [])
+        self.stations_page = StationOverviewPage(self.station_supervisor, log=self.log)
+
         self.home_page = HomePage(self.stack,
                                   self.setup_page,
                                   self.config_page,       # <- correct attribute
@@ -294,6 +310,7 @@ class MainWindow(QMainWindow):
         self.stack.addWidget(self.manual_page)
         self.stack.addWidget(self.data_view_page)
         self.stack.addWidget(self.device_settings_page)
+        self.stack.addWidget(self.stations_page)
 
         # map stack index -> page (and vice versa if you like)
         self._page_order = [
@@ -304,6 +321,7 @@ class MainWindow(QMainWindow):
             self.manual_page,
             self.data_view_page,
             self.device_settings_page,
+            self.stations_page,
         ]
 
         # When the stack changes (e.g., via Dashboard buttons), update the sidebar row
@@ -321,6 +339,8 @@ class MainWindow(QMainWindow):
         self.serialpad_timer.timeout.connect(self._poll_serialpad)
         
         QTimer.singleShot(0, self._fit_to_screen)
+        self._pending_resume = None
+        QTimer.singleShot(0, self._check_interrupted_test)
         self.display_page(self.sidebar.currentRow() if self.sidebar.currentRow() >= 0 else 0)
 
     def _on_save_default_device(self, name: str):
@@ -789,27 +809,31 @@ class MainWindow(QMainWindow):
                 if row is not None:
                     self.config_page.set_status(row, False)
                 
+    def _sync_broker_sources(self):
+        """(Re)register one broker producer per connected device and start it."""
+        if self._rig_released:
+            return      # the acquisition process owns the devices
+        register_rig_sources(self.broker, lf=self.lf_controller,
+                             cell_pc=self.cell_pressure_controller,
+                             back_pc=self.back_pressure_controller,
+                             serial_pad=self.serial_pad)
+        if not self.broker.is_running():
+            self.broker.start()
+
+    # dashboard card name -> broker channel
+    _PRESSURE_CARDS = {
+        "Cell Pressure": "cell_pressure_kpa", "Cell Volume": "cell_volume_mm3",
+        "Back Pressure": "back_pressure_kpa", "Back Volume": "back_volume_mm3",
+    }
+
     def _update_dataview_from_devices(self):
-        if not getattr(self, "_polling_enabled", False):
+        if not getattr(self, "_polling_enabled", False) or self._rig_released:
             return
         if self.stack.currentWidget() is self.config_page:
             return
 
-        payload = {}
-        def add(dev, p_key, v_key):
-            try:
-                d = getattr(dev, "driver", dev)
-                gp = getattr(d, "get_cached_pressure", None)
-                gv = getattr(d, "get_cached_volume", None)
-                p = gp and gp(0.9)
-                v = gv and gv(0.9)
-                if p is not None: payload[p_key] = float(p)
-                if v is not None: payload[v_key] = float(v)
-            except Exception:
-                pass
-
-        add(self.cell_pressure_controller, "Cell Pressure", "Cell Volume")
-        add(self.back_pressure_controller, "Back Pressure", "Back Volume")
+        board = self.broker.snapshot(self._PRESSURE_CARDS.values(), max_age_s=0.9)
+        payload = {card: float(board[ch]) for card, ch in self._PRESSURE_CARDS.items() if ch in board}
         if payload:
             self.data_view_page.set_values(payload)
 
@@ -817,6 +841,7 @@ class MainWindow(QMainWindow):
 
     def _start_pressure_polling(self):
         # start the timer only once; safe to call repeatedly
+        self._sync_broker_sources()
         if hasattr(self, "pressure_timer") and not self.pressure_timer.isActive():
             self.pressure_timer.start()
             self.log("[i] Pressure polling started.")
@@ -1123,60 +1148,62 @@ class MainWindow(QMainWindow):
 
     def _poll_serialpad(self):
         def _do():
-            if not self.serial_pad:
+            if not self.serial_pad or self._rig_released:
                 return
-            vals = self.serial_pad.read_channels()
+            # GUI thread: never block on the port; show the broker's latest scan
+            self._sync_broker_sources()
+            vals = self.broker.latest("transducers", max_age_s=1.0)
             if not vals or len(vals) < 8:
                 return
+            self.data_view_page.set_values(self._serialpad_cards(vals))
+        self._safe(_do, "serialpad poll")
 
-            # role → channel index (default identity if no config)
+    def _serialpad_cards(self, vals) -> dict:
+        """SerialPad channels -> dashboard cards by assigned role."""
+        # role → channel index (default identity if no config)
+        assign = {}
+        try:
+            if self.serial_pad is not None and hasattr(self.serial_pad, "get_assignments"):
+                assign = self.serial_pad.get_assignments() or {}
+            else:
+                assign = (self._prefs.get("serialpad") or {}).get("assignments") or {}
+        except Exception:
             assign = {}
+        # invert to role -> ch
+        role_to_ch = {}
+        for ch, v in assign.items():
             try:
-                if hasattr(self.serial_pad, "get_assignments"):
-                    assign = self.serial_pad.get_assignments() or {}
-            except Exception:
-                assign = {}
-            # invert to role -> ch
-            role_to_ch = { (v or {}).get("role"): ch for ch, v in assign.items() if isinstance(v, dict) }
-
-            # canonical dashboard order (keeps your existing cards stable)
-            roles = ["Axial Load","Pore Pressure","Axial Displacement",
-                     "Local Axial 1","Local Axial 2","Local Radial","Unused 1","Unused 2"]
+                if isinstance(v, dict):
+                    role_to_ch[v.get("role")] = int(ch)
+            except (TypeError, ValueError):
+                pass
 
-            payload = {}
-            for role in roles:
-                ch = role_to_ch.get(role, roles.index(role))  # fallback: identity mapping
-                value = vals[ch] if 0 <= ch < len(vals) else None
-                payload[role] = ("—" if value is None else value)
+        # canonical dashboard order (keeps your existing cards stable)
+        roles = ["Axial Load","Pore Pressure","Axial Displacement",
+                 "Local Axial 1","Local Axial 2","Local Radial","Unused 1","Unused 2"]
 
+        payload = {}
+        for role in roles:
+            ch = role_to_ch.get(role, roles.index(role))  # fallback: identity mapping
+            value = vals[ch] if 0 <= ch < len(vals) else None
+            payload[role] = ("—" if value is None else value)
+        return payload
+
+    def _feed_dashboard_from_batch(self, batch):
+        """While the rig is released, the dashboard shows the remote test's latest row."""
+        if not self._rig_released or not getattr(self, "_polling_enabled", False):
+            return
+        last = batch.last if batch is not None else None
+        if not last:
+            return
+        payload = {card: float(last[ch]) for card, ch in self._PRESSURE_CARDS.items()
+                   if last.get(ch) is not None}
+        vals = last.get("transducers")
+        if vals:        # the ring trims trailing empty channels; missing ones show "—"
+            payload.update(self._serialpad_cards(list(vals)))
+        if payload:
             self.data_view_page.set_values(payload)
-        self._safe(_do, "serialpad poll")
-
-
-    def handle_live_reading(self, reading):
-        enriched = self._augment_with_pressures(reading)
-        self.view_page.shared_data = enriched
-        self.view_page._dirty = True   # <- no immediate update_plot()
-
-    def _augment_with_pressures(self, reading: dict) -> dict:
-        out = dict(reading or {})
-
-        def _cached(dev, age=0.9):
-            try:
-                d = getattr(dev, "driver", dev)
-                f = getattr(d, "get_cached_pressure", None)
-                return float(f(age)) if callable(f) else None
-            except Exception:
-                return None
-
-        cell = _cached(self.cell_pressure_controller)
-        back = _cached(self.back_pressure_controller)
 
-        if cell is not None:
-            out["cell_pressure_kpa"] = cell
-        if back is not None:
-            out["back_pressure_kpa"] = back
-        return out
 
     def goto_setup(self, clear: bool = False):
         # 1) show the setup page
@@ -1299,6 +1326,9 @@ class MainWindow(QMainWindow):
 
         if getattr(self, "_resuming_existing_stage", False):
             return  # skip prefill when resuming
+        if getattr(self, "_pending_resume", None) is not None:
+            self.resume_interrupted_test()   # crash recovery takes precedence over a new test
+            return
 
         # --- guards & stage prefill
         if not self._prefill_stage_pressures():
@@ -1329,6 +1359,9 @@ class MainWindow(QMainWindow):
             "sample_height_mm": height_mm,
             "sample_diameter_mm": diameter_mm,
             "is_docked": docked,
+            "run_dir": self._run_dir(),
+            # run devices + manager in their own process (GUI gets a shared-memory feed)
+            "acquisition_process": bool(self._prefs.get("acquisition_process", False)),
         }
 
         # ensure attrs exist for TestViewPage calcs
@@ -1337,21 +1370,30 @@ class MainWindow(QMainWindow):
 
 
 
+        self._launch_test_manager(test_config)
+        self.test_manager.start()
+
+    def _launch_test_manager(self, test_config: dict):
+        """Create the manager, wire it to the pages and show the Test View."""
         # --- instantiate manager
-        self.test_manager = TriaxialTestManager(
-            lf_controller=self.lf_controller,
-            cell_pressure_controller=self.cell_pressure_controller,
-            back_pressure_controller=self.back_pressure_controller,
-            serial_pad=self.serial_pad,
-            test_config=test_config,
-            log=self.log
-        )
+        if test_config.get("acquisition_process"):
+            self.test_manager = self._launch_remote_manager(test_config)
+        else:
+            self.test_manager = TriaxialTestManager(
+                lf_controller=self.lf_controller,
+                cell_pressure_controller=self.cell_pressure_controller,
+                back_pressure_controller=self.back_pressure_controller,
+                serial_pad=self.serial_pad,
+                test_config=test_config,
+                log=self.log,
+                broker=self.broker,
+            )
         self.test_manager.view_page = self.view_page
         self.test_manager.stop_requested = False   # <-- add this
 
         # manager → mainwindow
         self.test_manager.stage_changed.connect(lambda name: self.log(f"[Stage] {name}"))
-        self.test_manager.reading_updated.connect(self.view_page.update_plot)
+        self.test_manager.readings_batch.connect(self.view_page.update_plot_batch)
         self.test_manager.test_finished.connect(lambda: self.log("[✓] Test finished!"))
         self.test_manager.test_finished.connect(lambda: self.pressure_timer.stop())
         self.test_manager.test_finished.connect(self._on_test_finished)  # keep
@@ -1387,7 +1429,134 @@ class MainWindow(QMainWindow):
         if not self.pressure_timer.isActive():
             self.pressure_timer.start()
         self.view_page.add_graph()  # start with one graph; users can add/remove
-        self.test_manager.start()
+
+    # ---------------
+    # Acquisition process
+    # ---------------
+    def _launch_remote_manager(self, test_config: dict) -> RemoteTestManager:
+        """
+        Hand the connected devices to a separate acquisition process and return
+        the GUI-side proxy. The devices are reopened here when the test ends.
+        """
+        spec = rig_spec_from_devices(self.lf_controller, self.cell_pressure_controller,
+                                     self.back_pressure_controller, self.serial_pad)
+        spec["serial_pad_config"] = self._prefs.get("serialpad") or {}
+        self._release_rig()
+        tm = RemoteTestManager(spec, test_config, log=self.log)
+        tm.readings_batch.connect(self._feed_dashboard_from_batch)
+        tm.test_finished.connect(lambda: self._reattach_rig(spec))
+        return tm
+
+    def _release_rig(self):
+        """Close this process's device handles so another process can open them."""
+        self._rig_released = True          # no broker sync / local polling until _reattach_rig
+        self.serialpad_timer.stop()
+        register_rig_sources(self.broker)          # drop all broker producers
+        for dev in (self.lf_controller, self.cell_pressure_controller, self.back_pressure_controller):
+            drv = getattr(dev, "driver", None)
+            target = drv if drv is not None else dev
+            try:
+                if target is not None and hasattr(target, "close"):
+                    target.close()
+            except Exception as e:
+                self.log(f"[!] Device release failed: {e}")
+        if self.serial_pad is not None:
+            try:
+                self.serial_pad.close()
+            except Exception:
+                pass
+            self.serial_pad = None
+
+    def _reattach_rig(self, spec: dict):
+        self._rig_released = False
+        if spec.get("lf") and self.lf_controller:
+            self.lf_controller.connect(spec["lf"])
+        for key, ctrl in (("cell_pc", self.cell_pressure_controller), ("back_pc", self.back_pressure_controller)):
+            if spec.get(key) and ctrl:
+                ctrl.connect(spec[key])
+        if spec.get("serial_pad"):
+            try:
+                self.serial_pad = SerialPadReader(port=spec["serial_pad"],
+                                                  calibration=self.calibration_manager, log=self.log)
+                cfg = self._prefs.get("serialpad")
+                if cfg:
+                    self._apply_serialpad_config(cfg)
+                self.serialpad_timer.start()
+            except Exception as e:
+                self.log(f"[✗] SerialPad reconnect failed: {e}")
+        self._sync_broker_sources()
+        self.log("[i] Devices returned from the acquisition process.")
+
+    # ---------------
+    # Crash recovery
+    # ---------------
+    def _run_dir(self) -> str:
+        """
+        Absolute run directory shared by the manager (journals, run logs) and
+        the recovery scan. A relative prefs "run_dir" is taken from the app's
+        folder (the exe when frozen), not the cwd.
+        """
+        base = os.path.dirname(sys.executable if getattr(sys, "frozen", False) else os.path.abspath(__file__))
+        return os.path.abspath(os.path.join(base, os.path.expanduser(self._prefs.get("run_dir") or "runs")))
+
+    def _check_interrupted_test(self):
+        """On startup: offer to resume a test whose journal never reached its end."""
+        try:
+            state = find_unfinished_journal(self._run_dir())
+        except Exception as e:
+            self.log(f"[!] Journal scan failed: {e}")
+            return
+        if state is None:
+            return
+        sample_id = state.config.get("sample_id", "") or "—"
+        started = time.strftime("%Y-%m-%d %H:%M", time.localtime(state.test_start_ts or 0))
+        choice = QMessageBox.question(
+            self, "Resume Interrupted Test?",
+            f"A test did not finish cleanly:\n\n  Sample: {sample_id}\n  Started: {started}\n"
+            f"  Stage: {state.stage_index + 1} of {len(state.stages)}\n\n"
+            "Resume it from the last checkpoint?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if choice != QMessageBox.Yes:
+            try:
+                close_journal(state, reason="abandoned")
+            except Exception as e:
+                self.log(f"[!] Could not close journal: {e}")
+            return
+        self._pending_resume = state
+        if self.lf_controller and self.cell_pressure_controller and self.back_pressure_controller and self.serial_pad:
+            self.resume_interrupted_test()
+        else:
+            self._info("Connect Devices",
+                       "Connect all devices, then press Start Test to resume the interrupted test.")
+
+    def resume_interrupted_test(self):
+        state = getattr(self, "_pending_resume", None)
+        if state is None:
+            return
+        if not (self.lf_controller and self.cell_pressure_controller and self.back_pressure_controller and self.serial_pad):
+            self.log("[✗] All devices must be connected before resuming a test.")
+            return
+        self._pending_resume = None
+
+        stages = [StageData.from_dict(d) for d in state.stages]
+        test_config = state.config
+        test_config["stages"] = stages
+        # keep writing where the journal was found, whatever the journal's config says
+        test_config["run_dir"] = os.path.dirname(os.path.abspath(state.path))
+        if test_config.get("acquisition_process"):
+            # the acquisition process resumes from the journal itself on start()
+            test_config["resume_journal"] = state.path
+
+        self.view_page.start_time = state.test_start_ts or time.time()
+        self.view_page.load_stages(stages)
+        self.view_page._h0_mm = test_config.get("sample_height_mm")
+        self.view_page._d0_mm = test_config.get("sample_diameter_mm")
+
+        self._launch_test_manager(test_config)
+        if isinstance(self.test_manager, RemoteTestManager):
+            self.test_manager.start()
+        else:
+            self.test_manager.resume_from_journal(state)
 
 
     def _on_test_finished(self):
@@ -1406,15 +1575,16 @@ class MainWindow(QMainWindow):
         m, _ = divmod(rem, 60)
         duration = f"{h}h {m}m" if h else f"{m}m"
 
-        # Datapoints & filepath (best-effort if you don’t have a logger yet)
+        # Datapoints & filepath from the manager's on-disk run log
+        run_log = getattr(self.test_manager, "run_log", None)
         datapoints = 0
         try:
-            datapoints = int(self.logger.total_rows_written())
+            datapoints = int(run_log.total_rows_written())
         except Exception:
             pass
         filepath = "Not saved yet"
         try:
-            p = getattr(self.logger, "last_path", None)
+            p = getattr(run_log, "last_path", None)
             if p:
                 filepath = str(p)
         except Exception:
@@ -1572,7 +1742,7 @@ class MainWindow(QMainWindow):
         # Prevent removing the running stage if a thread is still active
         running_idx = getattr(tm, "current_stage_index", -1)
         is_current = sel_sid == getattr(tm.stages[running_idx], "stage_id", None) if 0 <= running_idx < len(tm.stages) else False
-        thread_running = bool(getattr(tm, "thread", None) and hasattr(tm.thread, "isRunning") and tm.thread.isRunning())
+        thread_running = bool(getattr(tm, "executor", None) and tm.executor.is_busy())
 
         if is_current and thread_running:
             QMessageBox.warning(self, "Blocked", "Stop the current stage before removing it.")
@@ -1783,23 +1953,13 @@ class MainWindow(QMainWindow):
             self.test_manager.stop_stage()
 
     def _pressure_tick(self):
-        if not getattr(self, "_polling_enabled", False):
-            return
+        if not getattr(self, "_polling_enabled", False) or self._rig_released:
+            return      # released rig: _feed_dashboard_from_batch fills the cards
 
-        def _cached_pair(dev, p_key, v_key):
-            try:
-                d = getattr(dev, "driver", dev)
-                gp = getattr(d, "get_cached_pressure", None)
-                gv = getattr(d, "get_cached_volume", None)
-                p = float(gp(0.9)) if callable(gp) else None
-                v = float(gv(0.9)) if callable(gv) else None
-                return {k: v for k, v in [(p_key, p), (v_key, v)] if v is not None}
-            except Exception:
-                return {}
-
-        update_dataview = {}
-        update_dataview.update(_cached_pair(self.cell_pressure_controller, "Cell Pressure", "Cell Volume"))
-        update_dataview.update(_cached_pair(self.back_pressure_controller, "Back Pressure", "Back Volume"))
+        # devices may have been (re)connected since the last tick
+        self._sync_broker_sources()
+        board = self.broker.snapshot(self._PRESSURE_CARDS.values(), max_age_s=0.9)
+        update_dataview = {card: float(board[ch]) for card, ch in self._PRESSURE_CARDS.items() if ch in board}
         if update_dataview:
             self.data_view_page.set_values(update_dataview)
 
@@ -1835,6 +1995,9 @@ if __name__ == "__main__":
     def resource_path(filename: str) -> str:
         return (os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(__file__)), filename))
 
+    import multiprocessing
+    multiprocessing.freeze_support()   # station/acquisition processes in the frozen build
+
     try:
         # Force a stable AppUserModelID so Windows uses your exe’s identity & icon
         try:
@@ -1852,6 +2015,7 @@ if __name__ == "__main__":
         window = MainWindow()
         window.setWindowIcon(ico)   # some shells require setting the window icon too
         window.show()
+        app.aboutToQuit.connect(window.station_supervisor.shutdown)
         sys.exit(app.exec())
     except Exception:
         print("Exception on startup:")
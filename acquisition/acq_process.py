@@ -0,0 +1,324 @@
+# acquisition/acq_process.py
+import multiprocessing as mp
+import queue
+import threading
+import time
+
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
+
+from acquisition.reading_batch import ReadingBatch
+from acquisition.shm_ring import ShmReadingRing
+
+# Manager methods the GUI may call across the process boundary.
+REMOTE_COMMANDS = frozenset({
+    "start", "pause", "resume", "next_stage", "advance_to_next_stage", "finish", "abort",
+    "stop_stage", "stop_current_stage", "run_stage", "edit_stage", "add_stage",
+    "remove_stage", "flush_run_log",
+})
+
+# Manager attributes mirrored back to the GUI after every command/signal.
+MIRRORED_STATE = ("current_stage_index", "current_index", "test_start_ts", "stage_start_ts",
+                  "run_log_path", "stop_requested", "is_paused", "running", "rows_skipped")
+
+_SIGNALS = ("stage_changed", "test_started", "stage_started", "stage_completed", "test_finished")
+
+
+# ---------------
+# Acquisition process
+# ---------------
+def run_acquisition_process(rig_spec: dict, test_config: dict, ring_name: str, cmd_conn, events):
+    """
+    Child-process entry: opens the devices itself, runs a TriaxialTestManager
+    on its own Qt core loop, writes every reading into the shared ring and
+    reports log lines, signals and state through `events`.
+    """
+    app = QCoreApplication.instance() or QCoreApplication([])
+
+    def log(msg):
+        try:
+            events.put(("log", str(msg)))
+        except Exception:
+            pass
+
+    from acquisition.rig import close_rig, open_rig, tick_sim_rig
+    from acquisition.test_journal import load_journal
+    from test_set_up_page import StageData
+    from triaxial_test_manager import TriaxialTestManager
+
+    ring = ShmReadingRing.attach(ring_name)
+    rig = open_rig(rig_spec, log=log)
+    cfg = dict(test_config)
+    # restarted after a crash: the journal has the (possibly edited) plan and clocks
+    resume = load_journal(cfg.pop("resume_journal")) if cfg.get("resume_journal") else None
+    if resume is not None:
+        cfg["stages"] = list(resume.stages)
+    cfg["stages"] = [StageData.from_dict(d) for d in cfg.get("stages") or []]
+    cfg["interactive"] = False
+    tm = TriaxialTestManager(rig.lf, rig.cell_pc, rig.back_pc, rig.serial_pad, cfg, log=log)
+
+    # readings go straight into shared memory from the producer threads
+    push_lock = threading.Lock()
+
+    def _to_ring(batch):
+        with push_lock:
+            for r in batch:
+                ring.push(r)
+    tm.ui_batcher.deliver = _to_ring
+    tm.ui_batcher.interval_s = 0.0
+
+    def _state():
+        events.put(("state", {k: getattr(tm, k, None) for k in MIRRORED_STATE}))
+
+    def _forward(name):
+        def emit(*args):
+            _state()
+            events.put(("signal", name, args))
+        return emit
+    for name in _SIGNALS:
+        getattr(tm, name).connect(_forward(name))
+
+    def _quit():
+        events.put(("exit",))
+        app.quit()
+    tm.test_finished.connect(lambda: QTimer.singleShot(100, _quit))
+
+    def _poll_commands():
+        while cmd_conn.poll():
+            try:
+                name, args, kw = cmd_conn.recv()
+            except (EOFError, OSError):
+                tm.abort()
+                return
+            if name == "shutdown":
+                tm.abort()
+                continue
+            if name not in REMOTE_COMMANDS:
+                log(f"[!] Unknown remote command: {name}")
+                continue
+            if name == "add_stage":
+                args = (StageData.from_dict(args[0]),) + tuple(args[1:])
+            if name == "start" and resume is not None:
+                tm.resume_from_journal(resume)
+                _state()
+                continue
+            try:
+                getattr(tm, name)(*args, **kw)
+            except Exception as e:
+                log(f"[!] Remote {name} failed: {e}")
+            _state()
+
+    timer = QTimer()
+    timer.setInterval(20)
+    timer.timeout.connect(_poll_commands)
+    timer.start()
+    if rig_spec.get("sim"):
+        sim = QTimer()
+        sim.setInterval(100)
+        sim.timeout.connect(lambda: tick_sim_rig(rig, tm.stages[tm.current_stage_index]
+                                                 if 0 <= tm.current_stage_index < len(tm.stages) else None))
+        sim.start()
+    try:
+        app.exec_()
+    finally:
+        timer.stop()
+        close_rig(rig)
+        ring.close()
+
+
+# ---------------
+# GUI-side proxy
+# ---------------
+class RemoteTestManager(QObject):
+    """
+    Stand-in for TriaxialTestManager when the device layer and the manager
+    run in their own process (test_config["acquisition_process"]).
+
+    Same signals and control methods as the in-process manager; readings
+    arrive through a shared-memory ring that is drained once per UI frame
+    into readings_batch, so GUI load never delays the control loops.
+    """
+
+    stage_changed = pyqtSignal(str)
+    reading_updated = pyqtSignal(dict)
+    readings_batch = pyqtSignal(object)
+    test_finished = pyqtSignal()
+    test_started = pyqtSignal(float)
+    stage_started = pyqtSignal(float)
+    stage_completed = pyqtSignal(int)
+
+    def __init__(self, rig_spec: dict, test_config: dict, log=print,
+                 ring_capacity: int = 65536, poll_ms: int = 50):
+        super().__init__()
+        self.log = log or (lambda *a, **k: None)
+        self.rig_spec = dict(rig_spec or {})
+        self.stages = list(test_config.get("stages") or [])
+        if test_config.get("resume_journal"):
+            from acquisition.test_journal import load_journal
+            from test_set_up_page import StageData
+            self.stages = [StageData.from_dict(d) for d in load_journal(test_config["resume_journal"]).stages]
+        self.sample_id = test_config.get("sample_id", "")
+        self.sampling_period_s = float(test_config.get("sampling_period_s", 0.5))
+        self.sample_height_cm = float(test_config.get("sample_height_cm", 0.0))
+        self.sample_diameter_cm = float(test_config.get("sample_diameter_cm", 0.0))
+        self.is_docked = bool(test_config.get("is_docked", False))
+        self.test_date_str = None
+
+        # mirrored from the child (see MIRRORED_STATE)
+        self.current_stage_index = 0
+        self.current_index = 0
+        self.test_start_ts = None
+        self.stage_start_ts = None
+        self.run_log_path = None
+        self.stop_requested = False
+        self.is_paused = False
+        self.running = False
+        self.rows_skipped = 0
+
+        # in-process-only helpers the pages probe with getattr()
+        self.run_log = None
+        self.event_index = None
+        self.executor = None
+        self.view_page = None
+        self.dropped_rows = 0
+        self.last_seen = None               # monotonic time of the last row/event from the child
+        self.exited_unexpectedly = False
+
+        cfg = dict(test_config)
+        cfg["stages"] = [s.to_dict() if hasattr(s, "to_dict") else dict(s) for s in self.stages]
+
+        ctx = mp.get_context("spawn")
+        self.ring = ShmReadingRing.create(ring_capacity)
+        self._seq = 0
+        self._cmd, child_conn = ctx.Pipe()
+        self._events = ctx.Queue()
+        self.process = ctx.Process(target=run_acquisition_process, name="soilmate-acq", daemon=True,
+                                   args=(self.rig_spec, cfg, self.ring.name, child_conn, self._events))
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(poll_ms))
+        self._timer.timeout.connect(self._poll)
+        self._closed = False
+
+    # ---------------
+    # Control (same names as TriaxialTestManager)
+    # ---------------
+    def start(self):
+        self.process.start()
+        self._timer.start()
+        self._send("start")
+
+    def _send(self, name, *args, **kw):
+        if self._closed:
+            return
+        try:
+            self._cmd.send((name, args, kw))
+        except (OSError, BrokenPipeError) as e:
+            self.log(f"[!] Acquisition process unreachable: {e}")
+
+    def pause(self): self._send("pause")
+    def resume(self): self._send("resume")
+    def next_stage(self): self._send("next_stage")
+    def advance_to_next_stage(self): self._send("next_stage")
+    def finish(self): self._send("finish")
+    def abort(self): self._send("abort")
+    def stop_stage(self): self._send("stop_stage")
+    def stop_current_stage(self): self._send("stop_current_stage")
+    def run_stage(self, index): self._send("run_stage", index)
+    def flush_run_log(self): self._send("flush_run_log")
+
+    def has_next_stage(self) -> bool:
+        return self.current_stage_index + 1 < len(self.stages)
+
+    def edit_stage(self, stage_id: str, updates: dict) -> bool:
+        for s in self.stages:
+            if getattr(s, "stage_id", None) == stage_id:
+                if hasattr(s, "update_fields"):
+                    s.update_fields(updates)
+                self._send("edit_stage", stage_id, updates)
+                return True
+        return False
+
+    def add_stage(self, new_stage, index=None) -> bool:
+        if index is None or index > len(self.stages):
+            index = len(self.stages)
+        self.stages.insert(index, new_stage)
+        self._send("add_stage", new_stage.to_dict(), index)
+        return True
+
+    def remove_stage(self, stage_id: str) -> bool:
+        for i, s in enumerate(self.stages):
+            if getattr(s, "stage_id", None) == stage_id:
+                del self.stages[i]
+                self._send("remove_stage", stage_id)
+                return True
+        return False
+
+    # ---------------
+    # Event/ring pump (GUI thread, once per frame)
+    # ---------------
+    def _poll(self):
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+            except Exception:
+                break
+        if events:
+            self.last_seen = time.monotonic()
+        # rows pushed before an event are always in the ring by the time we see it
+        self._drain_ring()
+        for ev in events:
+            kind = ev[0]
+            if kind == "log":
+                self.log(ev[1])
+            elif kind == "state":
+                for k, v in ev[1].items():
+                    setattr(self, k, v)
+            elif kind == "signal":
+                try:
+                    getattr(self, ev[1]).emit(*ev[2])
+                except Exception as e:
+                    self.log(f"[!] Remote signal {ev[1]} failed: {e}")
+            elif kind == "exit":
+                self._close()
+                return
+        if not self._closed and self.process.exitcode is not None:
+            self.log(f"[!] Acquisition process exited unexpectedly (code {self.process.exitcode}).")
+            self.exited_unexpectedly = True
+            self._close()
+            self.test_finished.emit()
+
+    def _drain_ring(self):
+        if self.ring is None:
+            return
+        rows, self._seq, dropped = self.ring.read_since(self._seq)
+        if dropped:
+            self.dropped_rows += dropped
+        if len(rows):
+            self.last_seen = time.monotonic()
+            names = {i: getattr(s, "name", f"Stage {i + 1}") for i, s in enumerate(self.stages)}
+            self.readings_batch.emit(ReadingBatch(self.ring.rows_to_readings(rows, names)))
+
+    def _close(self, timeout_s: float = 3.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._timer.stop()
+        try:
+            self.process.join(timeout_s)
+            if self.process.is_alive():
+                self.process.terminate()
+        except Exception:
+            pass
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+    def shutdown(self):
+        """Abort the remote test and release the process/shared memory."""
+        self._send("shutdown")
+        deadline = time.monotonic() + 3.0
+        while self.process.is_alive() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self._close(0.5)
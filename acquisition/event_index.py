@@ -0,0 +1,134 @@
+# acquisition/event_index.py
+import bisect
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class RowSpan(NamedTuple):
+    """Half-open run-log row range [start, stop) with matching byte offsets (None = to the end)."""
+    start: int
+    stop: Optional[int]
+    start_offset: Optional[int]
+    stop_offset: Optional[int]
+
+
+class EventIndex:
+    """
+    Test events keyed by run-log position.
+
+    Every event the manager records carries `row` (index of the next run-log
+    row) and `offset` (byte offset of that row in the file). Events are kept in
+    row order, with per-name and per-(name, stage) lists, stage spans and
+    PAUSE/RESUME pairs maintained as they are added. Lookups index those
+    lists (O(1)) or bisect rows (O(log n)), and the resulting RowSpan can be
+    handed to RunLogReader.iter_rows(span=...) to read just that slice.
+    """
+
+    _STARTS = ("STAGE_START", "STAGE_RESUME")
+
+    def __init__(self, events: Iterable[dict] = ()):
+        self._rows: List[int] = []
+        self._events: List[dict] = []
+        self._reset_indexes()
+        for ev in events:
+            self.add(ev)
+
+    def _reset_indexes(self):
+        self._by_name: Dict[str, List[dict]] = {}
+        self._by_stage: Dict[Tuple[str, int], List[dict]] = {}
+        self._stage_bounds: Dict[int, list] = {}     # stage -> [first start, stop event or None]
+        self._open_stage: Optional[int] = None       # stage still running: its END or the next other-stage start closes it
+        self._pauses: List[list] = []                # [PAUSE, RESUME or None], any stage
+        self._stage_pauses: Dict[int, List[list]] = {}
+
+    def add(self, ev: dict):
+        row = ev.get("row")
+        if row is None:
+            return
+        pos = bisect.bisect_right(self._rows, int(row))
+        self._rows.insert(pos, int(row))
+        self._events.insert(pos, ev)
+        if pos < len(self._events) - 1:
+            # out-of-order insert (rare): rebuild the indexes in row order
+            self._reset_indexes()
+            for e in self._events:
+                self._index(e)
+        else:
+            self._index(ev)
+
+    def _index(self, ev: dict):
+        name = ev.get("event")
+        si = ev.get("stage_index")
+        si = int(si) if si is not None else None
+        self._by_name.setdefault(name, []).append(ev)
+        if si is not None:
+            self._by_stage.setdefault((name, si), []).append(ev)
+
+        if name in self._STARTS and si is not None:
+            cur = self._open_stage
+            if cur is not None and cur != si:
+                self._stage_bounds[cur][1] = ev      # the next stage's start ends it
+                self._open_stage = None
+            if si not in self._stage_bounds:
+                self._stage_bounds[si] = [ev, None]
+                self._open_stage = si
+        elif name == "STAGE_END" and si is not None and si == self._open_stage:
+            self._stage_bounds[si][1] = ev
+            self._open_stage = None                  # closed: a later start must not move its stop
+
+        if name in ("PAUSE", "RESUME"):
+            self._pair(self._pauses, name, ev)
+            if si is not None:
+                self._pair(self._stage_pauses.setdefault(si, []), name, ev)
+
+    @staticmethod
+    def _pair(spans: List[list], name: str, ev: dict):
+        is_open = bool(spans) and spans[-1][1] is None
+        if name == "PAUSE" and not is_open:
+            spans.append([ev, None])
+        elif name == "RESUME" and is_open:
+            spans[-1][1] = ev
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def events(self) -> List[dict]:
+        return list(self._events)
+
+    # ---------------
+    # Lookups
+    # ---------------
+    def event_at_row(self, row: int) -> Optional[dict]:
+        """Last event recorded at or before run-log row `row`."""
+        i = bisect.bisect_right(self._rows, int(row)) - 1
+        return self._events[i] if i >= 0 else None
+
+    def find(self, event: str, nth: int = -1, stage_index: Optional[int] = None) -> Optional[dict]:
+        hits = (self._by_name.get(event) if stage_index is None
+                else self._by_stage.get((event, int(stage_index))))
+        try:
+            return hits[nth] if hits else None
+        except IndexError:
+            return None
+
+    def stage_span(self, stage_index: int) -> Optional[RowSpan]:
+        """Rows recorded while stage `stage_index` ran (across crash-resumes)."""
+        b = self._stage_bounds.get(int(stage_index))
+        return None if b is None else self._span(b[0], b[1])
+
+    def pause_spans(self, stage_index: Optional[int] = None) -> List[RowSpan]:
+        """Rows between each PAUSE and the RESUME that ended it."""
+        spans = self._pauses if stage_index is None else self._stage_pauses.get(int(stage_index), ())
+        return [self._span(p, r) for p, r in spans]
+
+    def since(self, event: str, nth: int = -1) -> Optional[RowSpan]:
+        """Rows from the nth occurrence of `event` (default: latest) to the end."""
+        ev = self.find(event, nth)
+        return None if ev is None else self._span(ev, None)
+
+    @staticmethod
+    def _span(start: dict, stop: Optional[dict]) -> RowSpan:
+        return RowSpan(int(start["row"]),
+                       None if stop is None else int(stop["row"]),
+                       start.get("offset"),
+                       None if stop is None else stop.get("offset"))
@@ -0,0 +1,97 @@
+# acquisition/latency_trace.py
+import threading
+from typing import Dict, Optional
+
+from acquisition.loop_timing import Histogram
+
+# Pipeline stages a sample is stamped at (monotonic seconds), in order:
+#   acquire  bytes read from the device (FTDI read / SerialPad scan)
+#   parse    value decoded and cached by the driver
+#   publish  value put on the SampleBroker board
+#   record   manager tick fused it into a Reading
+#   deliver  batch arrived on the GUI thread
+#   enrich   derived quantities computed (stresses, strains, custom calcs)
+#   render   curve data handed to the graph
+TRACE_STAGES = ("acquire", "parse", "publish", "record", "deliver", "enrich", "render")
+
+# Device -> board channel whose trace stands for it in a Reading.
+TRACE_CHANNELS = {
+    "cell_pc": "cell_pressure_kpa",
+    "back_pc": "back_pressure_kpa",
+    "lf": "position_mm",
+    "serial_pad": "axial_load_kN",
+}
+
+
+class _Segment:
+    __slots__ = ("count", "total", "max", "hist")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.hist = Histogram()
+
+    def add(self, s: float):
+        self.count += 1
+        self.total += s
+        self.max = max(self.max, s)
+        self.hist.add(s * 1000.0)
+
+    def snapshot(self) -> dict:
+        n = self.count
+        return {"count": n, "mean_ms": (self.total / n * 1000.0) if n else None,
+                "p95_ms": self.hist.percentile(0.95), "max_ms": self.max * 1000.0 if n else None}
+
+
+class LatencyTracer:
+    """
+    Aggregates per-sample trace stamps into latency breakdowns.
+
+    add(group, stamps) takes one sample's {stage: monotonic ts} and adds the
+    time spent between each pair of consecutive stages present (e.g.
+    "parse→publish") plus the end-to-end "total". Groups are free-form;
+    the Test View uses "device:<name>" and "graph:<title>".
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Dict[str, _Segment]] = {}
+
+    def add(self, group: str, stamps: Dict[str, Optional[float]]):
+        seq = [(k, stamps[k]) for k in TRACE_STAGES if stamps.get(k) is not None]
+        if len(seq) < 2:
+            return
+        with self._lock:
+            segs = self._groups.get(group)
+            if segs is None:
+                segs = self._groups[group] = {}
+            for (a, ta), (b, tb) in zip(seq, seq[1:]):
+                name = f"{a}→{b}"
+                seg = segs.get(name)
+                if seg is None:
+                    seg = segs[name] = _Segment()
+                seg.add(max(0.0, tb - ta))
+            seg = segs.get("total")
+            if seg is None:
+                seg = segs["total"] = _Segment()
+            seg.add(max(0.0, seq[-1][1] - seq[0][1]))
+
+    def snapshot(self) -> Dict[str, Dict[str, dict]]:
+        with self._lock:
+            return {g: {name: seg.snapshot() for name, seg in segs.items()}
+                    for g, segs in self._groups.items()}
+
+    def reset(self):
+        with self._lock:
+            self._groups.clear()
+
+
+def reading_trace(broker, record_ts: float) -> dict:
+    """Trace attached to a manager Reading: its record time and each device's board stamps."""
+    devices = {}
+    for dev, ch in TRACE_CHANNELS.items():
+        t = broker.trace(ch)
+        if t is not None:
+            devices[dev] = t
+    return {"record": record_ts, "devices": devices}
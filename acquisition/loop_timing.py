@@ -0,0 +1,169 @@
+# acquisition/loop_timing.py
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Histogram bucket upper bounds (ms); the last bucket catches everything above.
+BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf"))
+
+
+class Histogram:
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS_MS)
+
+    def add(self, ms: float):
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the q-quantile."""
+        n = sum(self.counts)
+        if n == 0:
+            return None
+        need = q * n
+        seen = 0
+        for bound, c in zip(BUCKETS_MS, self.counts):
+            seen += c
+            if seen >= need:
+                return bound
+        return BUCKETS_MS[-1]
+
+
+class LoopStats:
+    """
+    Timing of one periodic loop: actual period (start to start), work time
+    (start until the loop goes back to sleep), deviation from the intended
+    period and overruns, with histograms of jitter and work time.
+
+    Drive it either with begin()/idle() from inside the loop or with
+    record() when the caller measures itself.
+    """
+
+    def __init__(self, name: str, target_period_s: Optional[float] = None, overrun_tol: float = 0.5):
+        self.name = name
+        self.target_period_s = target_period_s
+        self.overrun_tol = float(overrun_tol)    # overrun = period > target * (1 + tol)
+        self._lock = threading.Lock()
+        self._t_begin = None
+        self._t_idle = None
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.overruns = 0
+            self._sum_period = 0.0
+            self._sum_work = 0.0
+            self.min_period_s = None
+            self.max_period_s = 0.0
+            self.last_period_s = None
+            self.max_work_s = 0.0
+            self.last_work_s = None
+            self.max_late_s = 0.0
+            self.jitter_hist = Histogram()
+            self.work_hist = Histogram()
+        self._t_begin = self._t_idle = None
+
+    # ---------------
+    # In-loop hooks
+    # ---------------
+    def begin(self, now: Optional[float] = None):
+        """Top of an iteration: closes the previous one."""
+        now = time.monotonic() if now is None else now
+        t0 = self._t_begin
+        if t0 is not None:
+            work = (self._t_idle if self._t_idle is not None else now) - t0
+            self.record(now - t0, work)
+        self._t_begin, self._t_idle = now, None
+
+    def idle(self, now: Optional[float] = None):
+        """The loop is about to sleep/wait (first call per iteration counts)."""
+        if self._t_begin is not None and self._t_idle is None:
+            self._t_idle = time.monotonic() if now is None else now
+
+    def discard(self):
+        """Drop the running iteration (e.g. it spanned a pause)."""
+        self._t_begin = self._t_idle = None
+
+    # ---------------
+    # Recording
+    # ---------------
+    def record(self, period_s: float, work_s: float, late_s: Optional[float] = None):
+        target = self.target_period_s
+        with self._lock:
+            self.count += 1
+            self._sum_period += period_s
+            self._sum_work += work_s
+            self.last_period_s = period_s
+            self.last_work_s = work_s
+            self.min_period_s = period_s if self.min_period_s is None else min(self.min_period_s, period_s)
+            self.max_period_s = max(self.max_period_s, period_s)
+            self.max_work_s = max(self.max_work_s, work_s)
+            if late_s is not None:
+                self.max_late_s = max(self.max_late_s, late_s)
+            if target:
+                self.jitter_hist.add(abs(period_s - target) * 1000.0)
+                if period_s > target * (1.0 + self.overrun_tol):
+                    self.overruns += 1
+            self.work_hist.add(work_s * 1000.0)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            n = self.count
+            return {
+                "target_period_s": self.target_period_s,
+                "count": n,
+                "mean_period_s": (self._sum_period / n) if n else None,
+                "min_period_s": self.min_period_s,
+                "max_period_s": self.max_period_s if n else None,
+                "mean_work_s": (self._sum_work / n) if n else None,
+                "max_work_s": self.max_work_s if n else None,
+                "max_late_s": self.max_late_s,
+                "overruns": self.overruns,
+                "jitter_p50_ms": self.jitter_hist.percentile(0.50),
+                "jitter_p95_ms": self.jitter_hist.percentile(0.95),
+                "jitter_p99_ms": self.jitter_hist.percentile(0.99),
+                "work_p95_ms": self.work_hist.percentile(0.95),
+                "jitter_hist": list(self.jitter_hist.counts),
+                "work_hist": list(self.work_hist.counts),
+            }
+
+
+class LoopTimingRegistry:
+    """Named LoopStats shared by the scheduler, the manager and the stages."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loops: Dict[str, LoopStats] = {}
+
+    def loop(self, name: str, target_period_s: Optional[float] = None) -> LoopStats:
+        """Get (or create) a loop; a new target period replaces the old one."""
+        with self._lock:
+            st = self._loops.get(name)
+            if st is None:
+                st = self._loops[name] = LoopStats(name, target_period_s)
+            elif target_period_s is not None:
+                st.target_period_s = target_period_s
+            return st
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._loops)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, dict]:
+        with self._lock:
+            loops = [(k, v) for k, v in self._loops.items() if k.startswith(prefix)]
+        return {k: v.snapshot() for k, v in loops}
+
+    def reset(self, prefix: str = ""):
+        with self._lock:
+            loops = [v for k, v in self._loops.items() if k.startswith(prefix)]
+        for v in loops:
+            v.reset()
+
+    def remove(self, prefix: str):
+        with self._lock:
+            for k in [k for k in self._loops if k.startswith(prefix)]:
+                del self._loops[k]
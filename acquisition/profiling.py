@@ -0,0 +1,239 @@
+# acquisition/profiling.py
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+
+class RuntimeProfiler:
+    """
+    On-demand profiling of a live process, driven from the developer panel.
+
+    - cProfile on chosen threads. cProfile can only be switched on from the
+      thread it profiles, so the GUI thread is handled directly and worker
+      threads switch themselves on/off at their next profile_point() (stage
+      control loops, scheduler tasks, device reader loops).
+    - Statistical sampling of chosen threads from a background thread
+      (sys._current_frames), which needs no cooperation from the target.
+    - tracemalloc snapshots and diffs against the last snapshot.
+
+    Reports are plain text files written to `report_dir` (next to the run log).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wanted: Dict[int, str] = {}               # ident -> thread name (cProfile requested)
+        self._active: Dict[int, cProfile.Profile] = {}
+        self._done: Dict[int, cProfile.Profile] = {}
+        self._names: Dict[int, str] = {}
+        self._sampler: Optional[threading.Thread] = None
+        self._sample_run = False
+        self._samples: Dict[int, Counter] = {}
+        self._sample_count = 0
+        self._sample_started = 0.0
+        self._mem_baseline = None
+        self.report_dir = "."
+        self.report_prefix = "profile"
+
+    # ---------------
+    # Threads
+    # ---------------
+    @staticmethod
+    def threads() -> List[threading.Thread]:
+        return [t for t in threading.enumerate() if t.ident is not None]
+
+    def _resolve(self, idents: Iterable[int]) -> Dict[int, str]:
+        live = {t.ident: t.name for t in self.threads()}
+        return {i: live[i] for i in idents if i in live}
+
+    # ---------------
+    # cProfile
+    # ---------------
+    def cprofile_running(self) -> bool:
+        return bool(self._wanted or self._active)
+
+    def start_cprofile(self, idents: Iterable[int]) -> List[str]:
+        """Request cProfile on the given threads; returns the thread names."""
+        targets = self._resolve(idents)
+        with self._lock:
+            self._wanted = dict(targets)
+            self._names.update(targets)
+            self._done.clear()
+        self.profile_point()                            # the calling (GUI) thread starts right away
+        return list(targets.values())
+
+    def profile_point(self):
+        """Called from worker loops: starts/stops this thread's cProfile as requested."""
+        if not self._wanted and not self._active:
+            return
+        ident = threading.get_ident()
+        with self._lock:
+            wanted = ident in self._wanted
+            prof = self._active.get(ident)
+            if wanted and prof is None:
+                prof = cProfile.Profile()
+                try:
+                    prof.enable()
+                except ValueError:                      # another profiler owns this thread
+                    self._wanted.pop(ident, None)
+                    return
+                self._active[ident] = prof
+            elif not wanted and prof is not None:
+                prof.disable()
+                self._done[ident] = self._active.pop(ident)
+
+    def stop_cprofile(self, wait_s: float = 1.0) -> List[str]:
+        """Stop all cProfile sessions and write one report per thread; returns the file paths."""
+        with self._lock:
+            self._wanted = {}
+        self.profile_point()
+        deadline = time.monotonic() + wait_s
+        while self._active and time.monotonic() < deadline:
+            time.sleep(0.02)                            # give worker threads a loop turn
+        with self._lock:
+            done, self._done = self._done, {}
+            stuck = [self._names.get(i, str(i)) for i in self._active]
+        paths = []
+        for ident, prof in done.items():
+            name = self._names.get(ident, str(ident))
+            out = io.StringIO()
+            st = pstats.Stats(prof, stream=out)
+            st.sort_stats("cumulative").print_stats(60)
+            st.sort_stats("tottime").print_stats(30)
+            paths.append(self._write(f"cprofile-{name}", out.getvalue()))
+            try:
+                prof.dump_stats(os.path.splitext(paths[-1])[0] + ".prof")
+            except Exception:
+                pass
+        if stuck:
+            paths.append(self._write("cprofile-pending",
+                                     "No profile point reached yet on: " + ", ".join(stuck) + "\n"
+                                     "Their reports are written on the next stop.\n"))
+        return paths
+
+    # ---------------
+    # Sampling
+    # ---------------
+    def sampling_running(self) -> bool:
+        return self._sampler is not None
+
+    def start_sampling(self, idents: Iterable[int], interval_s: float = 0.005) -> List[str]:
+        if self._sampler is not None:
+            return []
+        targets = self._resolve(idents)
+        self._names.update(targets)
+        self._samples = {i: Counter() for i in targets}
+        self._sample_count = 0
+        self._sample_started = time.monotonic()
+        self._sample_run = True
+        self._sampler = threading.Thread(target=self._sample_loop, args=(set(targets), float(interval_s)),
+                                         name="profiler-sampler", daemon=True)
+        self._sampler.start()
+        return list(targets.values())
+
+    def _sample_loop(self, idents, interval_s):
+        while self._sample_run:
+            frames = sys._current_frames()
+            for ident in idents:
+                f = frames.get(ident)
+                if f is None:
+                    continue
+                stack = []
+                while f is not None:
+                    co = f.f_code
+                    stack.append(f"{co.co_name} ({os.path.basename(co.co_filename)}:{f.f_lineno})")
+                    f = f.f_back
+                self._samples[ident][";".join(reversed(stack))] += 1
+            self._sample_count += 1
+            del frames
+            time.sleep(interval_s)
+
+    def stop_sampling(self) -> List[str]:
+        """Stop the sampler and write per-thread reports (top functions + folded stacks)."""
+        t = self._sampler
+        if t is None:
+            return []
+        self._sample_run = False
+        t.join(timeout=2.0)
+        self._sampler = None
+        secs = time.monotonic() - self._sample_started
+        paths = []
+        for ident, stacks in self._samples.items():
+            name = self._names.get(ident, str(ident))
+            total = sum(stacks.values())
+            own, incl = Counter(), Counter()
+            for stack, n in stacks.items():
+                frames = stack.split(";")
+                own[_func(frames[-1])] += n
+                for fn in set(map(_func, frames)):
+                    incl[fn] += n
+            lines = [f"Thread {name}: {total} samples over {secs:.1f} s ({self._sample_count} ticks)", ""]
+            for title, counts in (("Own time (leaf frame)", own), ("Inclusive (on the stack)", incl)):
+                lines.append(title)
+                for fn, n in counts.most_common(40):
+                    lines.append(f"  {100.0 * n / max(1, total):6.1f}%  {n:7d}  {fn}")
+                lines.append("")
+            paths.append(self._write(f"sampling-{name}", "\n".join(lines)))
+            # folded stacks (flamegraph.pl / speedscope input)
+            folded = "\n".join(f"{s} {n}" for s, n in stacks.most_common()) + "\n"
+            paths.append(self._write(f"sampling-{name}", folded, ext=".folded"))
+        self._samples = {}
+        return paths
+
+    # ---------------
+    # Memory
+    # ---------------
+    def memory_snapshot(self) -> str:
+        """Start tracemalloc if needed and remember a baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+        self._mem_baseline = tracemalloc.take_snapshot()
+        cur, peak = tracemalloc.get_traced_memory()
+        return f"Snapshot taken ({cur / 1e6:.1f} MB traced, peak {peak / 1e6:.1f} MB)."
+
+    def memory_diff(self, top: int = 40) -> Optional[str]:
+        """Write the allocation growth since the last snapshot; the new snapshot becomes the baseline."""
+        if self._mem_baseline is None or not tracemalloc.is_tracing():
+            return None
+        snap = tracemalloc.take_snapshot()
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = snap.filter_traces(filters).compare_to(self._mem_baseline.filter_traces(filters), "lineno")
+        cur, peak = tracemalloc.get_traced_memory()
+        lines = [f"Traced: {cur / 1e6:.2f} MB (peak {peak / 1e6:.2f} MB)",
+                 f"Growth since snapshot: {sum(s.size_diff for s in stats) / 1e6:+.3f} MB", ""]
+        lines += [str(s) for s in stats[:top]]
+        self._mem_baseline = snap
+        return self._write("tracemalloc", "\n".join(lines) + "\n")
+
+    def memory_stop(self):
+        self._mem_baseline = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # ---------------
+    # Reports
+    # ---------------
+    def _write(self, kind: str, text: str, ext: str = ".txt") -> str:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in kind)
+        os.makedirs(self.report_dir or ".", exist_ok=True)
+        path = os.path.join(self.report_dir or ".",
+                            f"{self.report_prefix}.{safe}-{time.strftime('%H%M%S')}{ext}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+
+def _func(frame: str) -> str:
+    """'name (file.py:123)' -> 'name (file.py)' so lines of one function add up."""
+    return frame.rsplit(":", 1)[0] + ")" if frame.endswith(")") else frame
+
+
+# One profiler per process; worker loops call profile_point() once per iteration.
+PROFILER = RuntimeProfiler()
+profile_point = PROFILER.profile_point
@@ -0,0 +1,144 @@
+# acquisition/reading.py
+import time
+from typing import Iterator, Optional, Tuple
+
+# Registered schema for manager readings (one slot per field).
+READING_FIELDS = (
+    "timestamp",
+    "test_elapsed_s",
+    "stage_elapsed_s",
+    "stage_index",
+    "stage_name",
+    "cell_pressure_kpa",
+    "back_pressure_kpa",
+    "cell_volume_mm3",
+    "back_volume_mm3",
+    "position_mm",
+    "axial_load_kN",
+    "pore_pressure_kpa",
+    "axial_displacement_mm",
+    "transducers",
+)
+
+# Other names consumers use for the same channel (resolved by get()/[]).
+CHANNEL_ALIASES = {
+    "time_s": "stage_elapsed_s",
+    "axial_force_kN": "axial_load_kN",
+    "force_kN": "axial_load_kN",
+    "load_kN": "axial_load_kN",
+}
+
+_FIELD_SET = frozenset(READING_FIELDS)
+
+_date_cache = [0.0, -1.0, ""]     # [local day start, day end, "YYYY-MM-DD"]
+
+
+def _date_for(ts: float) -> str:
+    """Local date string, formatted once per day instead of once per row."""
+    c = _date_cache
+    if not (c[0] <= ts < c[1]):
+        lt = time.localtime(ts)
+        day = (lt.tm_year, lt.tm_mon, lt.tm_mday)
+        c[0] = time.mktime(day + (0, 0, 0, 0, 0, -1))
+        c[1] = time.mktime((day[0], day[1], day[2] + 1, 0, 0, 0, 0, 0, -1))   # DST-safe
+        c[2] = time.strftime("%Y-%m-%d", lt)
+    return c[2]
+
+
+class Reading:
+    """
+    One manager reading as a fixed-slot record.
+
+    Producers assign fields directly (no per-row string formatting or
+    rounding); `date` and `transducer_i` are derived on access. The mapping
+    methods (get, [], keys, items, in) let the run log, the columnar store,
+    sampling policies and the batcher consume it like the old dict;
+    to_dict() makes a plain dict for code that adds its own keys (the GUI).
+    """
+
+    # `trace` (latency stamps, see latency_trace.py) rides along but is not a field
+    __slots__ = READING_FIELDS + ("trace",)
+
+    def __init__(self, **values):
+        for k in READING_FIELDS:
+            object.__setattr__(self, k, None)
+        self.trace = None
+        for k, v in values.items():
+            self[k] = v
+
+    # ---------------
+    # Mapping protocol
+    # ---------------
+    def get(self, key: str, default=None):
+        key = CHANNEL_ALIASES.get(key, key)
+        if key in _FIELD_SET:
+            v = getattr(self, key)
+        elif key == "date":
+            v = self.date
+        elif key.startswith("transducer_"):
+            v = self._transducer(key)
+        else:
+            return default
+        return default if v is None else v
+
+    def __getitem__(self, key: str):
+        v = self.get(key, _MISSING)
+        if v is _MISSING:
+            raise KeyError(key)
+        return v
+
+    def __setitem__(self, key: str, value):
+        key = CHANNEL_ALIASES.get(key, key)
+        if key not in _FIELD_SET:
+            raise KeyError(f"{key!r} is not a reading field")
+        setattr(self, key, value)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+    def keys(self) -> Iterator[str]:
+        return (k for k, _ in self.items())
+
+    def items(self) -> Iterator[Tuple[str, object]]:
+        for k in READING_FIELDS:
+            v = getattr(self, k)
+            if v is not None:
+                yield k, v
+                if k == "stage_elapsed_s":
+                    yield "time_s", v
+
+    def __iter__(self):
+        return self.keys()
+
+    # ---------------
+    # Derived fields
+    # ---------------
+    @property
+    def date(self) -> Optional[str]:
+        ts = self.timestamp
+        return None if ts is None else _date_for(ts)
+
+    @property
+    def time_s(self):
+        return self.stage_elapsed_s
+
+    def _transducer(self, key: str):
+        try:
+            return (self.transducers or ())[int(key[11:])]
+        except (IndexError, ValueError, TypeError):
+            return None
+
+    def to_dict(self) -> dict:
+        """Plain dict in the old reading layout (date/time_s included)."""
+        d = {k: getattr(self, k) for k in READING_FIELDS}
+        d["time_s"] = self.stage_elapsed_s
+        d["date"] = self.date
+        if d["transducers"] is None:
+            d["transducers"] = []
+        return d
+
+    def __repr__(self):
+        return f"Reading({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+
+_MISSING = object()
@@ -0,0 +1,101 @@
+# acquisition/reading_batch.py
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from acquisition.reading import Reading
+
+
+class ReadingBatch:
+    """
+    A block of readings delivered to the UI in one go.
+
+    Rows (dicts or Reading records) are kept in arrival order; column(key)
+    gives a float64 array (None/non-numeric → NaN) so plotting code can
+    append a batch at once.
+    """
+
+    __slots__ = ("rows", "_cols")
+
+    def __init__(self, rows: List[dict]):
+        self.rows = rows
+        self._cols: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.rows)
+
+    def keys(self) -> List[str]:
+        seen = {}
+        for r in self.rows:
+            for k in r.keys():
+                seen.setdefault(k, None)
+        return list(seen)
+
+    def column(self, key: str) -> np.ndarray:
+        col = self._cols.get(key)
+        if col is None:
+            col = np.full(len(self.rows), np.nan)
+            for i, r in enumerate(self.rows):
+                v = r.get(key)
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    col[i] = v
+            self._cols[key] = col
+        return col
+
+    @property
+    def last(self) -> Optional[dict]:
+        return self.rows[-1] if self.rows else None
+
+
+class ReadingBatcher:
+    """
+    Coalesces readings from producer threads into one delivery per UI frame.
+
+    push() only appends to a list; the accumulated rows are handed to
+    `deliver` (typically a queued Qt signal's emit) as a ReadingBatch once
+    `interval_s` has passed since the last delivery. Call flush() at stage
+    or test boundaries so the tail is not held back until the next push.
+    """
+
+    def __init__(self, deliver: Callable[[ReadingBatch], None], interval_s: float = 0.075,
+                 max_rows: int = 1000):
+        self.deliver = deliver
+        self.interval_s = max(0.0, float(interval_s))
+        self.max_rows = max(1, int(max_rows))
+        self._lock = threading.Lock()
+        self._rows: List[dict] = []
+        self._last_delivery = 0.0
+
+    def push(self, reading: dict):
+        if not isinstance(reading, (dict, Reading)):
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._rows.append(reading)
+            if (now - self._last_delivery) < self.interval_s and len(self._rows) < self.max_rows:
+                return
+            rows, self._rows = self._rows, []
+            self._last_delivery = now
+        self._deliver(rows)
+
+    def flush(self):
+        with self._lock:
+            rows, self._rows = self._rows, []
+            self._last_delivery = time.monotonic()
+        if rows:
+            self._deliver(rows)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def _deliver(self, rows: List[dict]):
+        try:
+            self.deliver(ReadingBatch(rows))
+        except Exception:
+            pass
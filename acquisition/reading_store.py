@@ -0,0 +1,235 @@
+# acquisition/reading_store.py
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from acquisition.reading import Reading
+
+# Fixed schema for raw manager readings (one float64 column per channel).
+# SerialPad channels are flattened into transducer_0..7 instead of a nested list.
+DEFAULT_CHANNELS = (
+    "timestamp",
+    "test_elapsed_s",
+    "stage_elapsed_s",
+    "time_s",
+    "cell_pressure_kpa",
+    "back_pressure_kpa",
+    "cell_volume_mm3",
+    "back_volume_mm3",
+    "position_mm",
+    "axial_load_kN",
+    "pore_pressure_kpa",
+    "axial_displacement_mm",
+) + tuple(f"transducer_{i}" for i in range(8))
+
+_NAN = float("nan")
+
+
+class ReadingStore:
+    """
+    Columnar, append-only store for live readings.
+
+    - One preallocated float64 array per channel, grown in chunks
+      (missing/None values are stored as NaN).
+    - Stage names are interned: rows keep an int stage index, the names live
+      once in `stage_names`.
+    - column(key) returns a zero-copy view of the filled part of a column.
+      Rows in a view are never rewritten: dropping, growing and clear() move
+      to fresh arrays, so a held view stays a valid snapshot (it just does
+      not see later rows).
+
+    allow_new_columns=True lets unknown numeric keys (derived/custom calcs)
+    create a column on first sight; earlier rows read back as NaN.
+
+    max_rows bounds memory: once full, the oldest chunk (at most a quarter of
+    the window) is dropped and `first_row` (the absolute index of row 0)
+    moves forward. The complete run
+    lives in the on-disk run log (acquisition/run_log.py).
+    """
+
+    def __init__(self, channels: Iterable[str] = DEFAULT_CHANNELS, chunk_rows: int = 4096,
+                 allow_new_columns: bool = False, max_rows: Optional[int] = None):
+        self.max_rows = max(16, int(max_rows)) if max_rows else None
+        chunk_rows = max(16, int(chunk_rows))
+        self.chunk_rows = min(chunk_rows, self.max_rows) if self.max_rows else chunk_rows
+        # rows dropped per overflow: a chunk, but never more than a quarter of the window
+        self.drop_rows = min(self.chunk_rows, max(1, self.max_rows // 4)) if self.max_rows else 0
+        self.allow_new_columns = bool(allow_new_columns)
+        self._lock = threading.Lock()
+        self._n = 0
+        self.first_row = 0      # rows dropped off the front (rolling window)
+        self._cap = self.chunk_rows
+        self._cols: Dict[str, np.ndarray] = {}
+        for k in channels:
+            self._cols[k] = np.full(self._cap, np.nan, dtype=np.float64)
+        self._stage_idx = np.full(self._cap, -1, dtype=np.int32)
+        self.stage_names: Dict[int, str] = {}
+
+    # ---------------
+    # Size / schema
+    # ---------------
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def total_rows(self) -> int:
+        """Rows ever appended (held + dropped)."""
+        return self.first_row + self._n
+
+    def keys(self) -> List[str]:
+        return list(self._cols.keys()) + ["stage_index"]
+
+    def has_column(self, key: str) -> bool:
+        return key in self._cols or key == "stage_index"
+
+    def add_column(self, key: str):
+        with self._lock:
+            self._add_column_locked(key)
+
+    def _add_column_locked(self, key: str):
+        if key not in self._cols:
+            self._cols[key] = np.full(self._cap, np.nan, dtype=np.float64)
+
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self._cols.values()) + self._stage_idx.nbytes
+
+    # ---------------
+    # Writing
+    # ---------------
+    def _grow_locked(self):
+        if self.max_rows and self._cap >= self.max_rows:
+            self._drop_front_locked(self.drop_rows)
+            return
+        # chunk-sized steps, but at least +50% so long runs don't re-copy too often
+        new_cap = self._cap + max(self.chunk_rows, self._cap // 2)
+        if self.max_rows:
+            new_cap = min(new_cap, self.max_rows)
+        for k, a in self._cols.items():
+            b = np.full(new_cap, np.nan, dtype=np.float64)
+            b[:self._n] = a[:self._n]
+            self._cols[k] = b
+        s = np.full(new_cap, -1, dtype=np.int32)
+        s[:self._n] = self._stage_idx[:self._n]
+        self._stage_idx = s
+        self._cap = new_cap
+
+    def _drop_front_locked(self, count: int):
+        # copy into fresh arrays (not an in-place shift) so views handed out stay intact
+        count = min(int(count), self._n)
+        keep = self._n - count
+        for k, a in self._cols.items():
+            b = np.full(self._cap, np.nan, dtype=np.float64)
+            b[:keep] = a[count:self._n]
+            self._cols[k] = b
+        s = np.full(self._cap, -1, dtype=np.int32)
+        s[:keep] = self._stage_idx[count:self._n]
+        self._stage_idx = s
+        self._n = keep
+        self.first_row += count
+
+    def append(self, reading: dict) -> int:
+        """Append one reading (dict or Reading record); returns its row index."""
+        if not isinstance(reading, (dict, Reading)):
+            return -1
+        with self._lock:
+            if self._n >= self._cap:
+                self._grow_locked()
+            i = self._n
+            for k, v in reading.items():
+                if k in ("stage_index", "stage_name"):
+                    continue
+                if k == "transducers":
+                    for ch, tv in enumerate(v or ()):
+                        col = self._cols.get(f"transducer_{ch}")
+                        if col is not None:
+                            col[i] = _to_float(tv)
+                    continue
+                col = self._cols.get(k)
+                if col is None:
+                    if not self.allow_new_columns or not _is_number(v):
+                        continue
+                    self._add_column_locked(k)
+                    col = self._cols[k]
+                col[i] = _to_float(v)
+
+            si = reading.get("stage_index")
+            if si is not None:
+                try:
+                    si = int(si)
+                    self._stage_idx[i] = si
+                    name = reading.get("stage_name")
+                    if name is not None and si not in self.stage_names:
+                        self.stage_names[si] = str(name)
+                except Exception:
+                    pass
+            self._n = i + 1
+            return i
+
+    def clear(self):
+        with self._lock:
+            self._n = 0
+            self.first_row = 0
+            for k in self._cols:
+                self._cols[k] = np.full(self._cap, np.nan, dtype=np.float64)
+            self._stage_idx = np.full(self._cap, -1, dtype=np.int32)
+            self.stage_names.clear()
+
+    # ---------------
+    # Reading
+    # ---------------
+    def column(self, key: str, start: int = 0, stop: Optional[int] = None) -> Optional[np.ndarray]:
+        """Zero-copy view of one column (rows start..stop). None if unknown."""
+        with self._lock:
+            n = self._n
+            stop = n if stop is None else min(int(stop), n)
+            if key == "stage_index":
+                return self._stage_idx[start:stop]
+            a = self._cols.get(key)
+            return None if a is None else a[start:stop]
+
+    def stage_rows(self, stage_index: int) -> np.ndarray:
+        """Row indices belonging to one stage."""
+        with self._lock:
+            return np.flatnonzero(self._stage_idx[:self._n] == int(stage_index))
+
+    def row(self, i: int) -> dict:
+        """Materialize one row as a legacy reading dict (NaN → None)."""
+        with self._lock:
+            vals = [(k, float(a[i])) for k, a in self._cols.items()]
+            si = int(self._stage_idx[i])
+        out = {}
+        for k, v in vals:
+            out[k] = None if v != v else v
+        if si >= 0:
+            out["stage_index"] = si
+            out["stage_name"] = self.stage_names.get(si, f"Stage {si + 1}")
+        ts = out.get("timestamp")
+        if ts is not None:
+            out["date"] = time.strftime("%Y-%m-%d", time.localtime(ts))
+        return out
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[dict]:
+        """Iterate rows as dicts (for CSV export / legacy consumers)."""
+        n = self._n
+        stop = n if stop is None else min(int(stop), n)
+        for i in range(max(0, int(start)), stop):
+            yield self.row(i)
+
+    def last(self) -> Optional[dict]:
+        n = self._n
+        return self.row(n - 1) if n else None
+
+
+def _is_number(v) -> bool:
+    return isinstance(v, (int, float, np.floating, np.integer)) and not isinstance(v, bool)
+
+
+def _to_float(v) -> float:
+    if v is None:
+        return _NAN
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return _NAN
@@ -0,0 +1,143 @@
+# acquisition/rig.py
+import json
+from typing import NamedTuple, Optional
+
+
+class Rig(NamedTuple):
+    """Connected devices of one test station (None = not present)."""
+    lf: object
+    cell_pc: object
+    back_pc: object
+    serial_pad: object
+    calibration: object
+
+
+def load_test_plan(path: str) -> dict:
+    """
+    Test config from a plan JSON (the keys the Test Setup page builds, with
+    "stages" as StageData dicts; a bare list of stage dicts also works).
+    Per-stage "run_for_s" budgets are returned as config["stage_run_for_s"].
+    """
+    from test_set_up_page import StageData
+    with open(path, "r", encoding="utf-8") as f:
+        plan = json.load(f)
+    if isinstance(plan, list):
+        plan = {"stages": plan}
+    plan = dict(plan)
+    dicts = [dict(d) for d in plan.get("stages") or []]
+    plan["stage_run_for_s"] = [d.pop("run_for_s", None) for d in dicts]
+    plan["stages"] = [StageData.from_dict(d) for d in dicts]
+    return plan
+
+
+def rig_spec_from_devices(lf=None, cell_pc=None, back_pc=None, serial_pad=None) -> dict:
+    """
+    Serials/ports of the devices that are connected right now, so the same
+    station can be reopened somewhere else (another process, a headless run).
+    """
+    def _stddpc_serial(dev):
+        drv = getattr(dev, "driver", dev)
+        return getattr(drv, "serial", None) if drv is not None and getattr(drv, "h", None) else None
+
+    spec = {}
+    impl = getattr(lf, "_impl", None)
+    if impl is not None and getattr(impl, "serial", None):
+        spec["lf"] = impl.serial
+        try:
+            spec["lf_limits"] = list(lf.get_motion_limits())
+        except Exception:
+            pass
+        spec["lf_frame_gap_s"] = impl.frame_gap_s
+        if getattr(impl, "decode_telemetry", False):
+            spec["lf_decode_telemetry"] = True
+    for key, dev in (("cell_pc", cell_pc), ("back_pc", back_pc)):
+        s = _stddpc_serial(dev)
+        if s:
+            spec[key] = s
+    ser = getattr(serial_pad, "ser", None)
+    if ser is not None and getattr(ser, "port", None):
+        spec["serial_pad"] = ser.port
+    return spec
+
+
+def open_rig(spec: dict, log=print, calibration=None) -> Rig:
+    """
+    Connect the devices named in `spec` ({"lf", "cell_pc", "back_pc",
+    "serial_pad", optional "lf_limits", "lf_frame_gap_s", "lf_decode_telemetry"
+    and "serial_pad_config"}; {"sim": True} for the simulator). Devices that fail to connect are logged and left as None.
+    """
+    log = log or (lambda *a, **k: None)
+    if spec.get("sim"):
+        return open_sim_rig(log=log)
+    if calibration is None:
+        from calibration_wizard import CalibrationManager
+        calibration = CalibrationManager(log=log)
+
+    lf = cell = back = pad = None
+    if spec.get("lf"):
+        from device_controllers.loadframe import LoadFrameController
+        lf = LoadFrameController(log=log, frame_gap_s=float(spec.get("lf_frame_gap_s", 0.05)),
+                                 decode_telemetry=bool(spec.get("lf_decode_telemetry", False)))
+        limits = spec.get("lf_limits")
+        if limits:
+            lf.set_motion_limits(*limits)
+        if not lf.connect(spec["lf"]):
+            lf = None
+    for key in ("cell_pc", "back_pc"):
+        if not spec.get(key):
+            continue
+        from device_controllers.sttdpc_controller import STTDPCController
+        dev = STTDPCController(log=log, calibration_manager=calibration)
+        if dev.connect(spec[key]):
+            if key == "cell_pc":
+                cell = dev
+            else:
+                back = dev
+        else:
+            log(f"[✗] {key} ({spec[key]}) connection failed.")
+    if spec.get("serial_pad"):
+        try:
+            from device_controllers.serial_pad_reader import SerialPadReader
+            pad = SerialPadReader(port=spec["serial_pad"], calibration=calibration, log=log)
+            cfg = spec.get("serial_pad_config")
+            if cfg and hasattr(pad, "set_assignments"):
+                pad.set_assignments(dict(cfg.get("assignments") or {}), dict(cfg.get("sensors") or {}))
+        except Exception as e:
+            log(f"[✗] SerialPad connect failed: {e}")
+    return Rig(lf, cell, back, pad, calibration)
+
+
+def open_sim_rig(log=print) -> Rig:
+    """The mock_controllers simulator wired as a rig (call tick_sim_rig() periodically)."""
+    from mock_controllers import MockLF50Controller, MockSerialPad, MockSTDDPCController
+    lf = MockLF50Controller("SimLF50")
+    cell = MockSTDDPCController("SimCell")
+    back = MockSTDDPCController("SimBack")
+    pad = MockSerialPad("SimSerialPad")
+    pad.link_refs(cell_controller=cell, back_controller=back, lf_controller=lf)
+    for dev in (lf, cell, back, pad):
+        dev.connect()
+    return Rig(lf, cell, back, pad, None)
+
+
+def tick_sim_rig(rig: Rig, stage_data=None):
+    """Advance the simulator one step; pass the active StageData when it changes."""
+    for dev in (rig.lf, rig.cell_pc, rig.back_pc, rig.serial_pad):
+        if dev is None or not hasattr(dev, "tick"):
+            continue
+        if stage_data is not None and getattr(dev, "active_stage", None) is not stage_data:
+            dev.set_stage_profile(stage_data)
+        dev.tick()
+
+
+def close_rig(rig: Optional[Rig]):
+    if rig is None:
+        return
+    for dev in (rig.serial_pad, rig.lf, rig.cell_pc, rig.back_pc):
+        if dev is None:
+            continue
+        try:
+            drv = getattr(dev, "driver", None)
+            (drv if drv is not None and hasattr(drv, "close") else dev).close()
+        except Exception:
+            pass
@@ -0,0 +1,360 @@
+# acquisition/run_log.py
+import csv
+import io
+import os
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from acquisition.reading import Reading
+from acquisition.reading_store import DEFAULT_CHANNELS, ReadingStore
+
+# Run-log columns: the fixed reading schema plus date/stage bookkeeping.
+RUN_LOG_FIELDS = ("date", "stage_index", "stage_name") + tuple(DEFAULT_CHANNELS)
+_TEXT_FIELDS = ("date", "stage_name")
+_TIME_FIELDS = ("timestamp", "test_elapsed_s", "stage_elapsed_s", "time_s")
+
+# Default per-channel deadbands for compressed logging (channel units).
+# Every other logged channel (transducers, derived columns) is compared
+# exactly: any change stores the row.
+DEADBAND_TOLERANCES: Dict[str, float] = {
+    "cell_pressure_kpa": 0.2,
+    "back_pressure_kpa": 0.2,
+    "cell_volume_mm3": 20.0,
+    "back_volume_mm3": 20.0,
+    "position_mm": 0.002,
+    "axial_load_kN": 0.001,
+    "pore_pressure_kpa": 0.2,
+    "axial_displacement_mm": 0.002,
+}
+
+
+class RunLogWriter:
+    """
+    Append-only CSV run log written while the test runs.
+
+    Rows are buffered and written in batches (every `batch_rows` rows or
+    `flush_interval_s`, whichever comes first) and the file is fsync'd every
+    `fsync_interval_s`, so at most a few seconds are lost on a crash and memory
+    use stays constant no matter how long the test runs.
+
+    deadband={channel: tolerance} turns on compressed logging: a reading is
+    only stored when a channel moved by at least its tolerance (any change
+    for channels without one; time columns are not compared) since
+    the last stored row, the stage changed, or `max_interval_s` passed. Every
+    dropped reading is within tolerance of the row before it, so holding the
+    last stored row (RunLogReader.iter_uniform) rebuilds the series to within
+    the deadband. The last dropped reading is written on close so the log
+    ends at the true end time.
+    """
+
+    def __init__(self, path: str, fieldnames: Iterable[str] = RUN_LOG_FIELDS,
+                 batch_rows: int = 50, flush_interval_s: float = 2.0,
+                 fsync_interval_s: float = 10.0, log=print,
+                 deadband: Optional[Dict[str, float]] = None, max_interval_s: float = 60.0):
+        self.path = str(path)
+        self.last_path = self.path          # name MainWindow's summary looks for
+        self.fieldnames: List[str] = list(fieldnames)
+        self.batch_rows = max(1, int(batch_rows))
+        self.flush_interval_s = float(flush_interval_s)
+        self.fsync_interval_s = float(fsync_interval_s)
+        self.log = log or (lambda *a, **k: None)
+
+        self._lock = threading.Lock()
+        self._buf: List[str] = []
+        self._fh = None
+        self._rows_written = 0      # rows handed to the OS
+        self._rows_appended = 0     # rows accepted (including buffered)
+        self._bytes_appended = 0    # file offset of the next row
+        self._last_flush = time.monotonic()
+        self._last_fsync = time.monotonic()
+
+        # deadband compression (off when deadband is None)
+        self.deadband = dict(deadband) if deadband else None
+        self.max_interval_s = float(max_interval_s)
+        self.rows_suppressed = 0
+        self._db_keys = [i for i, k in enumerate(self.fieldnames) if k in ("stage_index", "stage_name")]
+        self._db_cols = [(i, float((self.deadband or {}).get(k, 0.0))) for i, k in enumerate(self.fieldnames)
+                         if k not in _TIME_FIELDS and i not in self._db_keys]
+        self._db_ref = None           # values of the last stored row
+        self._db_ref_ts = 0.0
+        self._db_pending = None       # last suppressed row (written on close)
+
+    # ---------------
+    # Lifecycle
+    # ---------------
+    def open(self, append: bool = False):
+        d = os.path.dirname(self.path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        exists = append and os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if exists:
+            exists = self._trim_torn_tail() > 0     # only a torn header: start over
+        self._fh = open(self.path, "a" if exists else "w", newline="", encoding="utf-8")
+        if exists:
+            self._rows_written = self._rows_appended = RunLogReader(self.path).row_count()
+            self._bytes_appended = os.path.getsize(self.path)
+        else:
+            header = self._format(self.fieldnames)
+            self._fh.write(header)
+            self._fh.flush()
+            self._bytes_appended = len(header.encode("utf-8"))
+        return self
+
+    def _trim_torn_tail(self, block: int = 4096) -> int:
+        """Cut a partial last row (crash mid-write) so appended rows start on a fresh line; returns the new size."""
+        with open(self.path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            while pos > 0:
+                start = max(0, pos - block)
+                f.seek(start)
+                chunk = f.read(pos - start)
+                i = chunk.rfind(b"\n")
+                if i >= 0:
+                    cut = start + i + 1
+                    break
+                pos = start
+            else:
+                cut = 0
+            if cut < end:
+                f.truncate(cut)
+                self.log(f"[!] Run log: dropped a partial last row ({end - cut} bytes) before resuming")
+            return cut
+
+    def close(self):
+        with self._lock:
+            if self._fh is None:
+                return
+            try:
+                if self._db_pending is not None:
+                    self._queue_locked(self._format(self._db_pending))
+                    self._db_pending = None
+                self._flush_locked(fsync=True)
+            finally:
+                try:
+                    self._fh.close()
+                except Exception:
+                    pass
+                self._fh = None
+
+    def is_open(self) -> bool:
+        return self._fh is not None
+
+    # ---------------
+    # Writing
+    # ---------------
+    def append(self, reading: dict):
+        """Queue one reading; writes a batch to disk when due."""
+        if self._fh is None or not isinstance(reading, (dict, Reading)):
+            return
+        values = self._values(reading)
+        with self._lock:
+            if self.deadband is not None and not self._deadband_due_locked(values):
+                self._db_pending = values
+                self.rows_suppressed += 1
+                return
+            self._db_pending = None
+            self._queue_locked(self._format(values))
+            now = time.monotonic()
+            if len(self._buf) >= self.batch_rows or (now - self._last_flush) >= self.flush_interval_s:
+                self._flush_locked(fsync=(now - self._last_fsync) >= self.fsync_interval_s)
+
+    def _queue_locked(self, row: str):
+        self._buf.append(row)
+        self._rows_appended += 1
+        self._bytes_appended += len(row.encode("utf-8"))
+
+    def _deadband_due_locked(self, values: list) -> bool:
+        """True if this row must be stored; updates the reference row when it is."""
+        now = time.monotonic()
+        ref = self._db_ref
+        due = ref is None or (now - self._db_ref_ts) >= self.max_interval_s
+        if not due:
+            due = any(values[i] != ref[i] for i in self._db_keys)
+        if not due:
+            for i, tol in self._db_cols:
+                v, r = values[i], ref[i]
+                if (v is None) != (r is None):
+                    due = True
+                    break
+                if tol <= 0.0:
+                    if v != r:
+                        due = True
+                        break
+                    continue
+                try:
+                    if v is not None and abs(float(v) - float(r)) >= tol:
+                        due = True
+                        break
+                except (TypeError, ValueError):
+                    due = v != r
+                    if due:
+                        break
+        if due:
+            self._db_ref = values
+            self._db_ref_ts = now
+        return due
+
+    def flush(self, fsync: bool = False):
+        with self._lock:
+            self._flush_locked(fsync=fsync)
+
+    def _flush_locked(self, fsync: bool = False):
+        if self._fh is None:
+            return
+        if self._buf:
+            self._fh.write("".join(self._buf))
+            self._rows_written += len(self._buf)
+            self._buf.clear()
+        self._fh.flush()
+        self._last_flush = time.monotonic()
+        if fsync:
+            try:
+                os.fsync(self._fh.fileno())
+            except Exception as e:
+                self.log(f"[!] Run log fsync failed: {e}")
+            self._last_fsync = self._last_flush
+
+    def total_rows_written(self) -> int:
+        return self._rows_appended
+
+    def position(self) -> tuple:
+        """(row, byte offset) the next stored row will get; events record this."""
+        with self._lock:
+            return self._rows_appended, self._bytes_appended
+
+    # ---------------
+    # Formatting
+    # ---------------
+    def _values(self, reading: dict) -> list:
+        chans = reading.get("transducers") or ()
+        out = []
+        for k in self.fieldnames:
+            v = reading.get(k)
+            if v is None and k.startswith("transducer_"):
+                try:
+                    v = chans[int(k[11:])]
+                except (IndexError, ValueError, TypeError):
+                    v = None
+            out.append(v)
+        return out
+
+    @staticmethod
+    def _format(values) -> str:
+        sio = io.StringIO()
+        csv.writer(sio).writerow(["" if v is None else v for v in values])
+        return sio.getvalue()
+
+
+class RunLogReader:
+    """Streams a run log back (for export, Graph Workspace, summaries)."""
+
+    def __init__(self, path: str):
+        self.path = str(path)
+
+    @property
+    def fieldnames(self) -> List[str]:
+        with open(self.path, newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), [])
+
+    def iter_rows(self, span=None) -> Iterator[dict]:
+        """
+        Yield rows as reading dicts (numbers as float, blanks as None).
+
+        span (an event_index.RowSpan) limits the read to that slice; its byte
+        offsets are used to seek straight to it when present.
+        """
+        with open(self.path, "rb") as f:
+            header = next(csv.reader([f.readline().decode("utf-8")]), None)
+            if not header:
+                return
+            for rec in csv.reader(self._span_lines(f, span)):
+                if len(rec) != len(header):
+                    continue   # torn last line after a crash
+                row = {}
+                for k, v in zip(header, rec):
+                    if v == "":
+                        row[k] = None
+                    elif k in _TEXT_FIELDS:
+                        row[k] = v
+                    else:
+                        try:
+                            row[k] = float(v)
+                        except ValueError:
+                            row[k] = v
+                si = row.get("stage_index")
+                if si is not None:
+                    row["stage_index"] = int(si)
+                yield row
+
+    @staticmethod
+    def _span_lines(f, span) -> Iterator[str]:
+        row, pos = 0, f.tell()
+        stop_row = stop_off = None
+        if span is not None:
+            stop_row, stop_off = span.stop, span.stop_offset
+            if span.start_offset is not None:
+                f.seek(span.start_offset)
+                row, pos = span.start, span.start_offset
+        for line in iter(f.readline, b""):
+            if (stop_off is not None and pos >= stop_off) or (stop_row is not None and row >= stop_row):
+                return
+            pos += len(line)
+            row += 1
+            if span is not None and row <= span.start:
+                continue            # no offset to seek to: skip up to the span's first row
+            yield line.decode("utf-8")
+
+    def row_count(self) -> int:
+        n = 0
+        for _ in self.iter_rows():
+            n += 1
+        return n
+
+    def iter_uniform(self, period_s: float, time_key: str = "test_elapsed_s") -> Iterator[dict]:
+        """
+        Rebuild a uniformly spaced series from a (deadband-compressed) log.
+
+        Rows are emitted every period_s of `time_key`, each holding the last
+        stored row at or before that time with its time columns advanced to
+        the grid time. For a log written with a deadband this is within the
+        per-channel tolerance of what was acquired. Rows without `time_key`
+        are passed through unchanged.
+        """
+        period_s = float(period_s)
+        if period_s <= 0:
+            yield from self.iter_rows()
+            return
+        prev = None
+        t_next = None
+        for row in self.iter_rows():
+            t = row.get(time_key)
+            if t is None:
+                yield row
+                continue
+            if prev is not None:
+                while t_next < t - 1e-9:
+                    yield self._shifted(prev, t_next - prev[time_key])
+                    t_next += period_s
+            else:
+                t_next = t
+            if t_next <= t + 1e-9:
+                yield row
+                t_next = t + period_s
+            prev = row
+
+    @staticmethod
+    def _shifted(row: dict, dt: float) -> dict:
+        out = dict(row)
+        for k in _TIME_FIELDS:
+            if out.get(k) is not None:
+                out[k] = out[k] + dt
+        return out
+
+    def load_store(self, store: Optional[ReadingStore] = None, span=None) -> ReadingStore:
+        """Load the log (or one RowSpan of it) into a columnar store (no per-row dicts kept)."""
+        store = store if store is not None else ReadingStore(allow_new_columns=True)
+        for row in self.iter_rows(span):
+            store.append(row)
+        return store
@@ -0,0 +1,283 @@
+# acquisition/sample_broker.py
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from acquisition.scheduler import MultiRateScheduler
+
+
+class Sample(NamedTuple):
+    """A device value with its own monotonic acquisition time."""
+    value: object
+    ts: float
+    read_ts: Optional[float] = None     # when its bytes were read, if earlier than ts (tracing)
+
+
+class Subscription:
+    """Handle returned by SampleBroker.subscribe(); pass it to unsubscribe()."""
+
+    def __init__(self, callback, channels=None, min_interval_s=0.0, max_age_s=None):
+        self.callback = callback
+        self.channels = frozenset(channels) if channels else None
+        self.min_interval_s = max(0.0, float(min_interval_s))
+        self.max_age_s = max_age_s
+        self.last_delivery = 0.0
+
+
+class SampleBroker:
+    """
+    One producer per device, many consumers.
+
+    Each source (cell/back pressure controller, load frame, SerialPad) gets
+    exactly one task on the shared MultiRateScheduler, with its own rate and
+    priority, that reads the device and publishes its channels onto a
+    latest-value board. Consumers either read the board
+    (latest()/snapshot(), never touching the bus) or subscribe with their own
+    rate (min_interval_s) and freshness (max_age_s) requirements.
+
+    Producers may publish Sample(value, ts) to carry the device's own
+    acquisition time; plain values are stamped on arrival. The last
+    `history_len` samples per channel are kept for time alignment
+    (see acquisition/sample_fusion.py).
+
+    Subscriber callbacks run on the producer thread: GUI code should only
+    emit a Qt signal or stash the values there.
+    """
+
+    def __init__(self, log=print, history_len: int = 64, scheduler: Optional[MultiRateScheduler] = None):
+        self.log = log or (lambda *a, **k: None)
+        self.scheduler = scheduler if scheduler is not None else MultiRateScheduler(log=self.log)
+        self._lock = threading.Lock()
+        self._board: Dict[str, tuple] = {}          # channel -> (value, monotonic ts)
+        self._hist: Dict[str, deque] = {}           # channel -> deque[(ts, value)]
+        self._trace: Dict[str, tuple] = {}          # channel -> (read, parse/acquired, published)
+        self.history_len = max(2, int(history_len))
+        self._sources: Dict[str, dict] = {}         # name -> {"task", "device"}
+        self._subs = []
+        self._running = False
+
+    # ---------------
+    # Producers
+    # ---------------
+    def add_source(self, name: str, read_fn: Callable[[], Optional[dict]], period_s: float = 0.2,
+                   device=None, priority: int = 0):
+        """
+        Register (or replace) the producer for one device. read_fn returns a
+        {channel: value} dict; None values are not published.
+        Re-adding the same device under the same name is a no-op.
+        """
+        with self._lock:
+            cur = self._sources.get(name)
+            if cur is not None and device is not None and cur["device"] is device:
+                return
+        if cur is not None:
+            self.remove_source(name)
+        task = self.scheduler.add_task(f"source:{name}", read_fn, self.publish,
+                                       period_s=period_s, priority=priority)
+        with self._lock:
+            self._sources[name] = {"task": task, "device": device}
+        if self._running:
+            task.start()
+
+    def remove_source(self, name: str):
+        with self._lock:
+            src = self._sources.pop(name, None)
+        if src is not None:
+            self.scheduler.remove_task(src["task"].name)
+
+    def set_source_rate(self, name: str, period_s: float) -> bool:
+        src = self._sources.get(name)
+        return bool(src) and self.scheduler.set_rate(src["task"].name, period_s)
+
+    def has_source(self, name: str) -> bool:
+        return name in self._sources
+
+    def start(self):
+        self._running = True
+        for src in list(self._sources.values()):
+            src["task"].start()
+
+    def stop(self):
+        self._running = False
+        for src in list(self._sources.values()):
+            src["task"].stop()
+
+    def is_running(self) -> bool:
+        return self._running
+
+    # ---------------
+    # Board
+    # ---------------
+    def publish(self, values: dict):
+        """Put fresh values on the board and fan them out to subscribers."""
+        if not values:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for k, v in values.items():
+                if v is None:
+                    continue
+                read_ts = None
+                if isinstance(v, Sample):
+                    v, ts, read_ts = v.value, v.ts, v.read_ts
+                    if v is None:
+                        continue
+                else:
+                    ts = now
+                prev = self._board.get(k)
+                if prev is not None and prev[1] == ts:
+                    continue            # same device sample re-read from its cache
+                self._board[k] = (v, ts)
+                self._trace[k] = (read_ts if read_ts is not None else ts, ts, now)
+                h = self._hist.get(k)
+                if h is None:
+                    h = self._hist[k] = deque(maxlen=self.history_len)
+                h.append((ts, v))
+            subs = list(self._subs)
+
+        keys = set(values)
+        for sub in subs:
+            if sub.channels is not None and not (sub.channels & keys):
+                continue
+            if (now - sub.last_delivery) < sub.min_interval_s:
+                continue
+            sub.last_delivery = now
+            try:
+                sub.callback(self.snapshot(sub.channels, sub.max_age_s))
+            except Exception as e:
+                self.log(f"[!] Broker subscriber failed: {e}")
+
+    def latest(self, channel: str, max_age_s: Optional[float] = None):
+        """Latest value for one channel, or None if missing/older than max_age_s."""
+        item = self._board.get(channel)
+        if item is None:
+            return None
+        v, ts = item
+        if max_age_s is not None and (time.monotonic() - ts) > max_age_s:
+            return None
+        return v
+
+    def snapshot(self, channels: Optional[Iterable[str]] = None,
+                 max_age_s: Optional[float] = None) -> dict:
+        """Fresh values for the given channels (all if None); stale ones are left out."""
+        now = time.monotonic()
+        with self._lock:
+            items = list(self._board.items()) if channels is None else \
+                [(k, self._board[k]) for k in channels if k in self._board]
+        return {k: v for k, (v, ts) in items if max_age_s is None or (now - ts) <= max_age_s}
+
+    def sample(self, channel: str) -> Optional[Sample]:
+        """Latest value with its acquisition timestamp."""
+        item = self._board.get(channel)
+        return None if item is None else Sample(item[0], item[1])
+
+    def trace(self, channel: str) -> Optional[tuple]:
+        """(read, parse, publish) monotonic stamps of the channel's current board value."""
+        return self._trace.get(channel)
+
+    def history(self, channel: str) -> List[tuple]:
+        """Recent (ts, value) pairs for one channel, oldest first."""
+        with self._lock:
+            h = self._hist.get(channel)
+            return list(h) if h else []
+
+    def age_s(self, channel: str) -> Optional[float]:
+        item = self._board.get(channel)
+        return None if item is None else time.monotonic() - item[1]
+
+    # ---------------
+    # Consumers
+    # ---------------
+    def subscribe(self, callback, channels: Optional[Iterable[str]] = None,
+                  min_interval_s: float = 0.0, max_age_s: Optional[float] = None) -> Subscription:
+        sub = Subscription(callback, channels, min_interval_s, max_age_s)
+        with self._lock:
+            self._subs.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            try:
+                self._subs.remove(sub)
+            except ValueError:
+                pass
+
+
+# ---------------
+# Rig wiring
+# ---------------
+# Producers run on the shared scheduler thread, so they only copy device
+# caches (filled by each device's own I/O or reader thread) and publish
+# nothing while a cache is stale; they never fall back to a port read.
+def _cached_sample(dev, attr, max_age_s, read_ts_attr=None):
+    try:
+        fn = getattr(dev, attr, None)
+        got = fn(max_age_s) if callable(fn) else None
+        if not got:
+            return None
+        read_ts = getattr(dev, read_ts_attr, None) if read_ts_attr else None
+        return Sample(float(got[0]), float(got[1]), read_ts)
+    except Exception:
+        return None
+
+
+def _pressure_source(dev, prefix):
+    def read():
+        return {f"{prefix}_pressure_kpa": _cached_sample(dev, "get_cached_pressure_sample", 1.0, "pressure_read_ts"),
+                f"{prefix}_volume_mm3": _cached_sample(dev, "get_cached_volume_sample", 1.0, "volume_read_ts")}
+    return read
+
+
+def _frame_source(lf):
+    def read():
+        return {"position_mm": _cached_sample(lf, "get_cached_position_sample", 1.0, "position_read_ts")}
+    return read
+
+
+def _serial_pad_source(sp):
+    def read():
+        # the pad's reader thread does the port I/O; repeats of the same scan
+        # are dropped by publish()
+        get_sample = getattr(sp, "get_cached_channels_sample", None)
+        try:
+            got = get_sample(1.0) if callable(get_sample) else None
+        except Exception:
+            return None
+        if not got or not got[0]:
+            return None
+        ch, ts = got
+        out = {"transducers": Sample(list(ch), ts)}
+        if len(ch) >= 3:
+            out["axial_load_kN"] = Sample(ch[0], ts)
+            out["pore_pressure_kpa"] = Sample(ch[1], ts)
+            out["axial_displacement_mm"] = Sample(ch[2], ts)
+        return out
+    return read
+
+
+# Default per-device rates (s) and priorities (higher runs first when due together).
+# The load channel (SerialPad) gets the highest priority; STDDPC frames stream
+# on their own, so their producers only copy the controller cache.
+DEFAULT_SOURCE_RATES = {"serial_pad": 0.1, "lf": 0.2, "cell_pc": 0.2, "back_pc": 0.2}
+SOURCE_PRIORITIES = {"serial_pad": 30, "lf": 20, "cell_pc": 10, "back_pc": 10}
+
+
+def register_rig_sources(broker: SampleBroker, lf=None, cell_pc=None, back_pc=None, serial_pad=None,
+                         rates: Optional[Dict[str, float]] = None):
+    """Add one producer per connected device (wrappers are unwrapped to their driver)."""
+    def _unwrap(dev):
+        return getattr(dev, "driver", dev)
+
+    rates = dict(DEFAULT_SOURCE_RATES, **(rates or {}))
+    for name, dev, factory in (
+        ("cell_pc", _unwrap(cell_pc) if cell_pc else None, lambda d: _pressure_source(d, "cell")),
+        ("back_pc", _unwrap(back_pc) if back_pc else None, lambda d: _pressure_source(d, "back")),
+        ("lf", _unwrap(lf) if lf else None, _frame_source),
+        ("serial_pad", serial_pad, _serial_pad_source),
+    ):
+        if dev is None:
+            broker.remove_source(name)
+        else:
+            broker.add_source(name, factory(dev), period_s=rates[name], device=dev,
+                              priority=SOURCE_PRIORITIES.get(name, 0))
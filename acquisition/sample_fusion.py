@@ -0,0 +1,69 @@
+# acquisition/sample_fusion.py
+import bisect
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _is_number(v) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v)
+
+
+def align_value(history: List[Tuple[float, object]], t_ref: float, window_s: float,
+                interpolate: bool = True) -> Tuple[Optional[object], Optional[float]]:
+    """
+    Value of one channel at t_ref from its (ts, value) history (oldest first).
+
+    - numeric samples on both sides of t_ref (each within window_s) are
+      linearly interpolated;
+    - otherwise the nearest sample within window_s is used;
+    - nothing within the window → (None, None).
+
+    Returns (value, skew_s) where skew_s is the distance in time between t_ref
+    and the sample(s) actually used (0 for an exact hit, max side gap when
+    interpolating).
+    """
+    if not history:
+        return None, None
+    times = [t for t, _ in history]
+    i = bisect.bisect_left(times, t_ref)
+
+    before = history[i - 1] if i > 0 else None
+    after = history[i] if i < len(history) else None
+    if after is not None and after[0] == t_ref:
+        return after[1], 0.0
+
+    if interpolate and before and after:
+        (t0, v0), (t1, v1) = before, after
+        gap = max(t_ref - t0, t1 - t_ref)
+        if gap <= window_s and _is_number(v0) and _is_number(v1) and t1 > t0:
+            w = (t_ref - t0) / (t1 - t0)
+            return v0 + (v1 - v0) * w, gap
+
+    best = None
+    for cand in (before, after):
+        if cand is None:
+            continue
+        d = abs(cand[0] - t_ref)
+        if d <= window_s and (best is None or d < best[0]):
+            best = (d, cand[1])
+    return (best[1], best[0]) if best else (None, None)
+
+
+def fuse(broker, channels: Iterable[str], t_ref: float, window_s: float = 1.0,
+         interpolate: bool = True) -> Tuple[Dict[str, object], Dict[str, float]]:
+    """
+    Align several broker channels onto one time base.
+
+    t_ref is a time.monotonic() value (usually "now minus a small delay" so the
+    slower devices have reported a sample after it and can be interpolated).
+    Returns (values, skews) keyed by channel; channels without a sample in the
+    window are left out of both.
+    """
+    values: Dict[str, object] = {}
+    skews: Dict[str, float] = {}
+    for ch in channels:
+        v, skew = align_value(broker.history(ch), t_ref, window_s, interpolate)
+        if v is not None:
+            values[ch] = v
+            skews[ch] = skew
+    return values, skews
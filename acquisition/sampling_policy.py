@@ -0,0 +1,217 @@
+# acquisition/sampling_policy.py
+from typing import Callable, Dict, Optional
+
+
+class SamplingPolicy:
+    """
+    Decides which acquired readings are stored in the run log.
+
+    The manager still acquires (and shows) every tick; should_record() only
+    thins what is written to disk. tick_period_s() may ask the manager to
+    change its acquisition rate (None = keep the current one).
+    """
+
+    def reset(self):
+        """Called when a stage starts."""
+
+    def should_record(self, reading: dict) -> bool:
+        return True
+
+    def tick_period_s(self, reading: dict) -> Optional[float]:
+        return None
+
+
+class FixedPolicy(SamplingPolicy):
+    """Store every reading (the old fixed sampling_period_s behaviour)."""
+
+
+class TimeSpacedPolicy(SamplingPolicy):
+    """
+    Store readings at log- or sqrt-spaced stage times (consolidation curves).
+
+    log:  targets t_k = first_s * 10^(k / points_per_decade)
+    sqrt: targets with equal steps in sqrt(t): t_k = (k * sqrt_step)^2
+    Never closer than min_interval_s and never further apart than
+    max_interval_s.
+    """
+
+    def __init__(self, spacing: str = "log", first_s: float = 1.0, points_per_decade: int = 30,
+                 sqrt_step: float = 1.0, min_interval_s: float = 0.5, max_interval_s: float = 600.0):
+        self.spacing = spacing
+        self.first_s = max(1e-3, float(first_s))
+        self.points_per_decade = max(1, int(points_per_decade))
+        self.sqrt_step = max(1e-3, float(sqrt_step))
+        self.min_interval_s = float(min_interval_s)
+        self.max_interval_s = float(max_interval_s)
+        self.reset()
+
+    def reset(self):
+        self._k = 0
+        self._last_t = None
+
+    def _target(self, k: int) -> float:
+        if self.spacing == "sqrt":
+            return (k * self.sqrt_step) ** 2
+        return self.first_s * 10.0 ** (k / self.points_per_decade)
+
+    def should_record(self, reading: dict) -> bool:
+        t = reading.get("stage_elapsed_s")
+        if t is None:
+            return True
+        if self._last_t is None:
+            self._last_t = t
+            return True                      # always keep the stage's first row
+        if (t - self._last_t) < self.min_interval_s:
+            return False
+        due = t >= self._target(self._k) or (t - self._last_t) >= self.max_interval_s
+        if due:
+            while self._target(self._k) <= t:
+                self._k += 1
+            self._last_t = t
+        return due
+
+
+class ChangeTriggeredPolicy(SamplingPolicy):
+    """
+    Store a reading when any watched channel moved by its threshold (plus a
+    heartbeat). A threshold of 0 means any change; transducer_N reads the
+    reading's `transducers` list.
+    """
+
+    def __init__(self, thresholds: Dict[str, float], max_interval_s: float = 60.0):
+        self.thresholds = dict(thresholds)
+        self.max_interval_s = float(max_interval_s)
+        self.reset()
+
+    def reset(self):
+        self._ref: Dict[str, float] = {}
+        self._last_t = None
+
+    def should_record(self, reading: dict) -> bool:
+        t = reading.get("stage_elapsed_s")
+        changed = self._last_t is None or (t is not None and (t - self._last_t) >= self.max_interval_s)
+        if not changed:
+            for ch, thr in self.thresholds.items():
+                v, ref = _channel(reading, ch), self._ref.get(ch)
+                if v is None:
+                    continue
+                if ref is None or (abs(v - ref) >= thr if thr > 0 else v != ref):
+                    changed = True
+                    break
+        if changed:
+            for ch in self.thresholds:
+                v = _channel(reading, ch)
+                if v is not None:
+                    self._ref[ch] = v
+            self._last_t = t
+        return changed
+
+
+def _channel(reading: dict, ch: str):
+    v = reading.get(ch)
+    if v is None and ch.startswith("transducer_"):
+        try:
+            v = (reading.get("transducers") or ())[int(ch[11:])]
+        except (IndexError, ValueError, TypeError):
+            v = None
+    return v
+
+
+class RateBoostPolicy(SamplingPolicy):
+    """
+    Raise the acquisition rate while a channel changes quickly (e.g. load
+    near peak in shear) and drop back once it settles. Stores every reading
+    unless records=False (rate control only, for use inside CombinedPolicy).
+    """
+
+    def __init__(self, channel: str = "axial_load_kN", rate_threshold: float = 0.01,
+                 base_period_s: float = 0.5, boost_period_s: float = 0.1, hold_s: float = 5.0,
+                 records: bool = True):
+        self.channel = channel
+        self.rate_threshold = float(rate_threshold)   # channel units per second
+        self.base_period_s = float(base_period_s)
+        self.boost_period_s = float(boost_period_s)
+        self.hold_s = float(hold_s)
+        self.records = bool(records)
+        self.reset()
+
+    def reset(self):
+        self._prev = None            # (t, value)
+        self._boost_until = None
+
+    def should_record(self, reading: dict) -> bool:
+        return self.records
+
+    def tick_period_s(self, reading: dict) -> Optional[float]:
+        t, v = reading.get("stage_elapsed_s"), reading.get(self.channel)
+        if t is None or v is None:
+            return None
+        prev, self._prev = self._prev, (t, v)
+        if prev is not None and t > prev[0]:
+            rate = abs(v - prev[1]) / (t - prev[0])
+            if rate >= self.rate_threshold:
+                self._boost_until = t + self.hold_s
+        boosted = self._boost_until is not None and t < self._boost_until
+        return self.boost_period_s if boosted else self.base_period_s
+
+
+class CombinedPolicy(SamplingPolicy):
+    """Store if any member wants the row; the fastest requested tick wins."""
+
+    def __init__(self, *policies: SamplingPolicy):
+        self.policies = list(policies)
+
+    def reset(self):
+        for p in self.policies:
+            p.reset()
+
+    def should_record(self, reading: dict) -> bool:
+        # evaluate all so every member keeps its own state current
+        votes = [p.should_record(reading) for p in self.policies]
+        return any(votes)
+
+    def tick_period_s(self, reading: dict) -> Optional[float]:
+        periods = [p.tick_period_s(reading) for p in self.policies]
+        periods = [p for p in periods if p is not None]
+        return min(periods) if periods else None
+
+
+# ---------------
+# Registry (keyed by StageData.stage_type)
+# ---------------
+def _consolidation(period_s: float) -> SamplingPolicy:
+    return TimeSpacedPolicy("log", first_s=1.0, points_per_decade=30,
+                            min_interval_s=period_s, max_interval_s=600.0)
+
+
+def _saturation(period_s: float) -> SamplingPolicy:
+    return ChangeTriggeredPolicy({"cell_pressure_kpa": 0.5, "back_pressure_kpa": 0.5,
+                                  "back_volume_mm3": 50.0, "pore_pressure_kpa": 0.5},
+                                 max_interval_s=30.0)
+
+
+def _loading(period_s: float) -> SamplingPolicy:
+    # keep rows when load/displacement, drainage volume, pressures or the local
+    # transducers move; go fast while load is rising
+    watched = {"axial_load_kN": 0.002, "axial_displacement_mm": 0.005, "position_mm": 0.005,
+               "pore_pressure_kpa": 0.5, "cell_pressure_kpa": 0.5, "back_pressure_kpa": 0.5,
+               "back_volume_mm3": 50.0}
+    watched.update({f"transducer_{i}": 0.0 for i in range(8)})
+    return CombinedPolicy(
+        ChangeTriggeredPolicy(watched, max_interval_s=10.0),
+        RateBoostPolicy("axial_load_kN", rate_threshold=0.005,
+                        base_period_s=period_s, boost_period_s=min(period_s, 0.1), records=False),
+    )
+
+
+SAMPLING_POLICIES: Dict[str, Callable[[float], SamplingPolicy]] = {
+    "Consolidation": _consolidation,
+    "Saturation": _saturation,
+    "Shear": _loading,
+    "Automated Docking": _loading,
+}
+
+
+def policy_for_stage(stage_type: Optional[str], sampling_period_s: float) -> SamplingPolicy:
+    factory = SAMPLING_POLICIES.get(stage_type)
+    return factory(float(sampling_period_s)) if factory else FixedPolicy()
@@ -0,0 +1,253 @@
+# acquisition/scheduler.py
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Optional
+
+from acquisition.loop_timing import LoopTimingRegistry
+from acquisition.profiling import profile_point
+
+
+class ScheduledTask:
+    """
+    One periodic job on a MultiRateScheduler.
+
+    Controlled like a dedicated acquisition thread (start/stop/pause/resume,
+    is_running/is_active, set_period) and keeps its own timing stats
+    (samples, overruns, work time, dispatch lateness).
+    """
+
+    def __init__(self, scheduler, name, fn, on_result=None, period_s=0.5, priority=0):
+        self.scheduler = scheduler
+        self.name = name
+        self.fn = fn
+        self.on_result = on_result
+        self.period_s = max(0.01, float(period_s))
+        self.priority = int(priority)
+
+        self._active = False
+        self._paused = False
+        self._gen = 0                 # bumps invalidate queued heap entries
+
+        # stats (read-only for callers)
+        self.samples = 0
+        self.overruns = 0
+        self.last_work_s = 0.0
+        self.max_work_s = 0.0
+        self.last_late_s = 0.0        # dispatch time - deadline
+        self.max_late_s = 0.0
+        # period/jitter/work histograms, shared through scheduler.timing as "task.<name>"
+        self.timing = scheduler.timing.loop(f"task.{name}", self.period_s)
+        self._last_dispatch = None
+
+    # ---------------
+    # Lifecycle
+    # ---------------
+    def start(self):
+        """Start (or un-pause) the task; first run is due immediately."""
+        self._paused = False
+        if self._active:
+            return
+        self._active = True
+        self._last_dispatch = None      # first period after a restart is not a real one
+        self.scheduler._arm(self, time.monotonic())
+
+    def stop(self, timeout_s: float = 1.0):
+        """Stop the task; waits at most timeout_s for an in-flight run."""
+        self._active = False
+        self._paused = False
+        self.scheduler._disarm(self, timeout_s)
+
+    def pause(self):
+        if self._active:
+            self._active = False
+            self.scheduler._disarm(self, 0.0)
+        self._paused = True
+
+    def resume(self):
+        self.start()
+
+    def is_running(self) -> bool:
+        return self._active or self._paused
+
+    def is_active(self) -> bool:
+        """Scheduled and not paused (QTimer.isActive() equivalent)."""
+        return self._active
+
+    def set_period(self, period_s: float):
+        self.period_s = max(0.01, float(period_s))
+        self.timing.target_period_s = self.period_s
+        self._last_dispatch = None
+        if self._active:
+            self.scheduler._arm(self, time.monotonic() + self.period_s)
+
+    def stats(self) -> dict:
+        return {
+            "period_s": self.period_s, "priority": self.priority, "active": self._active,
+            "samples": self.samples, "overruns": self.overruns,
+            "last_work_s": self.last_work_s, "max_work_s": self.max_work_s,
+            "last_late_s": self.last_late_s, "max_late_s": self.max_late_s,
+        }
+
+
+class MultiRateScheduler:
+    """
+    Single dispatcher thread for all periodic acquisition work.
+
+    Every task has its own period and priority and runs on an absolute
+    deadline schedule (next = previous deadline + period). When several tasks
+    are due at once the highest priority goes first; slots that are missed
+    entirely are skipped and counted in the task's `overruns`.
+
+    Tasks should not block for long (read caches, not ports): a slow task
+    delays the others, which shows up as lateness in their stats.
+    """
+
+    def __init__(self, name: str = "acq-scheduler", log=print):
+        self.name = name
+        self.log = log or (lambda *a, **k: None)
+        self._cond = threading.Condition()
+        self._heap = []                          # (deadline, seq, gen, task)
+        self._seq = itertools.count()
+        self._tasks: Dict[str, ScheduledTask] = {}
+        self._thread = None
+        self._run = False
+        self._current: Optional[ScheduledTask] = None
+        self.timing = LoopTimingRegistry()
+
+    # ---------------
+    # Tasks
+    # ---------------
+    def add_task(self, name: str, fn, on_result=None, period_s: float = 0.5,
+                 priority: int = 0) -> ScheduledTask:
+        """Register (or replace) a task. It is created stopped; call task.start()."""
+        self.remove_task(name)
+        task = ScheduledTask(self, name, fn, on_result, period_s, priority)
+        with self._cond:
+            self._tasks[name] = task
+        return task
+
+    def remove_task(self, name: str):
+        with self._cond:
+            task = self._tasks.pop(name, None)
+        if task is not None:
+            task.stop()
+
+    def task(self, name: str) -> Optional[ScheduledTask]:
+        return self._tasks.get(name)
+
+    def set_rate(self, name: str, period_s: float) -> bool:
+        task = self._tasks.get(name)
+        if task is None:
+            return False
+        if abs(task.period_s - float(period_s)) > 1e-9:
+            task.set_period(period_s)
+        return True
+
+    def stats(self) -> Dict[str, dict]:
+        with self._cond:
+            tasks = list(self._tasks.items())
+        return {name: t.stats() for name, t in tasks}
+
+    # ---------------
+    # Thread
+    # ---------------
+    def start(self):
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._run = True
+            self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout_s: float = 1.0):
+        with self._cond:
+            self._run = False
+            self._cond.notify_all()
+        th = self._thread
+        if th and th.is_alive() and th is not threading.current_thread():
+            th.join(timeout=timeout_s)
+        self._thread = None
+
+    def _arm(self, task: ScheduledTask, deadline: float):
+        with self._cond:
+            task._gen += 1
+            heapq.heappush(self._heap, (deadline, next(self._seq), task._gen, task))
+            self._cond.notify_all()
+        self.start()
+
+    def _disarm(self, task: ScheduledTask, timeout_s: float):
+        with self._cond:
+            task._gen += 1          # queued entries become stale
+            if threading.current_thread() is self._thread:
+                return
+            end = time.monotonic() + max(0.0, timeout_s)
+            while self._current is task:
+                left = end - time.monotonic()
+                if left <= 0:
+                    break
+                self._cond.wait(left)
+
+    def _next_due_locked(self, now: float):
+        """Pop the highest-priority due entry (earliest deadline breaks ties)."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            e = heapq.heappop(self._heap)
+            if e[2] == e[3]._gen and e[3]._active:
+                due.append(e)
+        if not due:
+            return None
+        best = max(due, key=lambda e: (e[3].priority, -e[0]))
+        for e in due:
+            if e is not best:
+                heapq.heappush(self._heap, e)
+        return best
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                entry = None
+                while self._run and entry is None:
+                    # drop stale heads so the wait below uses a real deadline
+                    while self._heap and (self._heap[0][2] != self._heap[0][3]._gen or not self._heap[0][3]._active):
+                        heapq.heappop(self._heap)
+                    now = time.monotonic()
+                    entry = self._next_due_locked(now)
+                    if entry is None:
+                        self._cond.wait((self._heap[0][0] - now) if self._heap else None)
+                if not self._run:
+                    return
+                deadline, _, gen, task = entry
+                self._current = task
+
+            profile_point()
+            t_work = time.monotonic()
+            task.last_late_s = t_work - deadline
+            task.max_late_s = max(task.max_late_s, task.last_late_s)
+            try:
+                result = task.fn()
+                if result is not None and callable(task.on_result):
+                    task.on_result(result)
+            except Exception as e:
+                self.log(f"[!] {task.name} task failed: {e}")
+            task.last_work_s = time.monotonic() - t_work
+            task.max_work_s = max(task.max_work_s, task.last_work_s)
+            task.samples += 1
+            if task._last_dispatch is not None:
+                task.timing.record(t_work - task._last_dispatch, task.last_work_s, task.last_late_s)
+            task._last_dispatch = t_work
+
+            with self._cond:
+                self._current = None
+                self._cond.notify_all()
+                if not task._active or gen != task._gen:
+                    continue
+                # absolute schedule: next slot is relative to the previous deadline
+                nxt = deadline + task.period_s
+                now = time.monotonic()
+                if now >= nxt:
+                    missed = int((now - nxt) // task.period_s) + 1
+                    task.overruns += missed
+                    nxt += missed * task.period_s
+                heapq.heappush(self._heap, (nxt, next(self._seq), gen, task))
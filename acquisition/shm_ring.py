@@ -0,0 +1,139 @@
+# acquisition/shm_ring.py
+import math
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from acquisition.reading_store import DEFAULT_CHANNELS
+
+# Numeric columns carried through the ring (stage names travel as events).
+RING_FIELDS = tuple(DEFAULT_CHANNELS) + ("stage_index",)
+
+_HEADER = 4        # int64: capacity, ncols, rows written (monotonic), reserved
+
+
+class ShmReadingRing:
+    """
+    Single-producer ring of fixed-schema readings in shared memory.
+
+    The acquisition process push()es rows; the GUI process attaches by name
+    and read_since(seq) copies whatever arrived since its last call. The
+    write counter is bumped only after a row is complete; a reader that
+    falls more than `capacity` rows behind gets the newest rows and a count
+    of the ones it missed. No locks cross the process boundary.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool, fields: Sequence[str] = RING_FIELDS):
+        self.shm = shm
+        self.owner = owner
+        self.fields = tuple(fields)
+        self._col = {k: i for i, k in enumerate(self.fields)}
+        self._hdr = np.ndarray((_HEADER,), dtype=np.int64, buffer=shm.buf, offset=0)
+        cap, ncols = int(self._hdr[0]), int(self._hdr[1])
+        self.capacity = cap
+        self._data = np.ndarray((cap, ncols), dtype=np.float64, buffer=shm.buf, offset=_HEADER * 8)
+
+    @classmethod
+    def create(cls, capacity: int = 65536, fields: Sequence[str] = RING_FIELDS,
+               name: Optional[str] = None) -> "ShmReadingRing":
+        capacity = max(16, int(capacity))
+        size = _HEADER * 8 + capacity * len(fields) * 8
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        hdr = np.ndarray((_HEADER,), dtype=np.int64, buffer=shm.buf, offset=0)
+        hdr[:] = (capacity, len(fields), 0, 0)
+        return cls(shm, owner=True, fields=fields)
+
+    @classmethod
+    def attach(cls, name: str, fields: Sequence[str] = RING_FIELDS) -> "ShmReadingRing":
+        return cls(shared_memory.SharedMemory(name=name), owner=False, fields=fields)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def written(self) -> int:
+        return int(self._hdr[2])
+
+    def close(self):
+        # drop numpy views before closing the mapping
+        self._hdr = self._data = None
+        try:
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+    # ---------------
+    # Producer
+    # ---------------
+    def push(self, reading) -> int:
+        """Write one reading (dict or Reading); returns its sequence number."""
+        seq = int(self._hdr[2])
+        row = self._data[seq % self.capacity]
+        row[:] = np.nan
+        get = reading.get
+        chans = get("transducers") or ()
+        for k, i in self._col.items():
+            v = get(k)
+            if v is None and k.startswith("transducer_"):
+                try:
+                    v = chans[int(k[11:])]
+                except (IndexError, ValueError, TypeError):
+                    v = None
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                row[i] = v
+        self._hdr[2] = seq + 1          # publish after the row is complete
+        return seq
+
+    # ---------------
+    # Consumer
+    # ---------------
+    def read_since(self, seq: int, max_rows: Optional[int] = None) -> Tuple[np.ndarray, int, int]:
+        """
+        Rows written after sequence `seq`. Returns (rows[n, ncols], new_seq, dropped)
+        where dropped counts rows that were overwritten before they could be read.
+        """
+        end = int(self._hdr[2])
+        start = max(seq, end - self.capacity)
+        if max_rows is not None:
+            start = max(start, end - int(max_rows))
+        dropped = start - seq
+        n = end - start
+        if n <= 0:
+            return np.empty((0, len(self.fields))), end, max(0, dropped)
+        idx = np.arange(start, end) % self.capacity
+        rows = self._data[idx].copy()
+        # anything the producer lapped while we copied is unreliable: drop it. Row
+        # hdr - capacity counts too, its slot is the one push() may be writing now.
+        lapped = min(n, int(self._hdr[2]) - self.capacity - start + 1)
+        if lapped > 0:
+            rows = rows[lapped:]
+            dropped += lapped
+        return rows, end, dropped
+
+    def rows_to_readings(self, rows: np.ndarray, stage_names: Optional[Dict[int, str]] = None) -> List[dict]:
+        """Ring rows back into reading dicts (NaN → None, transducer_i → transducers list)."""
+        out = []
+        tcols = [(i, k) for k, i in self._col.items() if k.startswith("transducer_")]
+        for r in rows:
+            d = {}
+            for k, i in self._col.items():
+                v = float(r[i])
+                d[k] = None if math.isnan(v) else v
+            chans = [d.pop(k) for _, k in tcols]
+            while chans and chans[-1] is None:
+                chans.pop()
+            d["transducers"] = chans
+            if d.get("stage_index") is not None:
+                d["stage_index"] = int(d["stage_index"])
+                if stage_names:
+                    d["stage_name"] = stage_names.get(d["stage_index"])
+            ts = d.get("timestamp")
+            if ts is not None:
+                d["date"] = time.strftime("%Y-%m-%d", time.localtime(ts))
+            out.append(d)
+        return out
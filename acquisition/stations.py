@@ -0,0 +1,205 @@
+# acquisition/stations.py
+import os
+import time
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from acquisition.acq_process import RemoteTestManager
+from acquisition.test_journal import find_unfinished_journal
+
+# Station states shown in the overview
+IDLE, RUNNING, FINISHED, FAILED, ABORTED = "Idle", "Running", "Finished", "Failed", "Aborted"
+
+
+class Station:
+    """
+    One test station: a named device set (rig spec) and, while a test runs,
+    the RemoteTestManager whose process owns those devices.
+    """
+
+    def __init__(self, name: str, rig_spec: dict, run_dir: Optional[str] = None):
+        self.name = name
+        self.rig_spec = dict(rig_spec or {})
+        self.run_dir = run_dir or os.path.join("runs", name)
+        self.test_config: Optional[dict] = None
+        self.manager: Optional[RemoteTestManager] = None
+        self.state = IDLE
+        self.restarts = 0
+        self.started_ts: Optional[float] = None
+        self.last_reading: Optional[dict] = None
+        self.stage_name = ""
+
+    def is_running(self) -> bool:
+        return self.state == RUNNING
+
+    def age_s(self) -> Optional[float]:
+        """Seconds since this station's process was last heard from."""
+        m = self.manager
+        if m is None or m.last_seen is None:
+            return None
+        return time.monotonic() - m.last_seen
+
+
+class StationSupervisor(QObject):
+    """
+    Runs several stations side by side, each isolated in its own acquisition
+    process (see acq_process.run_acquisition_process).
+
+    start_test() launches a station's process; a process that dies mid-test
+    is restarted up to `max_restarts` times and resumes from its journal.
+    The GUI only sees station_changed/station_reading; readings from all
+    stations arrive through their shared-memory rings on the GUI thread.
+    """
+
+    station_changed = pyqtSignal(str)            # station name (state/stage/restart changed)
+    station_reading = pyqtSignal(str, object)    # station name, ReadingBatch
+
+    def __init__(self, log=print, max_restarts: int = 3, stale_after_s: float = 10.0):
+        super().__init__()
+        self.log = log or (lambda *a, **k: None)
+        self.max_restarts = int(max_restarts)
+        self.stale_after_s = float(stale_after_s)
+        self.stations: Dict[str, Station] = {}
+        self._monitor = QTimer(self)
+        self._monitor.setInterval(1000)
+        self._monitor.timeout.connect(self._check_stations)
+
+    # ---------------
+    # Stations
+    # ---------------
+    def add_station(self, name: str, rig_spec: dict, run_dir: Optional[str] = None) -> Station:
+        if name in self.stations:
+            raise ValueError(f"Station '{name}' already exists")
+        st = Station(name, rig_spec, run_dir)
+        self.stations[name] = st
+        self.station_changed.emit(name)
+        return st
+
+    def remove_station(self, name: str) -> bool:
+        st = self.stations.get(name)
+        if st is None or st.is_running():
+            return False
+        del self.stations[name]
+        self.station_changed.emit(name)
+        return True
+
+    def names(self) -> List[str]:
+        return list(self.stations)
+
+    def load(self, specs: List[dict]):
+        """Stations from prefs: [{"name", "rig": {...}, optional "run_dir"}]."""
+        for d in specs or []:
+            try:
+                self.add_station(d["name"], d.get("rig") or {}, d.get("run_dir"))
+            except (KeyError, ValueError) as e:
+                self.log(f"[!] Skipping station entry {d!r}: {e}")
+
+    # ---------------
+    # Tests
+    # ---------------
+    def start_test(self, name: str, test_config: dict) -> bool:
+        st = self.stations.get(name)
+        if st is None:
+            self.log(f"[✗] Unknown station '{name}'.")
+            return False
+        if st.is_running():
+            self.log(f"[✗] Station '{name}' is already running a test.")
+            return False
+        cfg = dict(test_config)
+        cfg.setdefault("run_dir", st.run_dir)
+        cfg["interactive"] = False
+        st.test_config = cfg
+        st.restarts = 0
+        st.started_ts = time.time()
+        self._launch(st, cfg)
+        return True
+
+    def manager(self, name: str) -> Optional[RemoteTestManager]:
+        st = self.stations.get(name)
+        return st.manager if st else None
+
+    def next_stage(self, name: str):
+        m = self.manager(name)
+        if m is not None:
+            m.next_stage()
+
+    def stop_stage(self, name: str):
+        m = self.manager(name)
+        if m is not None:
+            m.stop_stage()
+
+    def abort(self, name: str):
+        m = self.manager(name)
+        if m is not None:
+            m.abort()
+
+    def shutdown(self):
+        """Abort every running station and wait for the processes to exit."""
+        self._monitor.stop()
+        for st in self.stations.values():
+            if st.manager is not None:
+                st.manager.shutdown()
+                st.manager = None
+            if st.state == RUNNING:
+                st.state = ABORTED
+
+    # ---------------
+    # Internals
+    # ---------------
+    def _launch(self, st: Station, cfg: dict):
+        log = lambda msg, _n=st.name: self.log(f"[{_n}] {msg}")
+        m = RemoteTestManager(st.rig_spec, cfg, log=log)
+        m.readings_batch.connect(lambda batch, _st=st: self._on_batch(_st, batch))
+        m.stage_changed.connect(lambda name, _st=st: self._on_stage(_st, name))
+        m.test_finished.connect(lambda _st=st, _m=m: self._on_finished(_st, _m))
+        st.manager = m
+        st.state = RUNNING
+        m.start()
+        if not self._monitor.isActive():
+            self._monitor.start()
+        self.station_changed.emit(st.name)
+
+    def _on_batch(self, st: Station, batch):
+        if len(batch):
+            st.last_reading = batch.last
+        self.station_reading.emit(st.name, batch)
+
+    def _on_stage(self, st: Station, name: str):
+        st.stage_name = name
+        self.station_changed.emit(st.name)
+
+    def _on_finished(self, st: Station, m: RemoteTestManager):
+        if st.manager is not m:
+            return
+        st.manager = None
+        if not m.exited_unexpectedly:
+            st.state = FINISHED
+            self.station_changed.emit(st.name)
+            return
+        if st.restarts >= self.max_restarts:
+            self.log(f"[✗] Station '{st.name}' failed {st.restarts + 1} times; giving up.")
+            st.state = FAILED
+            self.station_changed.emit(st.name)
+            return
+        st.restarts += 1
+        state = find_unfinished_journal(st.test_config.get("run_dir", st.run_dir))
+        cfg = dict(st.test_config)
+        if state is not None:
+            cfg["resume_journal"] = state.path
+        self.log(f"[!] Restarting station '{st.name}' (attempt {st.restarts}/{self.max_restarts})"
+                 + (" from its journal." if state is not None else "."))
+        # give the OS a moment to release the device handles of the dead process
+        QTimer.singleShot(1000, lambda: self._launch(st, cfg))
+
+    def _check_stations(self):
+        running = False
+        for st in self.stations.values():
+            if not st.is_running():
+                continue
+            running = True
+            age = st.age_s()
+            if age is not None and age > self.stale_after_s:
+                self.station_changed.emit(st.name)      # overview marks it stale
+        if not running:
+            self._monitor.stop()
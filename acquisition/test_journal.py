@@ -0,0 +1,164 @@
+# acquisition/test_journal.py
+import glob
+import json
+import os
+import threading
+import time
+from typing import List, Optional
+
+
+class TestJournal:
+    """
+    Write-ahead journal for a running test (JSON lines, one record per line).
+
+    Record kinds:
+      header      test config + stage plan + run-log path (first line)
+      event       TEST_START / STAGE_START / STAGE_END / PAUSE / RESUME / ...
+      plan        full stage plan after a live edit/add/remove
+      checkpoint  stage index + elapsed clocks + run-log row count
+      end         test finished or aborted (journal is complete)
+
+    Every record is flushed and fsync'd before write() returns, so the file
+    survives a crash or reboot. Readings themselves go to the run log
+    (acquisition/run_log.py); checkpoints reference its row count.
+    """
+
+    def __init__(self, path: str, log=print):
+        self.path = str(path)
+        self.log = log or (lambda *a, **k: None)
+        self._lock = threading.Lock()
+        self._fh = None
+
+    def open(self, append: bool = False):
+        d = os.path.dirname(self.path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        self._fh = open(self.path, "a" if append else "w", encoding="utf-8")
+        return self
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                except Exception:
+                    pass
+                self._fh = None
+
+    def is_open(self) -> bool:
+        return self._fh is not None
+
+    def write(self, kind: str, **record):
+        if self._fh is None:
+            return
+        rec = {"kind": kind, "wall_ts": record.pop("wall_ts", None) or time.time()}
+        rec.update(record)
+        line = json.dumps(rec, default=str) + "\n"
+        with self._lock:
+            if self._fh is None:
+                return
+            try:
+                self._fh.write(line)
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+            except Exception as e:
+                self.log(f"[!] Journal write failed: {e}")
+
+
+class JournalState:
+    """Test state rebuilt by replaying a journal."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.header: dict = {}
+        self.stages: List[dict] = []
+        self.events: List[dict] = []
+        self.checkpoint: Optional[dict] = None
+        self.finished = False
+
+    @property
+    def config(self) -> dict:
+        return dict(self.header.get("config") or {})
+
+    @property
+    def run_log_path(self) -> Optional[str]:
+        return self.header.get("run_log_path")
+
+    @property
+    def test_start_ts(self) -> Optional[float]:
+        return self.header.get("test_start_ts")
+
+    @property
+    def stage_index(self) -> int:
+        """Stage that was running when the journal stopped."""
+        if self.checkpoint is not None:
+            return int(self.checkpoint.get("stage_index", 0))
+        for ev in reversed(self.events):
+            if ev.get("event") in ("STAGE_START", "STAGE_RESUME"):
+                return int(ev.get("stage_index", 0))
+        return 0
+
+    @property
+    def stage_elapsed_s(self) -> float:
+        return float((self.checkpoint or {}).get("stage_elapsed_s") or 0.0)
+
+    @property
+    def test_elapsed_s(self) -> float:
+        return float((self.checkpoint or {}).get("test_elapsed_s") or 0.0)
+
+    def stage_completed(self, index: int) -> bool:
+        for ev in reversed(self.events):
+            if ev.get("stage_index") != index:
+                continue
+            if ev.get("event") == "STAGE_END":
+                return True
+            if ev.get("event") in ("STAGE_START", "STAGE_RESUME"):
+                return False
+        return False
+
+
+def load_journal(path: str) -> JournalState:
+    """Replay a journal file (a torn last line from a crash is ignored)."""
+    st = JournalState(path)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            kind = rec.pop("kind", None)
+            if kind == "header":
+                st.header = rec
+                st.stages = list(rec.get("stages") or [])
+            elif kind == "event":
+                st.events.append(rec)
+            elif kind == "plan":
+                st.stages = list(rec.get("stages") or [])
+            elif kind == "checkpoint":
+                st.checkpoint = rec
+            elif kind == "end":
+                st.finished = True
+    return st
+
+
+def find_unfinished_journal(run_dir: str) -> Optional[JournalState]:
+    """Newest journal in run_dir that never reached its 'end' record."""
+    paths = sorted(glob.glob(os.path.join(run_dir, "*.journal.jsonl")), key=os.path.getmtime, reverse=True)
+    for p in paths:
+        try:
+            st = load_journal(p)
+        except Exception:
+            continue
+        if st.header and not st.finished:
+            return st
+    return None
+
+
+def close_journal(state: JournalState, reason: str = "abandoned"):
+    """Mark an unfinished journal as ended (e.g. the user declined to resume)."""
+    j = TestJournal(state.path).open(append=True)
+    try:
+        j.write("end", reason=reason)
+    finally:
+        j.close()
+    state.finished = True
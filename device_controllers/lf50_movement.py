@@ -1,8 +1,12 @@
 import usb.core
 import usb.util
-import struct
 import time
 
+from ftd2xx_controllers.gds_framing import (
+    crc16_gds_bytes, position_frame, velocity_frame, LF50_PRE_DISPLACEMENT, LF50_PRE_VELOCITY,
+    LF50_DIR_POSITIVE, LF50_DIR_NEGATIVE, LF50_CLEANUP_DISPLACEMENT, LF50_CLEANUP_VELOCITY, LF50_STOP
+)
+
 class LF50Mover:
     def __init__(self, device, log=print):
         if device is None:
@@ -13,35 +17,18 @@ class LF50Mover:
         self.should_stop = False
 
     def crc16_gds(self, data: bytes) -> bytes:
-        crc = 0x4489
-        for b in data:
-            crc ^= (b << 8)
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = ((crc << 1) ^ 0x1021) & 0xFFFF
-                else:
-                    crc = (crc << 1) & 0xFFFF
-        return crc.to_bytes(2, 'big')
+        return crc16_gds_bytes(data)
 
     def send_payload(self, payload):
-        self.log(f"[TX] Writing: {payload.hex()}")
         self.dev.write(0x02, payload, timeout=100)
 
     def send_displacement(self, position_mm: float):
         self.should_stop = False  # Reset flag at start
 
-        float_val = position_mm / 1000
-        float_bytes = struct.pack('<f', float_val)
-        self.log(f"[debug] {position_mm} mm → {float_val} m → bytes: {float_bytes.hex()}")
-        payload_body = b'\x0b\x14' + float_bytes
-        crc_val = self.crc16_gds(payload_body)
-        payload_part_3 = b'\xff\xff' + b'gds' + bytes([len(payload_body)]) + payload_body + crc_val
+        payload_part_3 = position_frame(position_mm)
 
         # First 2 pre-motion commands
-        for payload in [
-            bytes.fromhex("ffff676473060014010000001df5"),
-            bytes.fromhex("ffff676473040e1401000f6e")
-        ]:
+        for payload in LF50_PRE_DISPLACEMENT:
             if self.should_stop:
                 self.log("[!] Movement aborted before motion payload.")
                 return
@@ -61,11 +48,7 @@ class LF50Mover:
             return
 
         # Remaining cleanup payloads
-        for payload in [
-            bytes.fromhex("ffff676473020114a02d"),
-            bytes.fromhex("ffff6764730209142984"),
-            bytes.fromhex("ffffffffffffffffffffffffffffffff")
-        ]:
+        for payload in LF50_CLEANUP_DISPLACEMENT:
             if self.should_stop:
                 self.log("[!] Aborted during cleanup sequence.")
                 return
@@ -75,27 +58,17 @@ class LF50Mover:
         self.log(f"[✓] Axial displacement command finished for {position_mm:.2f} mm.")
 
     def stop_motion(self):
-        stop_payload = bytes.fromhex("ffff676473020116806f")
-        self.send_payload(stop_payload)
+        self.send_payload(LF50_STOP)
         time.sleep(0.1)  # Give firmware time to “unlock” for stop
-        self.send_payload(stop_payload)
+        self.send_payload(LF50_STOP)
         self.log("[→] Sent LF50 stop command (x2)")
         self.should_stop = True
 
     def send_velocity(self, velocity: float):
-        float_velocity = velocity / 60000.0
-        float_bytes = struct.pack('<f', float_velocity)
-        #self.log(f"[debug] {position_mm} mm → {float_val} m → bytes: {float_bytes.hex()}")
-        payload_body = b'\x0d\x14' + float_bytes
-        crc_val = self.crc16_gds(payload_body)
-        payload_part_3 = b'\xff\xff' + b'gds' + bytes([len(payload_body)]) + payload_body + crc_val
+        payload_part_3 = velocity_frame(velocity)
 
-        # First 2 pre-motion commands
-        for payload in [
-            bytes.fromhex("ffff676473060014010000001df5"),
-            bytes.fromhex("ffff676473042014050056be"),
-            bytes.fromhex("ffff676473040e1401000f6e"),
-        ]:
+        # First 3 pre-motion commands
+        for payload in LF50_PRE_VELOCITY:
             if self.should_stop:
                 self.log("[!] Movement aborted before motion payload.")
                 return
@@ -104,11 +77,7 @@ class LF50Mover:
 
         # Direction of movement
 
-        if (velocity > 0):
-            direction_payload = bytes.fromhex("ffff676473060b14161f583d9b67")
-        else:
-            direction_payload = bytes.fromhex("ffff676473060b1409eedcbdc698")
-        self.send_payload(direction_payload)
+        self.send_payload(LF50_DIR_POSITIVE if velocity > 0 else LF50_DIR_NEGATIVE)
         time.sleep(0.05)
 
         # Main movement payload
@@ -124,10 +93,7 @@ class LF50Mover:
             return
 
         # Remaining cleanup payloads
-        for payload in [
-            bytes.fromhex("ffff676473021a147fa4"),
-            bytes.fromhex("ffffffffffffffffffffffffffffffff")
-        ]:
+        for payload in LF50_CLEANUP_VELOCITY:
             if self.should_stop:
                 self.log("[!] Aborted during cleanup sequence.")
                 return
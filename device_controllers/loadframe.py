@@ -22,9 +22,11 @@ class LoadFrameController:
     MIN_VELOCITY = -90.0
     MAX_VELOCITY = 90.0
 
-    def __init__(self, log=print, baud=1_200_000):
+    def __init__(self, log=print, baud=1_200_000, frame_gap_s: float = 0.05, decode_telemetry: bool = False):
         self.log = log
         self._baud = baud
+        self._frame_gap_s = float(frame_gap_s)
+        self._decode_telemetry = bool(decode_telemetry)     # unverified register map, opt-in
         self._impl: Optional[FTLoadFrameController] = None
 
         self._lf_min_pos = -50.0
@@ -46,7 +48,8 @@ class LoadFrameController:
         serial = (
             _serial_from_usb_dev(src) if hasattr(src, "iSerialNumber") else str(src)
         )
-        self._impl = FTLoadFrameController(log=self.log, baud=self._baud)
+        self._impl = FTLoadFrameController(log=self.log, baud=self._baud, frame_gap_s=self._frame_gap_s,
+                                           decode_telemetry=self._decode_telemetry)
         ok = self._impl.connect(serial)
         if ok:
             self.log(f"[✓] LF50 (FTDI) connected: {serial}")
@@ -89,6 +92,35 @@ class LoadFrameController:
         if self._impl and hasattr(self._impl, "set_motion_limits"):
             self._impl.set_motion_limits(self._lf_min_pos, self._lf_max_pos, self._lf_max_vel)
 
+    # --- telemetry (polled by the FTDI driver's I/O thread) ---
+    def get_cached_position(self, max_age_s: float = 0.5):
+        return self._impl.get_cached_position(max_age_s) if self._impl else None
+
+    def get_cached_position_sample(self, max_age_s: float = 0.5):
+        return self._impl.get_cached_position_sample(max_age_s) if self._impl else None
+
+    def get_cached_velocity(self, max_age_s: float = 0.5):
+        return self._impl.get_cached_velocity(max_age_s) if self._impl else None
+
+    def read_position_mm(self, timeout_s: float = 0.3):
+        return self._impl.read_position_mm(timeout_s) if self._impl else None
+
+    def wait_for_update(self, timeout: float = 1.0) -> bool:
+        return self._impl.wait_for_update(timeout) if self._impl else False
+
+    def telemetry(self) -> dict:
+        return self._impl.telemetry() if self._impl else {}
+
+    @property
+    def position_read_ts(self):
+        return getattr(self._impl, "position_read_ts", None)
+
+    def set_frame_gap(self, gap_s: float):
+        """Gap between the frames of a command sequence (the GDSLab capture used 50 ms)."""
+        self._frame_gap_s = float(gap_s)
+        if self._impl and hasattr(self._impl, "set_frame_gap"):
+            self._impl.set_frame_gap(self._frame_gap_s)
+
     def get_motion_limits(self):
         if self._impl and hasattr(self._impl, "get_motion_limits"):
             return self._impl.get_motion_limits()
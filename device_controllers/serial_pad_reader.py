@@ -2,8 +2,20 @@ import serial
 import time
 import threading
 
+from acquisition.profiling import profile_point
+
 class SerialPadReader:
-    def __init__(self, port, calibration=None, log=print):
+    """
+    SerialPad (4800 baud) reader.
+
+    A background thread owns the port and scans continuously (SS + 8 lines),
+    publishing timestamped channel snapshots. Consumers read the latest one with
+    get_cached_channels(max_age_s) or block for a fresh one with
+    wait_for_next_scan(timeout), so the scan rate is set by the baud rate and
+    not by how many callers ask.
+    """
+
+    def __init__(self, port, calibration=None, log=print, auto_start=True):
         self.ser = serial.Serial(
             port=port,
             baudrate=4800,
@@ -16,7 +28,17 @@ class SerialPadReader:
         self._assignments = {}  # {ch: {"role": str, "sensor": str}}
         self._sensors = {}
         self.log = log
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()          # serializes port access
+
+        # latest scan snapshot (guarded by _scan_cond)
+        self._scan_cond = threading.Condition()
+        self._last_values = None
+        self._last_ts = 0.0                    # monotonic time of last good scan
+        self._scan_seq = 0
+        self._reader_thread = None
+        self._reader_run = False
+        if auto_start:
+            self.start_reader()
 
     def convert_adc_to_eng_units(self, adc_output, cal):
         return (((adc_output / cal["adc_range"]) * cal["full_scale_mv"]) * cal["sensitivity"]) + cal["soft_zero_offset"]
@@ -52,12 +74,112 @@ class SerialPadReader:
     def get_sensors(self) -> dict:
         return dict(self._sensors)
 
+    # ---------------
+    # Background scanning
+    # ---------------
+    def start_reader(self):
+        if self._reader_thread and self._reader_thread.is_alive():
+            return
+        self._reader_run = True
+        self._reader_thread = threading.Thread(target=self._reader_loop, name="serialpad-reader", daemon=True)
+        self._reader_thread.start()
+
+    def stop_reader(self):
+        self._reader_run = False
+        th = self._reader_thread
+        if th and th.is_alive() and th is not threading.current_thread():
+            th.join(timeout=1.5)
+        self._reader_thread = None
+        with self._scan_cond:
+            self._scan_cond.notify_all()
+
+    def is_reader_running(self) -> bool:
+        th = self._reader_thread
+        return bool(th and th.is_alive() and self._reader_run)
+
+    def _reader_loop(self):
+        fails = 0
+        while self._reader_run:
+            profile_point()
+            values, ts = self._scan(settle_s=0.0)
+            if values is None or all(v is None for v in values):
+                fails += 1
+                if fails == 1 or fails % 50 == 0:
+                    self.log(f"[!] SerialPad scan failed ({fails}x)")
+                time.sleep(0.2)   # don't spin on a dead port
+                continue
+            fails = 0
+            self._publish(values, ts)
+
+    def _publish(self, values, ts=None):
+        with self._scan_cond:
+            self._last_values = list(values)
+            self._last_ts = ts if ts is not None else time.monotonic()
+            self._scan_seq += 1
+            self._scan_cond.notify_all()
+
+    def get_cached_channels(self, max_age_s: float = 0.5):
+        """Latest scanned channels, or None if older than max_age_s (or none yet)."""
+        with self._scan_cond:
+            if self._last_values is None or (time.monotonic() - self._last_ts) > max_age_s:
+                return None
+            return list(self._last_values)
+
+    def get_cached_channels_sample(self, max_age_s: float = 0.5):
+        """(channels, monotonic acquisition ts) or None if stale / no scan yet."""
+        with self._scan_cond:
+            if self._last_values is None or (time.monotonic() - self._last_ts) > max_age_s:
+                return None
+            return list(self._last_values), self._last_ts
+
+    def get_last_scan_ts(self) -> float:
+        """Monotonic timestamp of the latest good scan (0.0 if none)."""
+        return self._last_ts
+
+    def wait_for_next_scan(self, timeout: float = 1.0):
+        """Block until a scan newer than the current one lands; None on timeout."""
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._scan_cond:
+            seq = self._scan_seq
+            while self._scan_seq == seq:
+                left = deadline - time.monotonic()
+                if left <= 0 or not self._reader_run:
+                    return None
+                self._scan_cond.wait(left)
+            return list(self._last_values)
+
+    # ---------------
+    # Port I/O
+    # ---------------
     def read_channels(self):
+        """
+        Backwards-compatible read. With the reader running this returns the
+        latest snapshot (waiting for the next scan if it is stale) and never
+        touches the port; otherwise it does one blocking scan.
+        """
+        if self.is_reader_running():
+            vals = self.get_cached_channels(1.0)
+            if vals is None:
+                vals = self.wait_for_next_scan(1.5)
+            return vals if vals is not None else [None] * 8
+        vals, ts = self._scan(settle_s=0.2)
+        if vals is not None and not all(v is None for v in vals):
+            self._publish(vals, ts)
+        return vals if vals is not None else [None] * 8
+
+    def _scan(self, settle_s: float = 0.0):
+        """
+        One SS request + 8 channel lines (readline blocks on the port timeout).
+        Returns (values, ts): ts is the monotonic midpoint of the scan, the
+        best single acquisition time for channels sampled across it.
+        """
         with self._lock:
             try:
                 self.ser.reset_input_buffer()
+                t_req = time.monotonic()
                 self.ser.write(b'SS\r\n')
-                time.sleep(0.2)
+                if settle_s > 0:
+                    time.sleep(settle_s)
 
                 values = []
                 for ch in range(8):
@@ -89,12 +211,14 @@ class SerialPadReader:
 
                     values.append(round(eng_val, 3))
 
-                return values
+                return values, 0.5 * (t_req + time.monotonic())
 
             except Exception as e:
                 self.log(f"[✗] Serial read failed: {e}")
-                return [None] * 8
+                return None, None
 
 
     def close(self):
-        self.ser.close()
+        self.stop_reader()
+        with self._lock:
+            self.ser.close()
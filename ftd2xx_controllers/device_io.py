@@ -0,0 +1,298 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from acquisition.loop_timing import LoopStats
+from acquisition.profiling import profile_point
+
+# Queue priorities (lower runs first)
+PRIORITY_STOP = 0           # stop / abort: see DeviceIO.preempt()
+PRIORITY_COMMAND = 10       # setpoints, motion sequences
+PRIORITY_BACKGROUND = 20    # housekeeping (purge at stage handoff, diagnostics)
+
+
+class CommandHandle:
+    """
+    Completion handle for a command sequence queued on a DeviceIO thread.
+
+    Truthy as soon as the sequence is accepted, so callers that only check
+    the return value keep working; wait() blocks for the outcome.
+    """
+
+    def __init__(self, label: str, steps, gap_s: float, key: Optional[str] = None,
+                 priority: int = PRIORITY_COMMAND, on_done: Optional[Callable] = None):
+        self.label = label
+        self.frames = tuple(steps)
+        self.gap_s = float(gap_s)
+        self.key = key
+        self.priority = int(priority)
+        self.on_done = on_done
+        self.ok: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.cancelled = False
+        self.result = None              # return value of the last callable step
+        self.sent = 0                   # steps done
+        self.gaps_s = []                # measured start-to-start gaps between steps
+        self.submitted_ts = time.monotonic()
+        self.started_ts: Optional[float] = None
+        self.finished_ts: Optional[float] = None
+        self._done = threading.Event()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[bool]:
+        """True/False once finished (False = failed or cancelled), None on timeout."""
+        return self.ok if self._done.wait(timeout) else None
+
+    @property
+    def queue_delay_s(self) -> Optional[float]:
+        return None if self.started_ts is None else self.started_ts - self.submitted_ts
+
+    def _finish(self, ok: bool, error: Optional[str] = None, cancelled: bool = False):
+        if self._done.is_set():
+            return
+        self.ok, self.error, self.cancelled = ok, error, cancelled
+        self.finished_ts = time.monotonic()
+        self._done.set()
+        if self.on_done is not None:
+            try:
+                self.on_done(self)
+            except Exception:
+                pass
+
+    def __repr__(self):
+        state = "pending" if not self.done() else ("ok" if self.ok else ("cancelled" if self.cancelled else "failed"))
+        return f"CommandHandle({self.label!r}, {self.sent}/{len(self.frames)} steps, {state})"
+
+
+class DeviceIO:
+    """
+    The one thread that talks to a device handle.
+
+    Writes: submit() queues a command sequence (frames to write, or
+    callables to run on this thread, e.g. a purge) and returns a
+    CommandHandle at once. Sequences run in priority order, FIFO within a
+    priority, with their steps `gap_s` apart (start to start, measured into
+    `timing`). A sequence submitted with a `key` supersedes a queued, not yet
+    started one with the same key (only the newest setpoint matters).
+
+    Reads: `poll()` is called between steps and whenever the queue is idle
+    (every `poll_idle_s`), so RX never waits behind a long sequence and a
+    sequence never waits behind RX for more than one non-blocking poll.
+    While polls keep failing (device unplugged), the idle interval backs off
+    up to `poll_backoff_max_s` and only the first failure is logged; queued
+    commands still wake the thread at once.
+
+    Stop: preempt() cancels everything queued, ends the running sequence
+    before its next step and runs its own steps next. Its latency is one
+    step or poll in progress plus a thread wake-up, wherever the previous
+    sequence happened to be.
+    """
+
+    def __init__(self, write: Callable[[bytes], object], poll: Optional[Callable[[], bool]] = None,
+                 name: str = "device-io", frame_gap_s: float = 0.05, poll_idle_s: float = 0.01,
+                 poll_backoff_max_s: float = 0.5, log=print):
+        self._write = write
+        self._poll = poll
+        self.name = name
+        self.frame_gap_s = float(frame_gap_s)
+        self.poll_idle_s = float(poll_idle_s)
+        self.poll_backoff_max_s = max(self.poll_idle_s, float(poll_backoff_max_s))
+        self.poll_failures = 0          # consecutive failed polls
+        self.log = log or (lambda *a, **k: None)
+        self.timing = LoopStats(f"io.{name}", self.frame_gap_s)
+        self.stop_latency_s: Optional[float] = None     # submit -> first stop step written, last preempt()
+
+        self._cond = threading.Condition()
+        self._heap = []                 # (priority, seq, handle)
+        self._seq = itertools.count()
+        self._current: Optional[CommandHandle] = None
+        self._next_due = 0.0
+        self._last_step_ts: Optional[float] = None
+        self._gen = 0                   # bumped by cancel(); the running sequence checks it between steps
+        self._cur_gen = 0
+        self._run = True
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    # ---------------
+    # Public API
+    # ---------------
+    def submit(self, steps: Iterable, label: str = "", gap_s: Optional[float] = None,
+               key: Optional[str] = None, priority: int = PRIORITY_COMMAND,
+               on_done: Optional[Callable] = None) -> CommandHandle:
+        h = CommandHandle(label, steps, self.frame_gap_s if gap_s is None else gap_s, key, priority, on_done)
+        superseded = []
+        with self._cond:
+            if not self._run:
+                superseded.append(h)
+            else:
+                if key is not None:
+                    superseded = [e[2] for e in self._heap if e[2].key == key]
+                    if superseded:
+                        self._heap = [e for e in self._heap if e[2].key != key]
+                        heapq.heapify(self._heap)
+                heapq.heappush(self._heap, (h.priority, next(self._seq), h))
+                self._cond.notify_all()
+        for q in superseded:
+            q._finish(False, error="superseded" if q is not h else "device closed", cancelled=True)
+        return h
+
+    def preempt(self, steps: Iterable, label: str = "stop", gap_s: Optional[float] = None,
+                on_done: Optional[Callable] = None) -> CommandHandle:
+        """Cancel everything and run `steps` next (stop / abort)."""
+        self.cancel()
+        return self.submit(steps, label=label, gap_s=gap_s, priority=PRIORITY_STOP, on_done=on_done)
+
+    def cancel(self):
+        """Drop queued sequences and end the running one before its next step."""
+        with self._cond:
+            dropped = [e[2] for e in self._heap]
+            self._heap = []
+            self._gen += 1
+            self._cond.notify_all()
+        for h in dropped:
+            h._finish(False, error="cancelled", cancelled=True)
+
+    def call(self, fn: Callable, label: str = "", priority: int = PRIORITY_BACKGROUND,
+             timeout: Optional[float] = 1.0):
+        """Run fn on the I/O thread and wait; returns the handle (result in handle.result)."""
+        h = self.submit((fn,), label=label or getattr(fn, "__name__", "call"), priority=priority)
+        if threading.current_thread() is not self._thread:
+            h.wait(timeout)
+        return h
+
+    def set_frame_gap(self, gap_s: float):
+        self.frame_gap_s = max(0.0, float(gap_s))
+        self.timing.target_period_s = self.frame_gap_s
+
+    def is_idle(self) -> bool:
+        with self._cond:
+            return self._current is None and not self._heap
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._current is not None or self._heap:
+                rem = None if deadline is None else deadline - time.monotonic()
+                if rem is not None and rem <= 0:
+                    return False
+                self._cond.wait(rem)
+        return True
+
+    def is_running(self) -> bool:
+        return self._run
+
+    def close(self, timeout: float = 1.0):
+        """Let queued sequences finish (up to `timeout`), then stop the thread."""
+        if threading.current_thread() is not self._thread:
+            self.wait_idle(timeout)
+        self.cancel()
+        with self._cond:
+            self._run = False
+            self._cond.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=timeout)
+
+    # ---------------
+    # I/O thread
+    # ---------------
+    def _loop(self):
+        while True:
+            profile_point()
+            with self._cond:
+                if not self._run:
+                    return
+                h = self._current
+                if h is not None and self._cur_gen != self._gen:
+                    self._current = None
+                    self._cond.notify_all()
+                    h._finish(False, error="cancelled", cancelled=True)
+                    continue
+                if h is None and self._heap:
+                    h = self._current = heapq.heappop(self._heap)[2]
+                    self._cur_gen = self._gen
+                    h.started_ts = time.monotonic()
+                    self._next_due = h.started_ts
+                    self._last_step_ts = None
+                due = self._next_due if h is not None else None
+
+            now = time.monotonic()
+            if h is not None and now >= due:
+                self._step(h)
+            got = False
+            if self._poll is not None:
+                got = self._poll_once()
+            with self._cond:
+                if not self._run:
+                    return
+                h = self._current
+                if h is not None and self._cur_gen != self._gen:
+                    continue                    # cancelled: handle it at the top without waiting
+                if h is None and self._heap:
+                    continue
+                if got:
+                    continue                    # more RX may be queued; poll again right away
+                wait = self._poll_wait_s() if self._poll is not None else None
+                if h is not None:
+                    rem = self._next_due - time.monotonic()
+                    wait = rem if wait is None else min(wait, rem)
+                if wait is None or wait > 0:
+                    self._cond.wait(wait)
+
+    def _poll_once(self) -> bool:
+        try:
+            got = bool(self._poll())
+        except Exception as e:
+            self.poll_failures += 1
+            if self.poll_failures == 1:
+                self.log(f"[!] {self.name}: read failed: {e} (retrying quietly)")
+            return False
+        if self.poll_failures:
+            self.log(f"[i] {self.name}: reads recovered after {self.poll_failures} failed polls")
+            self.poll_failures = 0
+        return got
+
+    def _poll_wait_s(self) -> float:
+        """Idle poll interval: poll_idle_s, doubling from 50 ms per consecutive failure up to the cap."""
+        if not self.poll_failures:
+            return self.poll_idle_s
+        return min(self.poll_backoff_max_s, max(self.poll_idle_s, 0.05 * 2 ** min(self.poll_failures - 1, 10)))
+
+    def _step(self, h: CommandHandle):
+        step = h.frames[h.sent]
+        t = time.monotonic()
+        try:
+            if callable(step):
+                h.result = step()
+            else:
+                self._write(step)
+        except Exception as e:
+            self.log(f"[!] {self.name}: {h.label or 'command'} failed: {e}")
+            with self._cond:
+                self._current = None
+                self._cond.notify_all()
+            h._finish(False, error=str(e))
+            return
+        if h.sent == 0 and h.priority == PRIORITY_STOP:
+            self.stop_latency_s = t - h.submitted_ts
+        if self._last_step_ts is not None:
+            gap = t - self._last_step_ts
+            h.gaps_s.append(gap)
+            if h.gap_s == self.frame_gap_s:
+                self.timing.record(gap, time.monotonic() - t)
+        self._last_step_ts = t
+        h.sent += 1
+        with self._cond:
+            if h.sent >= len(h.frames):
+                self._current = None
+                self._cond.notify_all()
+                done = True
+            else:
+                self._next_due = t + h.gap_s
+                done = False
+        if done:
+            h._finish(True)
@@ -0,0 +1,176 @@
+import struct
+
+# -------------------------
+# GDS frame layout
+# -------------------------
+#   ff ff | 67 64 73 ('gds') | len | body[len] | crc16 (big-endian, over body)
+#
+# CRC-16/CCITT (poly 0x1021, MSB first) with initial value 0x4489.
+
+CRC_SEED = 0x4489
+SYNC = b"\xff\xff"
+TAG = b"gds"
+
+
+def _make_crc_table(poly: int = 0x1021):
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFFFF if crc & 0x8000 else (crc << 1) & 0xFFFF
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _make_crc_table()
+
+
+def crc16_gds(data, seed: int = CRC_SEED) -> int:
+    """CRC of `data` (bytes, bytearray or memoryview) as an int, one table lookup per byte."""
+    crc = seed
+    table = _CRC_TABLE
+    for b in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ b]
+    return crc
+
+
+def crc16_gds_bytes(data, seed: int = CRC_SEED) -> bytes:
+    """CRC as the two big-endian bytes that end a frame."""
+    return crc16_gds(data, seed).to_bytes(2, "big")
+
+
+def encode_frame(body: bytes, sync: bool = True) -> bytes:
+    """Wrap a command body in a GDS frame (the STDDPC set-pressure frame goes without sync)."""
+    return (SYNC if sync else b"") + TAG + bytes((len(body),)) + body + crc16_gds_bytes(body)
+
+
+# -------------------------
+# Parameterized LF50 frames
+# -------------------------
+_CMD_F32 = struct.Struct("<2sf")
+CMD_POSITION = b"\x0b\x14"      # absolute position, float32 metres
+CMD_VELOCITY = b"\x0d\x14"      # velocity, float32 metres/second
+
+
+def position_frame(position_mm: float) -> bytes:
+    return encode_frame(_CMD_F32.pack(CMD_POSITION, position_mm / 1000.0))
+
+
+def velocity_frame(velocity_mm_per_min: float) -> bytes:
+    return encode_frame(_CMD_F32.pack(CMD_VELOCITY, velocity_mm_per_min / 60000.0))
+
+
+# -------------------------
+# Constant LF50 frames (as captured from GDSLab, decoded once)
+# -------------------------
+_h = bytes.fromhex
+LF50_PRE_DISPLACEMENT = (_h("ffff676473060014010000001df5"),
+                         _h("ffff676473040e1401000f6e"))
+LF50_PRE_VELOCITY = (_h("ffff676473060014010000001df5"),
+                     _h("ffff676473042014050056be"),
+                     _h("ffff676473040e1401000f6e"))
+LF50_DIR_POSITIVE = _h("ffff676473060b14161f583d9b67")
+LF50_DIR_NEGATIVE = _h("ffff676473060b1409eedcbdc698")
+LF50_FILLER = b"\xff" * 16
+LF50_CLEANUP_DISPLACEMENT = (_h("ffff676473020114a02d"),
+                             _h("ffff6764730209142984"),
+                             LF50_FILLER)
+LF50_CLEANUP_VELOCITY = (_h("ffff676473021a147fa4"),
+                         LF50_FILLER)
+LF50_STOP = _h("ffff676473020116806f")
+del _h
+
+# Received LF50 telemetry: body = register (2 B, same codes as the commands)
+# + little-endian value. UNVERIFIED: this map assumes the frame reports its
+# state on the command registers as float32 SI values; it has not been checked
+# against a capture, and if those frames are only echoes of the host's own
+# commands they carry targets, not measurements. Drivers decode it only when
+# asked to (FTLoadFrameController(decode_telemetry=True)); otherwise every
+# register is kept raw as status.
+LF50_TELEMETRY = {
+    0x140B: ("position_mm", 1000.0),          # metres -> mm
+    0x140D: ("velocity_mm_min", 60000.0),     # m/s -> mm/min
+}
+
+
+class GDSStreamFramer:
+    """
+    Incremental splitter for a received GDS byte stream:
+
+        ff ff 67 64 | type | len | body[len] | crc16 (big-endian, over body)
+
+    feed() appends a chunk to a carry-over buffer and hands every complete,
+    CRC-valid frame to `on_frame(type, buf, body_offset, body_len)` while the
+    bytes are still in the buffer (decode with struct.unpack_from; the buffer
+    is only valid during the call). A frame split across reads completes on
+    the next feed(). Counters:
+      frames          valid frames delivered
+      corrupt         frames whose CRC did not match (resynced past their sync)
+      dropped         partial frames discarded by reset() (e.g. on purge)
+      skipped_bytes   bytes between frames that were not part of any frame
+    """
+
+    SYNC = b"\xff\xff\x67\x64"
+    HEADER_LEN = 6
+    MAX_BUFFER = 4096         # runaway guard; a frame is at most 6 + 255 + 2 bytes
+
+    def __init__(self, check_crc: bool = True):
+        self.check_crc = bool(check_crc)
+        self._buf = bytearray()
+        self.frames = 0
+        self.corrupt = 0
+        self.dropped = 0
+        self.skipped_bytes = 0
+
+    def feed(self, data, on_frame) -> int:
+        """Consume a chunk; returns the number of valid frames it completed."""
+        buf = self._buf
+        buf += data
+        n_buf = len(buf)
+        pos = 0
+        got = 0
+        sync, hl = self.SYNC, self.HEADER_LEN
+        mv = memoryview(buf)
+        try:
+            while True:
+                i = buf.find(sync, pos)
+                if i < 0:
+                    # keep a possible partial sync at the tail
+                    keep = max(pos, n_buf - (len(sync) - 1))
+                    self.skipped_bytes += keep - pos
+                    pos = keep
+                    break
+                self.skipped_bytes += i - pos
+                pos = i
+                if i + hl > n_buf:
+                    break
+                n = buf[i + 5]
+                end = i + hl + n + 2
+                if end > n_buf:
+                    break                               # rest arrives with the next chunk
+                body = i + hl
+                if self.check_crc and crc16_gds(mv[body:body + n]) != (buf[end - 2] << 8 | buf[end - 1]):
+                    self.corrupt += 1
+                    pos = i + 2                         # resync after this sync word
+                    continue
+                self.frames += 1
+                got += 1
+                on_frame(buf[i + 4], buf, body, n)
+                pos = end
+        finally:
+            mv.release()
+        del buf[:pos]
+        if len(buf) > self.MAX_BUFFER:
+            self.skipped_bytes += len(buf)
+            buf.clear()
+        return got
+
+    def reset(self):
+        """Forget any partial frame (after an RX purge)."""
+        if self._buf.find(self.SYNC) >= 0:
+            self.dropped += 1
+        self._buf.clear()
+
+    def stats(self) -> dict:
+        return {"frames": self.frames, "corrupt": self.corrupt, "dropped": self.dropped,
+                "skipped_bytes": self.skipped_bytes, "buffered": len(self._buf)}
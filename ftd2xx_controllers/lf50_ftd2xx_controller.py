@@ -1,10 +1,34 @@
 import ftd2xx
-import time
 import struct
+import threading
+import time
+
+from ftd2xx_controllers.device_io import DeviceIO
+from ftd2xx_controllers.gds_framing import (
+    GDSStreamFramer, crc16_gds_bytes, position_frame, velocity_frame, LF50_PRE_DISPLACEMENT, LF50_PRE_VELOCITY,
+    LF50_DIR_POSITIVE, LF50_DIR_NEGATIVE, LF50_CLEANUP_DISPLACEMENT, LF50_CLEANUP_VELOCITY, LF50_STOP,
+    LF50_TELEMETRY
+)
+
+_REG_F32 = struct.Struct("<Hf")
 
 class FTLoadFrameController:
     """
     Load frame controller using FTDI D2XX interface, mirroring GDSLab LF50 sequence.
+
+    One device I/O thread (DeviceIO) owns the handle. It writes command
+    sequences: send_velocity / send_displacement return a CommandHandle right
+    away instead of sleeping between frames; handle.wait() blocks for the
+    outcome. The inter-frame gap is `frame_gap_s` (measured in io_timing).
+    stop_motion preempts: queued moves are dropped, a running one ends before
+    its next frame and the stop frames go out next.
+
+    Between frames the same thread polls RX, frames the incoming GDS stream
+    and keeps the latest registers with their acquisition times
+    (get_cached_status, telemetry(), wait_for_update). Position and velocity
+    (get_cached_position, read_position_mm) are decoded only with
+    decode_telemetry=True: the register map in gds_framing.LF50_TELEMETRY is
+    unverified, so by default nothing is published as a measured position.
     """
 
     MIN_POSITION_MM = -158.0
@@ -12,12 +36,27 @@ class FTLoadFrameController:
     MIN_VELOCITY = -90.0   # mm/min
     MAX_VELOCITY = 90.0    # mm/min
 
-    def __init__(self, log=print, baud=1200000, default_move_velocity_mm_min: float = 10.0):
+    STOP_GAP_S = 0.1       # the firmware wants the two stop frames apart
+
+    def __init__(self, log=print, baud=1200000, default_move_velocity_mm_min: float = 10.0,
+                 frame_gap_s: float = 0.05, decode_telemetry: bool = False):
         self.dev = None
         self.serial = None
         self.log = log
         self.baud = baud
         self.should_stop = False
+        self.frame_gap_s = float(frame_gap_s)
+        self.decode_telemetry = bool(decode_telemetry)
+        self._io = None
+
+        # telemetry cache, fed from the I/O thread
+        self._framer = GDSStreamFramer()
+        self._telemetry_cond = threading.Condition()
+        self._telemetry = {}               # name -> (value, monotonic ts)
+        self._status = {}                  # register -> raw body bytes (unmapped registers)
+        self._telemetry_seq = 0
+        self._chunk_read_ts = None
+        self.position_read_ts = None       # when the bytes behind the cached position were read
         self.default_move_velocity_mm_min = float(default_move_velocity_mm_min)  # NEW
 
         self._lf_min_pos = -50.0
@@ -104,24 +143,153 @@ class FTLoadFrameController:
                 self.dev.purge(1|2)
             self.log("[✓] Purged RX/TX")
 
+            try:
+                self.dev.setTimeouts(20, 20)
+            except Exception:
+                pass
+            self._reset_framer()
+
+            if self._io is not None:
+                self._io.close()
+            self._io = DeviceIO(self.dev.write, poll=self._poll_rx, name=f"lf50-io-{self.serial}",
+                                frame_gap_s=self.frame_gap_s, log=self.log)
             return True
         except Exception as e:
             self.log(f"[✗] FTDI init failed: {e}")
             return False
 
+    def close(self):
+        if self._io is not None:
+            self._io.close()
+            self._io = None
+        try:
+            if self.dev is not None:
+                self.dev.close()
+        except Exception:
+            pass
+        finally:
+            self.dev = None
+
+    def set_frame_gap(self, gap_s: float):
+        """Inter-frame gap (s) for command sequences."""
+        self.frame_gap_s = max(0.0, float(gap_s))
+        if self._io is not None:
+            self._io.set_frame_gap(self.frame_gap_s)
+
+    # ---------------
+    # Telemetry
+    # ---------------
+    def _poll_rx(self) -> bool:
+        """One non-blocking RX read on the I/O thread; True if bytes arrived."""
+        n = self.dev.getQueueStatus()
+        if not n:
+            return False
+        raw = self.dev.read(min(int(n), 4096))
+        if not raw:
+            return False
+        self._chunk_read_ts = time.monotonic()
+        self._framer.feed(raw, self._on_frame)
+        return True
+
+    def _on_frame(self, ftype: int, buf, off: int, n: int):
+        if n < 2:
+            return
+        reg = buf[off] | (buf[off + 1] << 8)
+        now = time.monotonic()
+        mapped = LF50_TELEMETRY.get(reg) if self.decode_telemetry else None
+        with self._telemetry_cond:
+            if mapped is not None and n >= _REG_F32.size:
+                name, scale = mapped
+                self._telemetry[name] = (_REG_F32.unpack_from(buf, off)[1] * scale, now)
+                if name == "position_mm":
+                    self.position_read_ts = self._chunk_read_ts or now
+            else:
+                self._status[reg] = bytes(buf[off + 2:off + n])
+                self._telemetry["status"] = ((reg, self._status[reg]), now)
+            self._telemetry_seq += 1
+            self._telemetry_cond.notify_all()
+
+    def _reset_framer(self):
+        # the framer is only touched on the I/O thread once it runs
+        self._framer.reset()
+
+    def _cached(self, name: str, max_age_s: float):
+        got = self._telemetry.get(name)
+        if got is None or (time.monotonic() - got[1]) > max_age_s:
+            return None
+        return got
+
+    def get_cached_position(self, max_age_s: float = 0.5):
+        """Latest position (mm), or None if missing/stale."""
+        got = self._cached("position_mm", max_age_s)
+        return got[0] if got else None
+
+    def get_cached_position_sample(self, max_age_s: float = 0.5):
+        """(mm, monotonic acquisition ts) or None if missing/stale."""
+        return self._cached("position_mm", max_age_s)
+
+    def get_cached_velocity(self, max_age_s: float = 0.5):
+        """Latest velocity (mm/min) reported by the frame, or None."""
+        got = self._cached("velocity_mm_min", max_age_s)
+        return got[0] if got else None
+
+    def get_cached_status(self, max_age_s: float = 0.5):
+        """(register, raw bytes) of the latest status frame, or None."""
+        got = self._cached("status", max_age_s)
+        return got[0] if got else None
+
+    def telemetry(self) -> dict:
+        """Snapshot: {name: (value, monotonic ts)}, status registers and framer counters."""
+        with self._telemetry_cond:
+            out = dict(self._telemetry)
+            out["registers"] = dict(self._status)
+        out["framer"] = self._framer.stats()
+        return out
+
+    def wait_for_update(self, timeout: float = 1.0) -> bool:
+        """Block until a new telemetry frame lands; False on timeout."""
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._telemetry_cond:
+            seq = self._telemetry_seq
+            while self._telemetry_seq == seq:
+                left = deadline - time.monotonic()
+                if left <= 0 or self._io is None:
+                    return False
+                self._telemetry_cond.wait(left)
+            return True
+
+    def read_position_mm(self, timeout_s: float = 0.3):
+        """Cached position if fresh, else wait up to timeout_s for the next position frame."""
+        deadline = time.monotonic() + max(0.0, float(timeout_s))
+        while True:
+            pos = self.get_cached_position(max_age_s=0.2)
+            if pos is not None:
+                return pos
+            left = deadline - time.monotonic()
+            if left <= 0 or not self.wait_for_update(left):
+                return self.get_cached_position(max_age_s=1.0)
+
+    @property
+    def io_timing(self):
+        """Measured inter-frame gaps (LoopStats), or None before connect."""
+        return self._io.timing if self._io is not None else None
+
     def crc16_gds(self, data: bytes) -> bytes:
         """
         CRC16-CCITT with initial 0x4489, produce two-byte big-endian.
         """
-        crc = 0x4489
-        for b in data:
-            crc ^= (b << 8)
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = ((crc << 1) ^ 0x1021) & 0xFFFF
-                else:
-                    crc = (crc << 1) & 0xFFFF
-        return crc.to_bytes(2, 'big')
+        return crc16_gds_bytes(data)
+
+    def _on_done(self, label: str, done_msg: str):
+        def on_done(h):
+            if h.ok:
+                self.log(done_msg)
+            elif h.cancelled and h.error != "superseded":
+                self.log(f"[!] {label} aborted after {h.sent}/{len(h.frames)} frames.")
+        return on_done
+
+    def _submit(self, frames, label: str, done_msg: str, key=None, gap_s=None):
+        return self._io.submit(frames, label=label, key=key, gap_s=gap_s, on_done=self._on_done(label, done_msg))
 
     def get_motion_limits(self):
         """Return (min_pos_mm, max_pos_mm, max_vel_mm_min) currently enforced."""
@@ -129,10 +297,9 @@ class FTLoadFrameController:
 
     def send_displacement(self, position_mm: float, velocity_mm_per_min: float | None = None):
         """
-        Absolute move with LF50 framing.
-        We prime motion exactly like the velocity command: 3 pre-frames + direction,
-        then send the 0x0B14 position payload. Accepts optional velocity just to
-        pick a direction if the caller supplies it.
+        Absolute move with LF50 framing: 2 pre-frames, the 0x0B14 position
+        payload, then 3 cleanup frames. The velocity argument is accepted for
+        API compatibility; the frame carries no speed.
         """
         if not (self._lf_min_pos <= float(position_mm) <= self._lf_max_pos):
             self.log(f"[!] Position {position_mm:.2f} mm outside {self._lf_min_pos:.2f}…{self._lf_max_pos:.2f} mm"); 
@@ -141,59 +308,14 @@ class FTLoadFrameController:
             self.log("[✗] Device not connected")
             return False
 
-        # choose direction: prefer provided velocity sign; else use target position sign
-        v = self.default_move_velocity_mm_min if velocity_mm_per_min is None else float(velocity_mm_per_min)
-        move_positive = (v > 0) if (velocity_mm_per_min is not None and v != 0) else (position_mm >= 0)
-
         self.should_stop = False
 
-        # ---- Build main position payload (same as before) ----
-        float_val = position_mm / 1000.0
-        float_bytes = struct.pack('<f', float_val)
-        self.log(f"[debug] {position_mm} mm → {float_val} m → bytes: {float_bytes.hex()}")
-        payload_body = b'\x0b\x14' + float_bytes
-        crc_val = self.crc16_gds(payload_body)
-        main_frame = b'\xff\xffgds' + bytes([len(payload_body)]) + payload_body + crc_val
-
-        # ---- 1) Pre-motion: use the SAME 3 frames as send_velocity ----
-        pre_frames = [
-            bytes.fromhex("ffff676473060014010000001df5"),
-            bytes.fromhex("ffff676473040e1401000f6e"),
-        ]
-        for frame in pre_frames:
-            if self.should_stop:
-                self.log("[!] Displacement aborted before pre-commands finished.")
-                return False
-            self.dev.write(frame)
-            self.log(f"[→] Pre-command: {frame.hex()}")
-            time.sleep(0.05)
-
-        # ---- 3) Main position payload ----
-        if self.should_stop:
-            self.log("[!] Displacement aborted before sending main payload.")
-            return False
-        self.dev.write(main_frame)
-        self.log(f"[→] Displacement: {position_mm:.2f} mm → {main_frame.hex()}")
-        time.sleep(0.05)
-
-        # ---- 4) Cleanup (keep your existing three frames) ----
-        cleanup = [
-            bytes.fromhex("ffff676473020114a02d"),
-            bytes.fromhex("ffff6764730209142984"),
-            bytes.fromhex("ffffffffffffffffffffffffffffffff"),
-        ]
-        for frame in cleanup:
-            if self.should_stop:
-                self.log("[!] Aborted during cleanup.")
-                return False
-            self.dev.write(frame)
-            self.log(f"[→] Cleanup: {frame.hex()}")
-            time.sleep(0.05)
-
-        self.log(f"[✓] Axial displacement command finished for {position_mm:.2f} mm.")
-        return True
+        # 1) pre-motion frames, 2) 0x0B14 position payload, 3) cleanup
+        frames = LF50_PRE_DISPLACEMENT + (position_frame(position_mm),) + LF50_CLEANUP_DISPLACEMENT
+        return self._submit(frames, "Displacement", key="motion",
+                            done_msg=f"[✓] Axial displacement command finished for {position_mm:.2f} mm.")
 
-    def send_velocity(self, velocity: float) -> bool:
+    def send_velocity(self, velocity: float):
         """
         Send axial velocity sequence:
         1) Three pre-motion commands
@@ -213,92 +335,38 @@ class FTLoadFrameController:
         vel = max(self.MIN_VELOCITY, min(self.MAX_VELOCITY, velocity))
         self.should_stop = False
 
-        # Build main velocity payload
-        # velocity input in mm/min -> convert to m/s
-        m_per_s = vel / 60000.0
-        float_bytes = struct.pack('<f', m_per_s)
-        self.log(f"[debug] {vel} mm/min → {m_per_s} m/s → bytes: {float_bytes.hex()}")
-        payload_body = b'\x0d\x14' + float_bytes
-        crc_val = self.crc16_gds(payload_body)
-        main_frame = b'\xff\xffgds' + bytes([len(payload_body)]) + payload_body + crc_val
-
-        # 1) Pre-motion commands
-        pre_frames = [
-            bytes.fromhex("ffff676473060014010000001df5"),
-            bytes.fromhex("ffff676473042014050056be"),
-            bytes.fromhex("ffff676473040e1401000f6e"),
-        ]
-        for frame in pre_frames:
-            if self.should_stop:
-                self.log("[!] Velocity aborted before motion payload.")
-                return False
-            self.dev.write(frame)
-            self.log(f"[→] Pre-command: {frame.hex()}")
-            time.sleep(0.05)
-
-        # 2) Direction payload
-        dir_frame = (bytes.fromhex("ffff676473060b14161f583d9b67") 
-                     if vel > 0 else 
-                     bytes.fromhex("ffff676473060b1409eedcbdc698"))
-        self.dev.write(dir_frame)
-        self.log(f"[→] Direction: {dir_frame.hex()}")
-        time.sleep(0.05)
-
-        # 3) Main velocity payload
-        if self.should_stop:
-            self.log("[!] Velocity aborted before sending main payload.")
-            return False
-        self.dev.write(main_frame)
-        self.log(f"[→] Velocity: {vel:.2f} mm/min → {main_frame.hex()}")
-        time.sleep(0.05)
-
-        # 4) Cleanup
-        cleanup = [
-            bytes.fromhex("ffff676473021a147fa4"),
-            bytes.fromhex("ffffffffffffffffffffffffffffffff"),
-        ]
-        for frame in cleanup:
-            if self.should_stop:
-                self.log("[!] Aborted during cleanup.")
-                return False
-            self.dev.write(frame)
-            self.log(f"[→] Cleanup: {frame.hex()}")
-            time.sleep(0.05)
-
-        self.log(f"[✓] Axial velocity command finished for {vel:.2f} mm/min.")
-        return True
+        frames = (LF50_PRE_VELOCITY + (LF50_DIR_POSITIVE if vel > 0 else LF50_DIR_NEGATIVE,)
+                  + (velocity_frame(vel),) + LF50_CLEANUP_VELOCITY)
+        return self._submit(frames, "Velocity", key="motion",
+                            done_msg=f"[✓] Axial velocity command finished for {vel:.2f} mm/min.")
 
     def stop_motion(self):
         """
         Send stop command twice to halt any ongoing motion and set the stop flag.
+        Queued motion commands are dropped and a running one ends before its
+        next frame; the stop frames go out first.
         """
         if not self.dev:
             self.log("[✗] Device not connected")
             return False
 
-        stop_payload = bytes.fromhex("ffff676473020116806f")
-        # Send twice with a small delay
-        try:
-            self.dev.write(stop_payload)
-            time.sleep(0.1)
-            self.dev.write(stop_payload)
-            self.log("[→] Sent LF50 stop command (x2)")
-            self.should_stop = True
-            return True
-        except Exception as e:
-            self.log(f"[✗] Failed to send stop command: {e}")
-            return False
+        self.should_stop = True
+        return self._io.preempt((LF50_STOP, LF50_STOP), label="Stop", gap_s=self.STOP_GAP_S,
+                                on_done=self._on_done("Stop", "[→] Sent LF50 stop command (x2)"))
 
     def is_ready(self): return self.dev is not None
     def stop(self): return getattr(self, "stop_motion", lambda: None)()
     def send_stop(self): return self.stop()
     def purge(self):
-        if not self.dev: return False
-        try:
-            self.dev.purge(ftd2xx.defines.PURGE_RX | ftd2xx.defines.PURGE_TX)
-            self.log("[✓] Purged RX/TX")
-            return True
-        except Exception as e:
-            self.log(f"[!] Purge failed: {e}")
+        if not self.dev or self._io is None: return False
+        h = self._io.call(self._purge_now, label="Purge")
+        if not h.ok:
+            self.log(f"[!] Purge failed: {h.error or 'timed out'}")
             return False
+        self.log("[✓] Purged RX/TX")
+        return True
+
+    def _purge_now(self):
+        self.dev.purge(ftd2xx.defines.PURGE_RX | ftd2xx.defines.PURGE_TX)
+        self._reset_framer()
 
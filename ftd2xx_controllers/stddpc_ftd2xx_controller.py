@@ -6,6 +6,9 @@ from typing import Optional
 import ftd2xx
 import threading, time as _time
 
+from ftd2xx_controllers.device_io import DeviceIO
+from ftd2xx_controllers.gds_framing import GDSStreamFramer, crc16_gds_bytes, encode_frame
+
 # -------------------------
 # D2XX: load and bind funcs
 # -------------------------
@@ -49,6 +52,9 @@ FT_Read.restype   = FT_STATUS
 FT_SetTimeouts = d2xx.FT_SetTimeouts
 FT_SetTimeouts.argtypes = [c_void_p, c_ulong, c_ulong]
 FT_SetTimeouts.restype  = FT_STATUS
+FT_GetQueueStatus = d2xx.FT_GetQueueStatus
+FT_GetQueueStatus.argtypes = [c_void_p, ctypes.POINTER(c_ulong)]
+FT_GetQueueStatus.restype  = FT_STATUS
 
 
 FT_OPEN_BY_SERIAL_NUMBER = 1
@@ -61,6 +67,11 @@ REG_PRESSURE_IDS = {0x5319, 0x2053}
 REG_VOLUME_IDS   = {0x5305}
 VOL_QUANTA = 0.0626  # mm³ per count
 
+# Var frame body: sub-code, var id, raw int32 count
+_VAR_BODY = struct.Struct("<HHi")
+_SET_PRESSURE_BODY = struct.Struct("<HHHi")
+
+
 class SimpleCalibrationManager:
     def __init__(self, pressure_quanta: float, pressure_offset: float):
         self.q = pressure_quanta
@@ -69,6 +80,14 @@ class SimpleCalibrationManager:
         return {"pressure_quanta": self.q, "pressure_offset": self.o}
 
 class STDDPC_FTDI_HandleController:
+    """
+    STDDPC over raw D2XX. One device I/O thread (DeviceIO) owns the handle:
+    it writes queued setpoints and, between them, polls RX (non-blocking,
+    FT_GetQueueStatus first) into the stream framer and the value cache.
+    Callers never touch the handle; read_* wait on the cache and stop()
+    preempts anything queued.
+    """
+
     def __init__(self, log=print, calibration_manager=None):
         # Canonical FTDI handle and connection state
         self.h: c_void_p = c_void_p()         # null handle by default
@@ -82,20 +101,52 @@ class STDDPC_FTDI_HandleController:
 
         self._last_pressure_kpa = None
         self._last_volume_mm3   = None
-        self._last_ts           = 0.0
-        self._reader_thread     = None
-        self._reader_run        = False
-
-        self._io_lock = threading.Lock()
+        self._last_ts           = 0.0      # newest of the two below (legacy)
+        self._last_pressure_ts  = 0.0      # monotonic acquisition time per variable
+        self._last_volume_ts    = 0.0
+        # when the bytes behind each cached value came off the bus (latency tracing)
+        self._chunk_read_ts     = None
+        self.pressure_read_ts   = None
+        self.volume_read_ts     = None
+        self._update_cond       = threading.Condition()   # notified on every cached value
+
+        self._io: Optional[DeviceIO] = None
+        # frames can straddle FT_Read chunks; only the I/O thread feeds the framer
+        self._framer = GDSStreamFramer()
+        self._parsed = None
 
     def get_cached_pressure(self, max_age_s: float = 0.5):
         if self._last_pressure_kpa is None: return None
-        return self._last_pressure_kpa if (_time.monotonic() - self._last_ts) <= max_age_s else None
+        return self._last_pressure_kpa if (_time.monotonic() - self._last_pressure_ts) <= max_age_s else None
 
     def get_cached_volume(self, max_age_s: float = 0.5):
         if self._last_volume_mm3 is None:
             return None
-        return self._last_volume_mm3 if (_time.monotonic() - self._last_ts) <= max_age_s else None
+        return self._last_volume_mm3 if (_time.monotonic() - self._last_volume_ts) <= max_age_s else None
+
+    def get_cached_pressure_sample(self, max_age_s: float = 0.5):
+        """(kPa, monotonic acquisition ts) or None if missing/stale."""
+        v, ts = self._last_pressure_kpa, self._last_pressure_ts
+        return (v, ts) if v is not None and (_time.monotonic() - ts) <= max_age_s else None
+
+    def get_cached_volume_sample(self, max_age_s: float = 0.5):
+        """(mm³, monotonic acquisition ts) or None if missing/stale."""
+        v, ts = self._last_volume_mm3, self._last_volume_ts
+        return (v, ts) if v is not None and (_time.monotonic() - ts) <= max_age_s else None
+
+    def _stamp_pressure(self, val: float):
+        self._last_pressure_kpa = float(val)
+        self._last_pressure_ts = self._last_ts = _time.monotonic()
+        self.pressure_read_ts = self._chunk_read_ts or self._last_pressure_ts
+        with self._update_cond:
+            self._update_cond.notify_all()
+
+    def _stamp_volume(self, val: float):
+        self._last_volume_mm3 = float(val)
+        self._last_volume_ts = self._last_ts = _time.monotonic()
+        self.volume_read_ts = self._chunk_read_ts or self._last_volume_ts
+        with self._update_cond:
+            self._update_cond.notify_all()
 
     def set_command_limits(self, lo_kpa: float, hi_kpa: float):
         self._limit_min = float(lo_kpa)
@@ -107,12 +158,7 @@ class STDDPC_FTDI_HandleController:
 
     @staticmethod
     def _crc_ccitt_0x1021(payload: bytes, seed: int = 0x4489) -> bytes:
-        crc = seed
-        for b in payload:
-            crc ^= (b & 0xFF) << 8
-            for _ in range(8):
-                crc = ((crc << 1) ^ 0x1021) & 0xFFFF if crc & 0x8000 else (crc << 1) & 0xFFFF
-        return bytes([(crc >> 8) & 0xFF, crc & 0xFF])
+        return crc16_gds_bytes(payload, seed)
 
     def connect(self, serial: str, baud: int = 1_250_000):
         # reset state
@@ -143,6 +189,7 @@ class STDDPC_FTDI_HandleController:
 
 
         self._check(FT_Purge(self.h, FT_PURGE_RX | FT_PURGE_TX), "FT_Purge")
+        self._reset_framer()
         self.log("[✓] Purged RX/TX")
 
         if self.calibration_manager is None:
@@ -153,15 +200,17 @@ class STDDPC_FTDI_HandleController:
         self.connected = True
         self.serial = serial
 
-        self._reader_run = True
-        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
-        self._reader_thread.start()
+        if self._io is not None:
+            self._io.close()
+        # setpoints are single frames, so no inter-frame gap
+        self._io = DeviceIO(self._write, poll=self._poll_rx, name=f"stddpc-io-{serial}",
+                            frame_gap_s=0.0, log=self.log)
         return True
 
     def close(self):
-        self._reader_run = False
-        if self._reader_thread and self._reader_thread.is_alive():
-            self._reader_thread.join(timeout=0.5)
+        if self._io is not None:
+            self._io.close()
+            self._io = None
 
         try:
             if self.is_ready():
@@ -174,27 +223,33 @@ class STDDPC_FTDI_HandleController:
             self.handle = self.h
             self.log("[✓] Handle closed")
 
-    def _reader_loop(self):
-        while self._reader_run and self.is_ready():
-            try:
-                raw = self._read_chunk(96 * 4)
-                if raw:
-                    self._parse_stddpc_vars(raw)
-                    _time.sleep(0.001)  # yield a tick when busy
-                else:
-                    _time.sleep(0.02)
-            except Exception:
-                _time.sleep(0.05)
+    def _poll_rx(self) -> bool:
+        """One RX poll on the I/O thread: read only what is queued, so it never blocks."""
+        if not self.is_ready():
+            return False
+        n = c_ulong(0)
+        self._check(FT_GetQueueStatus(self.h, byref(n)), "FT_GetQueueStatus")
+        if not n.value:
+            return False
+        raw = self._read_chunk(min(int(n.value), 96 * 4))
+        if not raw:
+            return False
+        self._chunk_read_ts = _time.monotonic()
+        self._parse_stddpc_vars(raw)
+        return True
 
     def _write(self, data: bytes) -> int:
         buf = (c_ubyte * len(data)).from_buffer_copy(data)
         written = c_ulong(0)
-        with self._io_lock:
-            self._check(FT_Write(self.h, buf, len(data), byref(written)), "FT_Write")
+        self._check(FT_Write(self.h, buf, len(data), byref(written)), "FT_Write")
         return int(written.value)
 
     def send_pressure(self, pressure_kpa: float):
-        if not self._ensure_ready("send_pressure"):
+        """
+        Queue a setpoint on the I/O thread; returns its CommandHandle (truthy)
+        or False if rejected. A newer setpoint replaces one not yet written.
+        """
+        if not self._ensure_ready("send_pressure") or self._io is None:
             return False
             # enforce limits if present
         lo = getattr(self, "_limit_min", None)
@@ -211,15 +266,13 @@ class STDDPC_FTDI_HandleController:
             target_count = int(round((pressure_kpa + offset) / quanta))
 
             frame = self.build_set_pressure_frame(target_count)
-            wrote = self._write(frame)
-            self.log(f"[→] Pressure set: {pressure_kpa:.3f} kPa | counts={target_count} | {wrote}B")
-
-            # small read window to pull device diagnostics right after the set
-            deadline = _time.monotonic() + 0.03
-            while _time.monotonic() < deadline:
-                self._read_and_parse_once()  # updates cache if frames arrive
-                _time.sleep(0.005)
-            return True
+
+            def on_done(h):
+                if h.ok:
+                    self.log(f"[→] Pressure set: {pressure_kpa:.3f} kPa | counts={target_count} | {len(frame)}B")
+                elif not h.cancelled:
+                    self.log(f"[!] send_pressure failed: {h.error}")
+            return self._io.submit((frame,), label="Set pressure", key="setpoint", on_done=on_done)
         except Exception as e:
             self.log(f"[!] send_pressure failed: {e}")
             return False
@@ -231,106 +284,77 @@ class STDDPC_FTDI_HandleController:
           body (10B): 0x0200, mode=1, channel=0, int32 count (LE)
           crc: CCITT 0x1021 with seed 0x4489 over the 10-byte body
         """
-        body = bytearray(10)
-        body[0:2] = (0x0200).to_bytes(2, 'little')   # command/subcode
-        body[2:4] = (1).to_bytes(2, 'little')        # mode
-        body[4:6] = (0).to_bytes(2, 'little')        # channel 0 = pressure
-        body[6:10] = int(target_count).to_bytes(4, 'little', signed=True)
+        # command/subcode 0x0200, mode 1, channel 0 = pressure, int32 count
+        body = _SET_PRESSURE_BODY.pack(0x0200, 1, 0, int(target_count))
+        return encode_frame(body, sync=False)        # 'gds' + 0x0a + body + crc
 
-        crc = self._crc_ccitt_0x1021(bytes(body), seed=0x4489)
-        header = b"\x67\x64\x73\x0a"                 # 4B: 'gd s' + body length=0x0a
-        return header + bytes(body) + crc
+    def _wait_fresh(self, ts_attr: str, value_attr: str, timeout_s: float):
+        """Wait for a value acquired after this call (the I/O thread reads it)."""
+        if not self.is_ready() or self._io is None:
+            return None
+        since = _time.monotonic()
+        deadline = since + max(0.0, float(timeout_s))
+        with self._update_cond:
+            while getattr(self, ts_attr) <= since:
+                left = deadline - _time.monotonic()
+                if left <= 0 or self._io is None:
+                    return None
+                self._update_cond.wait(left)
+            return getattr(self, value_attr)
 
     def read_pressure_kpa(self, timeout_s: float = 0.6):
-        if not self.is_ready():
-            return None
-        deadline = _time.monotonic() + timeout_s
-        try:
-            while _time.monotonic() < deadline:
-                for v in self._read_and_parse_once():
-                    if v["var_id_int"] in REG_PRESSURE_IDS:
-                        val = float(v["engineering_value"])
-                        self._last_pressure_kpa = val
-                        self._last_ts = _time.monotonic()
-                        return val
-                _time.sleep(0.01)
-            return None
-        except Exception as e:
-            self.log(f"[!] read_pressure_kpa failed: {e}")
-            return None
+        return self._wait_fresh("_last_pressure_ts", "_last_pressure_kpa", timeout_s)
 
     def read_volume_mm3(self, timeout_s: float = 0.6):
-        if not self.is_ready():
-            return None
-        deadline = _time.monotonic() + timeout_s
-        try:
-            while _time.monotonic() < deadline:
-                for v in self._read_and_parse_once():
-                    if v["var_id_int"] in REG_VOLUME_IDS:
-                        val = float(v["engineering_value"])
-                        self._last_volume_mm3 = val
-                        self._last_ts = _time.monotonic()
-                        return val
-                _time.sleep(0.01)
-            return None
-        except Exception:
-            return None
+        return self._wait_fresh("_last_volume_ts", "_last_volume_mm3", timeout_s)
 
     def stop(self):
-        if not self._ensure_ready("stop"):
-            return False
-        try:
-            FT_Purge(self.h, FT_PURGE_RX | FT_PURGE_TX)
-            self.log("[→] STDDPC stop (purged RX/TX)")
-            return True
-        except Exception as e:
-            self.log(f"[!] stop failed: {e}")
+        """Drop queued setpoints and purge RX/TX ahead of anything else on the I/O thread."""
+        if not self._ensure_ready("stop") or self._io is None:
             return False
 
+        def on_done(h):
+            if h.ok:
+                self.log("[→] STDDPC stop (purged RX/TX)")
+            else:
+                self.log(f"[!] stop failed: {h.error}")
+        return self._io.preempt((self._purge_now,), label="Stop", on_done=on_done)
+
     def _read_chunk(self, max_len=384) -> bytes:
-        with self._io_lock:
-            buf = (c_ubyte * max_len)()
-            got = c_ulong(0)
-            self._check(FT_Read(self.h, buf, max_len, byref(got)), "FT_Read")
+        buf = (c_ubyte * max_len)()
+        got = c_ulong(0)
+        self._check(FT_Read(self.h, buf, max_len, byref(got)), "FT_Read")
         return bytes(buf[:int(got.value)])
 
     def _parse_stddpc_vars(self, data: bytes):
-        HEADER = b'\xff\xff\x67\x64'
-        WANT   = REG_PRESSURE_IDS | REG_VOLUME_IDS
-        out = []
-        i = 0
-        while i < len(data):
-            start = data.find(HEADER, i)
-            if start == -1:
-                break
-            next_start = data.find(HEADER, start + 4)
-            if next_start == -1:
-                next_start = len(data)
-            pkt = data[start:next_start]
-
-            if len(pkt) >= 14:
-                vid_le = int.from_bytes(pkt[8:10], "little")
-                vid_be = int.from_bytes(pkt[8:10], "big")
-                canonical = vid_le if vid_le in WANT else (vid_be if vid_be in WANT else None)
-                if canonical is not None:
-                    signed32 = int.from_bytes(pkt[10:14], "little", signed=True)
-                    if canonical in REG_PRESSURE_IDS:
-                        eng_val = signed32 * self.calib["pressure_quanta"] - self.calib["pressure_offset"]
-                        self._last_pressure_kpa = float(eng_val)
-                        self._last_ts = _time.monotonic()
-                    elif canonical in REG_VOLUME_IDS:
-                        eng_val = signed32 * VOL_QUANTA
-                        self._last_volume_mm3 = float(eng_val)
-                        self._last_ts = _time.monotonic()
-                    else:
-                        eng_val = None
-                    out.append({"var_id_int": canonical, "engineering_value": eng_val})
-            i = next_start
+        self._parsed = out = []
+        self._framer.feed(data, self._on_frame)
+        self._parsed = None
         return out
 
-    def _read_and_parse_once(self):
-        raw = self._read_chunk(96 * 4)
-        return self._parse_stddpc_vars(raw) if raw else []
+    def _on_frame(self, ftype: int, buf, off: int, n: int):
+        if n < _VAR_BODY.size:
+            return
+        _sub, vid_le, signed32 = _VAR_BODY.unpack_from(buf, off)
+        vid_be = ((vid_le & 0xFF) << 8) | (vid_le >> 8)
+        if vid_le in REG_PRESSURE_IDS or vid_be in REG_PRESSURE_IDS:
+            canonical = vid_le if vid_le in REG_PRESSURE_IDS else vid_be
+            eng_val = signed32 * self.calib["pressure_quanta"] - self.calib["pressure_offset"]
+            self._stamp_pressure(eng_val)
+        elif vid_le in REG_VOLUME_IDS or vid_be in REG_VOLUME_IDS:
+            canonical = vid_le if vid_le in REG_VOLUME_IDS else vid_be
+            eng_val = signed32 * VOL_QUANTA
+            self._stamp_volume(eng_val)
+        else:
+            return
+        self._parsed.append({"var_id_int": canonical, "engineering_value": eng_val})
+
+    def _reset_framer(self):
+        self._framer.reset()
+
+    def frame_stats(self) -> dict:
+        """Stream framer counters: valid, corrupt (CRC) and dropped frames, skipped bytes."""
+        return self._framer.stats()
 
     def is_ready(self) -> bool:
         """Ready when we have a non-null FTDI handle and we’re marked connected."""
@@ -349,15 +373,19 @@ class STDDPC_FTDI_HandleController:
 
     def purge(self) -> bool:
         """Optional, but helpful so manager can purge at stage handoff."""
-        if not self.is_ready():
+        if not self.is_ready() or self._io is None:
             return False
-        try:
-            FT_Purge(self.h, FT_PURGE_RX | FT_PURGE_TX)
-            self.log("[✓] Purged RX/TX")
-            return True
-        except Exception as e:
-            self.log(f"[!] Purge failed: {e}")
+        h = self._io.call(self._purge_now, label="Purge")
+        if not h.ok:
+            self.log(f"[!] Purge failed: {h.error or 'timed out'}")
             return False
+        self.log("[✓] Purged RX/TX")
+        return True
+
+    def _purge_now(self):
+        # runs on the I/O thread, so no partial frame straddles the purge
+        self._check(FT_Purge(self.h, FT_PURGE_RX | FT_PURGE_TX), "FT_Purge")
+        self._reset_framer()
 
     ## RAMP FUNCTION ##
     def ramp_pressure(
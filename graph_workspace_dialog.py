@@ -15,15 +15,25 @@ class GraphWorkspaceDialog(QDialog):
     - Lets user pick X and one-or-more Y variables from historical data
     - Plots in a pyqtgraph view
     - Save current canvas to PNG
+
+    history_rows may be a list of reading dicts or a columnar ReadingStore
+    (anything with column()/keys()); a store is plotted without copying rows.
     """
     def __init__(self, history_rows, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Graph Workspace")
         self.resize(980, 640)
-        self.history = list(history_rows or [])
+        if hasattr(history_rows, "column"):
+            self.store = history_rows
+            self.history = []
+        else:
+            self.store = None
+            self.history = list(history_rows or [])
 
         # -------- Collect headers (union of keys) --------
         all_keys = set()
+        if self.store is not None:
+            all_keys.update(self.store.keys())
         for row in self.history:
             if isinstance(row, dict):
                 all_keys.update(row.keys())
@@ -36,6 +46,16 @@ class GraphWorkspaceDialog(QDialog):
         ctrls = QHBoxLayout()
         root.addLayout(ctrls)
 
+        # optional data ranges (whole run / one stage / since an event); see set_ranges()
+        self._ranges = []
+        self.lbl_range = QLabel("Data:")
+        self.cmb_range = QComboBox()
+        self.cmb_range.currentIndexChanged.connect(self._on_range_changed)
+        ctrls.addWidget(self.lbl_range)
+        ctrls.addWidget(self.cmb_range)
+        self.lbl_range.setVisible(False)
+        self.cmb_range.setVisible(False)
+
         # ---- choose numeric headers only for plotting
         self.numeric_headers = [k for k in self.headers if self._finite_count_for_key(k) >= 2]
 
@@ -151,6 +171,9 @@ class GraphWorkspaceDialog(QDialog):
             return np.nan
 
     def _finite_count_for_key(self, key):
+        if self.store is not None:
+            col = self.store.column(key)
+            return 0 if col is None else int(np.isfinite(col).sum())
         c = 0
         for r in self.history:
             if isinstance(r, dict):
@@ -165,6 +188,9 @@ class GraphWorkspaceDialog(QDialog):
         return c
 
     def _series(self, key):
+        if self.store is not None:
+            col = self.store.column(key)
+            return np.full(len(self.store), np.nan) if col is None else np.asarray(col, dtype=float)
         vals = []
         for r in self.history:
             v = r.get(key) if isinstance(r, dict) else None
@@ -249,6 +275,34 @@ class GraphWorkspaceDialog(QDialog):
             self.plot.plot(xx, yy, name=yk, pen=pen)
 
 
+    def set_ranges(self, ranges):
+        """
+        ranges: [(label, loader)] where loader() returns a store for that slice
+        of the run (e.g. one stage read straight from the run log). The first
+        entry should be the data the dialog was opened with.
+        """
+        self._ranges = list(ranges or [])
+        self.cmb_range.blockSignals(True)
+        self.cmb_range.clear()
+        self.cmb_range.addItems([label for label, _ in self._ranges])
+        self.cmb_range.blockSignals(False)
+        show = len(self._ranges) > 1
+        self.lbl_range.setVisible(show)
+        self.cmb_range.setVisible(show)
+
+    def _on_range_changed(self, i):
+        if not (0 <= i < len(self._ranges)):
+            return
+        try:
+            store = self._ranges[i][1]()
+        except Exception:
+            return
+        if store is None:
+            return
+        self.store = store
+        self.history = []
+        self._plot_selected()
+
     def _clear_plot(self):
         self.plot.clear()
         self.plot.addLegend()
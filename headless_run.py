@@ -0,0 +1,172 @@
+# headless_run.py
+"""
+Run a triaxial test without the GUI (lab server, SSH session, CI).
+
+    python headless_run.py plan.json --devices rig.json
+    python headless_run.py plan.json --sim --timeout-s 120
+
+plan.json holds the same keys the Test Setup page builds ("sample_id",
+"sampling_period_s", "sample_height_mm", ..., "stages": [StageData dicts]);
+a bare list of stage dicts is accepted too. rig.json names the devices
+({"lf": serial, "cell_pc": serial, "back_pc": serial, "serial_pad": "COM5",
+optional "lf_limits" and "serial_pad_config"}). Stages advance on their
+own; data goes to the run log under --run-dir.
+
+Stages that hold until the operator moves on (saturation, B check, shear,
+...) are stopped after "run_for_s" seconds when the stage dict has one, or
+after --stage-time-s otherwise.
+"""
+import argparse
+import json
+import signal
+import sys
+import time
+
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+from acquisition.rig import close_rig, load_test_plan, open_rig, open_sim_rig, tick_sim_rig
+from triaxial_test_manager import TriaxialTestManager
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Run a SoilMate test plan without the GUI.")
+    p.add_argument("plan", help="test plan JSON (test config with a 'stages' list)")
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument("--devices", help="rig JSON naming the device serials/ports")
+    src.add_argument("--sim", action="store_true", help="drive the built-in simulator instead of hardware")
+    p.add_argument("--run-dir", default=None, help="where run logs/journals go (default: plan's run_dir or ./runs)")
+    p.add_argument("--sample-id", default=None)
+    p.add_argument("--sampling-period-s", type=float, default=None)
+    p.add_argument("--stage-time-s", type=float, default=None,
+                   help="stop each stage after this many seconds unless its plan entry has run_for_s")
+    p.add_argument("--timeout-s", type=float, default=None, help="abort the test after this many seconds")
+    p.add_argument("--continue-on-missing-devices", action="store_true",
+                   help="start stages even if one of their devices is not ready")
+    p.add_argument("--status-every-s", type=float, default=10.0, help="status line interval (0 = off)")
+    p.add_argument("--quiet", action="store_true", help="only print warnings/errors")
+    return p
+
+
+def main(argv=None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    def log(msg):
+        msg = str(msg)
+        if args.quiet and not msg.startswith(("[✗]", "[!]")):
+            return
+        print(msg, flush=True)
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+
+    config = load_test_plan(args.plan)
+    if not config["stages"]:
+        log("[✗] Test plan has no stages.")
+        return 2
+    if args.run_dir:
+        config["run_dir"] = args.run_dir
+    if args.sample_id:
+        config["sample_id"] = args.sample_id
+    if args.sampling_period_s:
+        config["sampling_period_s"] = args.sampling_period_s
+    config["interactive"] = False
+    config["continue_on_missing_devices"] = args.continue_on_missing_devices
+    # nothing draws here: keep only a small in-memory window, the run log has the rest
+    config.setdefault("memory_window_rows", 2000)
+
+    if args.sim:
+        rig = open_sim_rig(log=log)
+    else:
+        with open(args.devices, "r", encoding="utf-8") as f:
+            rig = open_rig(json.load(f), log=log)
+
+    tm = TriaxialTestManager(rig.lf, rig.cell_pc, rig.back_pc, rig.serial_pad, config, log=log)
+    result = {"code": 0}
+
+    # no operator to press "Next Stage": advance as soon as a stage ends
+    def _on_stage_completed(_idx):
+        if tm.running and tm.current_stage_index + 1 < len(tm.stages):
+            QTimer.singleShot(0, tm.next_stage)
+    tm.stage_completed.connect(_on_stage_completed)
+    tm.test_finished.connect(lambda: QTimer.singleShot(0, app.quit))
+
+    # ... and end held stages after their time budget
+    run_for = config.pop("stage_run_for_s", [])
+    started = {"n": 0}
+
+    def _on_stage_started(_ts):
+        started["n"] += 1
+        idx, gen = tm.current_stage_index, started["n"]
+        limit = run_for[idx] if idx < len(run_for) and run_for[idx] is not None else args.stage_time_s
+        if not limit:
+            return
+
+        def _expire():
+            if tm.running and started["n"] == gen and tm.executor.is_busy():
+                log(f"[i] Stage time limit ({float(limit):.0f}s) reached; moving on.")
+                tm.next_stage()
+        QTimer.singleShot(int(float(limit) * 1000), _expire)
+    tm.stage_started.connect(_on_stage_started)
+
+    timers = []
+    if args.sim:
+        sim = QTimer()
+        sim.setInterval(100)
+        sim.timeout.connect(lambda: tick_sim_rig(rig, tm.stages[tm.current_stage_index]
+                                                 if 0 <= tm.current_stage_index < len(tm.stages) else None))
+        timers.append(sim)
+
+    if args.status_every_s and args.status_every_s > 0:
+        status = QTimer()
+        status.setInterval(int(args.status_every_s * 1000))
+
+        def _status():
+            r = tm.data_log.last()
+            stage = tm.stages[tm.current_stage_index].name if 0 <= tm.current_stage_index < len(tm.stages) else "—"
+            t = time.time() - (tm.test_start_ts or time.time())
+            extra = ""
+            if r:
+                extra = "  " + "  ".join(f"{k}={r.get(k):.3f}" for k in
+                                         ("cell_pressure_kpa", "back_pressure_kpa", "axial_load_kN")
+                                         if isinstance(r.get(k), (int, float)))
+            log(f"[i] t={t:8.1f}s  stage={stage}{extra}")
+        status.timeout.connect(_status)
+        timers.append(status)
+
+    if args.timeout_s:
+        def _timeout():
+            log(f"[!] Timeout after {args.timeout_s:.0f}s; aborting.")
+            result["code"] = 3
+            tm.abort()
+        QTimer.singleShot(int(args.timeout_s * 1000), _timeout)
+
+    # Ctrl+C / SIGTERM abort cleanly (the timer lets Python see the signal)
+    def _interrupt(*_):
+        log("[!] Interrupted; aborting test.")
+        result["code"] = 130
+        QTimer.singleShot(0, tm.abort)
+    signal.signal(signal.SIGINT, _interrupt)
+    try:
+        signal.signal(signal.SIGTERM, _interrupt)
+    except (AttributeError, ValueError):
+        pass
+    wake = QTimer()
+    wake.setInterval(250)
+    wake.timeout.connect(lambda: None)
+    timers.append(wake)
+
+    for t in timers:
+        t.start()
+    QTimer.singleShot(0, tm.start)
+    try:
+        app.exec_()
+    finally:
+        for t in timers:
+            t.stop()
+        close_rig(rig)
+    if tm.run_log_path:
+        print(f"Run log: {tm.run_log_path}", flush=True)
+    return result["code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
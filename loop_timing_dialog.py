@@ -0,0 +1,140 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, QTabWidget
+)
+from PyQt5.QtCore import Qt, QTimer
+
+from acquisition.latency_trace import TRACE_STAGES
+
+
+def _ms(v, digits=1):
+    return "—" if v is None else f"{v * 1000.0:.{digits}f}"
+
+
+def _hist_ms(v):
+    if v is None:
+        return "—"
+    return f">{5000:g}" if v == float("inf") else f"≤{v:g}"
+
+
+def _segment_order(name):
+    stage = name.split("→")[0]
+    return TRACE_STAGES.index(stage) if stage in TRACE_STAGES else len(TRACE_STAGES)
+
+
+def _table(columns):
+    t = QTableWidget(0, len(columns))
+    t.setHorizontalHeaderLabels(columns)
+    t.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+    t.horizontalHeader().setStretchLastSection(True)
+    t.verticalHeader().setVisible(False)
+    t.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    return t
+
+
+def _fill_row(table, r, cells):
+    for c, text in enumerate(cells):
+        item = table.item(r, c)
+        if item is None:
+            item = QTableWidgetItem()
+            item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter if c == 0 else Qt.AlignCenter)
+            table.setItem(r, c, item)
+        item.setText(text)
+
+
+class LoopTimingDialog(QDialog):
+    """
+    Live table of loop timing (acquisition tasks and stage control loops):
+    intended vs actual period, jitter percentiles, work time and overruns.
+    `registry` is a callable returning the current LoopTimingRegistry (or None);
+    the optional `latency` callable returns a LatencyTracer shown on a second tab
+    (sample age per pipeline segment, per device and per graph).
+    """
+
+    COLUMNS = ["Loop", "Target (ms)", "Mean (ms)", "Min (ms)", "Max (ms)", "Jitter p50", "Jitter p95",
+               "Jitter p99", "Work mean (ms)", "Work max (ms)", "Max late (ms)", "Overruns", "Count"]
+    LATENCY_COLUMNS = ["Device / graph", "Segment", "Mean (ms)", "p95", "Max (ms)", "Count"]
+
+    def __init__(self, registry, parent=None, refresh_ms: int = 1000, latency=None):
+        super().__init__(parent)
+        self.setWindowTitle("Loop Timing")
+        self.resize(1100, 360)
+        self._registry = registry
+        self._latency = latency or (lambda: None)
+
+        self.table = _table(self.COLUMNS)
+        self.latency_table = _table(self.LATENCY_COLUMNS)
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.table, "Loops")
+        self.tabs.addTab(self.latency_table, "Latency")
+        self.tabs.setTabEnabled(1, latency is not None)
+
+        self.info = QLabel("Jitter = |actual period − target| (histogram bucket bounds, ms).")
+        btn_reset = QPushButton("Reset")
+        btn_close = QPushButton("Close")
+        btn_reset.clicked.connect(self._reset)
+        btn_close.clicked.connect(self.close)
+        row = QHBoxLayout()
+        row.addWidget(self.info, 1)
+        row.addWidget(btn_reset)
+        row.addWidget(btn_close)
+
+        lay = QVBoxLayout(self)
+        lay.addWidget(self.tabs, 1)
+        lay.addLayout(row)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(refresh_ms))
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+        self.refresh()
+
+    def _reset(self):
+        for src in (self._registry(), self._latency()):
+            if src is not None:
+                src.reset()
+        self.refresh()
+
+    def refresh(self):
+        reg = self._registry()
+        snap = reg.snapshot() if reg is not None else {}
+        names = sorted(snap)
+        self.table.setRowCount(len(names))
+        for r, name in enumerate(names):
+            s = snap[name]
+            cells = [name, _ms(s["target_period_s"], 0), _ms(s["mean_period_s"]), _ms(s["min_period_s"]),
+                     _ms(s["max_period_s"]), _hist_ms(s["jitter_p50_ms"]), _hist_ms(s["jitter_p95_ms"]),
+                     _hist_ms(s["jitter_p99_ms"]), _ms(s["mean_work_s"], 2), _ms(s["max_work_s"], 2),
+                     _ms(s["max_late_s"]), str(s["overruns"]), str(s["count"])]
+            _fill_row(self.table, r, cells)
+            if s["overruns"]:
+                self.table.item(r, 11).setForeground(Qt.red)
+        self._refresh_latency()
+
+    def _refresh_latency(self):
+        tracer = self._latency()
+        snap = tracer.snapshot() if tracer is not None else {}
+        rows = []
+        for group in sorted(snap):
+            segs = snap[group]
+            # pipeline order, end-to-end last
+            for name in sorted(segs, key=_segment_order):
+                rows.append((group, name, segs[name]))
+        self.latency_table.setRowCount(len(rows))
+        for r, (group, name, s) in enumerate(rows):
+            _fill_row(self.latency_table, r, [
+                group, name,
+                "—" if s["mean_ms"] is None else f"{s['mean_ms']:.1f}",
+                _hist_ms(s["p95_ms"]),
+                "—" if s["max_ms"] is None else f"{s['max_ms']:.1f}",
+                str(s["count"])])
+
+    def showEvent(self, e):
+        if not self._timer.isActive():
+            self._timer.start()
+            self.refresh()
+        super().showEvent(e)
+
+    def closeEvent(self, e):
+        self._timer.stop()
+        super().closeEvent(e)
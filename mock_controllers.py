@@ -23,6 +23,9 @@ class BaseMockController:
     def is_connected(self):
         return self.connected
 
+    def is_ready(self):
+        return self.connected
+
     def status_api(self):
         return {
             "status": "OK" if self.connected else "DISCONNECTED",
@@ -55,6 +58,20 @@ class MockSTDDPCController(BaseMockController):
     def read_volume(self):
         return float(self._volume_mm3)
 
+    # names used by the sample broker / stages
+    def read_pressure_kpa(self, timeout_s=None):
+        return self.read_pressure()
+
+    def read_volume_mm3(self, timeout_s=None):
+        return self.read_volume()
+
+    # cache API read by the sample broker (sim state is always current)
+    def get_cached_pressure_sample(self, max_age_s=0.5):
+        return (self.read_pressure(), time.monotonic()) if self.connected else None
+
+    def get_cached_volume_sample(self, max_age_s=0.5):
+        return (self.read_volume(), time.monotonic()) if self.connected else None
+
     # compatible aliases some code might call
     def send_pressure(self, kpa):
         self._pressure_kpa = float(kpa)
@@ -125,6 +142,15 @@ class MockLF50Controller(BaseMockController):
     def read_position(self):
         return float(self._position_mm)
 
+    def read_position_mm(self, timeout_s=None):
+        return self.read_position()
+
+    def get_cached_position_sample(self, max_age_s=0.5):
+        return (self.read_position(), time.monotonic()) if self.connected else None
+
+    def stop_motion(self):
+        self._velocity_mm_min = 0.0
+
     # compatibility with stage code
     def send_velocity(self, mm_per_min):
         self._velocity_mm_min = float(mm_per_min)
@@ -135,7 +161,7 @@ class MockLF50Controller(BaseMockController):
     def stop(self):
         self._velocity_mm_min = 0.0
 
-    def send_displacement(self, target_mm):
+    def send_displacement(self, target_mm, velocity_mm_per_min=None):
         # snap to target in sim
         self._position_mm = float(target_mm)
 
@@ -192,6 +218,9 @@ class MockSerialPad(BaseMockController):
     def read_channels(self):
         return list(self._channels)
 
+    def get_cached_channels_sample(self, max_age_s=0.5):
+        return (list(self._channels), time.monotonic()) if self.connected else None
+
     def tick(self):
         # derive values from references + stage profile
         cell = self.refs.get("cell").read_pressure() if self.refs.get("cell") else 0.0
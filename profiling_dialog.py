@@ -0,0 +1,173 @@
+import os
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, QListWidgetItem,
+    QComboBox, QSpinBox, QPlainTextEdit, QGroupBox
+)
+from PyQt5.QtCore import Qt
+
+from acquisition.profiling import PROFILER
+
+# Threads ticked by default: GUI, stage worker and the device I/O threads.
+_DEFAULT_THREADS = ("MainThread", "stage-executor", "stddpc-io-", "lf50-io-")
+
+
+class ProfilingDialog(QDialog):
+    """
+    Developer panel: cProfile or statistical sampling on selected threads and
+    tracemalloc snapshot diffs of the running app, without a restart.
+    `run_log_path` is a callable returning the current run log path (or None);
+    reports are written next to it.
+    """
+
+    def __init__(self, run_log_path, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Profiling")
+        self.resize(640, 520)
+        self._run_log_path = run_log_path
+
+        # --- threads
+        self.thread_list = QListWidget()
+        btn_refresh = QPushButton("Refresh")
+        btn_refresh.clicked.connect(self.refresh_threads)
+        threads_box = QGroupBox("Threads")
+        tl = QVBoxLayout(threads_box)
+        tl.addWidget(self.thread_list, 1)
+        tl.addWidget(btn_refresh, 0, Qt.AlignRight)
+
+        # --- CPU
+        self.mode = QComboBox()
+        self.mode.addItems(["cProfile", "Sampling"])
+        self.interval = QSpinBox()
+        self.interval.setRange(1, 1000)
+        self.interval.setValue(5)
+        self.interval.setSuffix(" ms")
+        self.interval.setToolTip("Sampling interval")
+        self.mode.currentTextChanged.connect(lambda m: self.interval.setEnabled(m == "Sampling"))
+        self.interval.setEnabled(False)
+        self.btn_cpu = QPushButton("Start")
+        self.btn_cpu.clicked.connect(self._toggle_cpu)
+        cpu_box = QGroupBox("CPU")
+        cl = QHBoxLayout(cpu_box)
+        cl.addWidget(QLabel("Mode:"))
+        cl.addWidget(self.mode)
+        cl.addWidget(self.interval)
+        cl.addStretch(1)
+        cl.addWidget(self.btn_cpu)
+
+        # --- memory
+        btn_snap = QPushButton("Snapshot")
+        btn_diff = QPushButton("Diff vs Snapshot")
+        btn_mem_stop = QPushButton("Stop Tracing")
+        btn_snap.clicked.connect(self._mem_snapshot)
+        btn_diff.clicked.connect(self._mem_diff)
+        btn_mem_stop.clicked.connect(self._mem_stop)
+        mem_box = QGroupBox("Memory (tracemalloc)")
+        ml = QHBoxLayout(mem_box)
+        ml.addWidget(btn_snap)
+        ml.addWidget(btn_diff)
+        ml.addStretch(1)
+        ml.addWidget(btn_mem_stop)
+
+        self.output = QPlainTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setMaximumBlockCount(500)
+        btn_close = QPushButton("Close")
+        btn_close.clicked.connect(self.close)
+
+        lay = QVBoxLayout(self)
+        lay.addWidget(threads_box, 1)
+        lay.addWidget(cpu_box)
+        lay.addWidget(mem_box)
+        lay.addWidget(QLabel("Reports:"))
+        lay.addWidget(self.output, 1)
+        lay.addWidget(btn_close, 0, Qt.AlignRight)
+
+        self.refresh_threads()
+        self._sync_cpu_button()
+
+    # ---------------
+    # Threads
+    # ---------------
+    def refresh_threads(self):
+        checked = set(self._selected()) if self.thread_list.count() else None
+        self.thread_list.clear()
+        for t in PROFILER.threads():
+            if t.name == "profiler-sampler":
+                continue
+            item = QListWidgetItem(f"{t.name}  ({t.ident})")
+            item.setData(Qt.UserRole, t.ident)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            on = (t.ident in checked) if checked is not None else t.name.startswith(_DEFAULT_THREADS)
+            item.setCheckState(Qt.Checked if on else Qt.Unchecked)
+            self.thread_list.addItem(item)
+
+    def _selected(self):
+        return [self.thread_list.item(i).data(Qt.UserRole) for i in range(self.thread_list.count())
+                if self.thread_list.item(i).checkState() == Qt.Checked]
+
+    # ---------------
+    # Actions
+    # ---------------
+    def _prepare_reports(self):
+        path = self._run_log_path()
+        if path:
+            PROFILER.report_dir = os.path.dirname(path) or "."
+            PROFILER.report_prefix = os.path.splitext(os.path.basename(path))[0]
+        else:
+            PROFILER.report_dir, PROFILER.report_prefix = "runs", "profile"
+
+    def _toggle_cpu(self):
+        self._prepare_reports()
+        try:
+            if PROFILER.cprofile_running():
+                self._report(PROFILER.stop_cprofile())
+            elif PROFILER.sampling_running():
+                self._report(PROFILER.stop_sampling())
+            else:
+                idents = self._selected()
+                if not idents:
+                    self._say("Select at least one thread.")
+                    return
+                if self.mode.currentText() == "cProfile":
+                    names = PROFILER.start_cprofile(idents)
+                else:
+                    names = PROFILER.start_sampling(idents, self.interval.value() / 1000.0)
+                self._say(f"{self.mode.currentText()} started on: {', '.join(names) or '—'}")
+        except Exception as e:
+            self._say(f"[✗] {e}")
+        self._sync_cpu_button()
+
+    def _mem_snapshot(self):
+        self._say(PROFILER.memory_snapshot())
+
+    def _mem_diff(self):
+        self._prepare_reports()
+        try:
+            path = PROFILER.memory_diff()
+        except Exception as e:
+            self._say(f"[✗] {e}")
+            return
+        if path is None:
+            self._say("Take a snapshot first.")
+        else:
+            self._report([path])
+
+    def _mem_stop(self):
+        PROFILER.memory_stop()
+        self._say("Memory tracing stopped.")
+
+    # ---------------
+    # Helpers
+    # ---------------
+    def _sync_cpu_button(self):
+        busy = PROFILER.cprofile_running() or PROFILER.sampling_running()
+        self.btn_cpu.setText("Stop && Write Report" if busy else "Start")
+        self.mode.setEnabled(not busy)
+
+    def _report(self, paths):
+        for p in paths:
+            self._say(f"Wrote {p}")
+
+    def _say(self, msg):
+        self.output.appendPlainText(msg)
@@ -60,14 +60,14 @@ class AutomatedDockingStage(BaseStage):
         # Device presence checks
         if not self.lf or (hasattr(self.lf, "is_ready") and not self.lf.is_ready()):
             self.log("[Docking] Load frame not connected; waiting for user to advance.")
-            while not self._stop_flag.is_set():
-                self._pause_barrier(); time.sleep(0.2)
+            while not self._stop_flag:
+                self._pause_barrier(); self._sleep(0.2)
             return
 
         if not self.serial_pad:
             self.log("[Docking] SerialPad not connected; cannot measure load. Waiting for user.")
-            while not self._stop_flag.is_set():
-                self._pause_barrier(); time.sleep(0.2)
+            while not self._stop_flag:
+                self._pause_barrier(); self._sleep(0.2)
             return
 
         try:
@@ -87,11 +87,9 @@ class AutomatedDockingStage(BaseStage):
 
             # --- measure baseline over a short window to reduce noise ---
             def read_load_kn():
-                try:
-                    ch = self.serial_pad.read_channels()
-                    return ch[0] if (ch and ch[0] is not None) else 0.0
-                except Exception:
-                    return 0.0
+                # wait for a fresh scan so the EMA isn't fed the same snapshot twice
+                ch = self._read_channels(wait_s=0.5)
+                return ch[0] if (ch and ch[0] is not None) else 0.0
 
             samples = []
             t0 = time.time()
@@ -108,6 +106,7 @@ class AutomatedDockingStage(BaseStage):
 
             # --- main loop using Δload relative to baseline ---
             while not (self._stop_requested or self._stop_flag):
+                self._loop_tick("control", poll_dt)
                 self._pause_barrier()
                 if self._stop_requested or self._stop_flag:
                     break
@@ -149,7 +148,7 @@ class AutomatedDockingStage(BaseStage):
                         except Exception:
                             pass
 
-                time.sleep(poll_dt)
+                self._sleep(poll_dt)
 
 
 
@@ -168,6 +167,8 @@ class AutomatedDockingStage(BaseStage):
 
     def _pause_barrier(self):
         # wait here while paused, but allow Stop to break out immediately
+        if getattr(self, "_paused", False):
+            self._loop_paused = True
         while getattr(self, "_paused", False) and not (self._stop_requested or self._stop_flag):
             time.sleep(0.02)
 
@@ -2,6 +2,9 @@
 import time
 from typing import Dict, Iterable, Optional
 
+from acquisition.profiling import profile_point
+from stages.stage_executor import CancelToken
+
 class BaseStage:
     def __init__(self, data, lf, cell_pc, back_pc, serial_pad, log):
         self.data = data
@@ -13,6 +16,7 @@ class BaseStage:
 
         self._paused = False
         self._stop_flag = False
+        self.cancel_token = CancelToken()    # set by stop(); _sleep() wakes on it
 
         # Publishing hooks (attached by manager)
         self._emit_reading_cb = None
@@ -20,6 +24,19 @@ class BaseStage:
         self._stage_index: Optional[int] = None
         self._stage_start_ts: Optional[float] = None
 
+        # SampleBroker shared with the manager (set before run()); None = read devices directly
+        self.broker = None
+
+        # >0 when the manager restarts this stage from a journal checkpoint after a crash;
+        # timed stages should only run the remaining part
+        self.resume_elapsed_s = 0.0
+
+        # LoopTimingRegistry shared with the manager (set before run()); None = not timed
+        self.loop_timing = None
+        self._loops = {}
+        self._loop_current = None
+        self._loop_paused = False
+
     # ---------------------------
     # Manager wiring / publishing
     # ---------------------------
@@ -42,22 +59,21 @@ class BaseStage:
         """Best-effort snapshot of current sensors."""
         now = time.time()
         # pressures
-        cell = self._read_kpa(self.cell_pc)
-        back = self._read_kpa(self.back_pc)
+        cell = self._latest("cell_pressure_kpa")
+        if cell is None:
+            cell = self._read_kpa(self.cell_pc)
+        back = self._latest("back_pressure_kpa")
+        if back is None:
+            back = self._read_kpa(self.back_pc)
         # load frame position
-        pos = None
+        pos = self._latest("position_mm")
         try:
-            if self.lf and hasattr(self.lf, "read_position_mm"):
+            if pos is None and self.lf and hasattr(self.lf, "read_position_mm"):
                 pos = float(self.lf.read_position_mm())
         except Exception:
             pass
         # serial pad channels
-        chans = []
-        try:
-            if self.serial_pad and hasattr(self.serial_pad, "read_channels"):
-                chans = self.serial_pad.read_channels() or []
-        except Exception:
-            pass
+        chans = self._read_channels() or []
 
         reading = {
             "timestamp": now,
@@ -213,10 +229,66 @@ class BaseStage:
     # -------------
     def _pause_barrier(self, poll_dt=0.05):
         """Call inside long loops to honor pause/stop promptly."""
+        if self._paused:
+            self._loop_paused = True     # this iteration's timing is not representative
         while self._paused and not self._stop_flag:
-            time.sleep(poll_dt)
+            self._sleep(poll_dt)
         return self._stop_flag  # lets caller early-exit if True
 
+    def _sleep(self, dt: float) -> bool:
+        """Interruptible sleep: returns early (True) as soon as the stage is stopped."""
+        cur = self._loop_current
+        if cur is not None:
+            cur.idle()
+        return self.cancel_token.wait(dt)
+
+    def _loop_tick(self, name: str, period_s: float):
+        """Top of a control-loop iteration: feeds the loop timing stats (period, work, overruns)."""
+        profile_point()
+        reg = self.loop_timing
+        if reg is None:
+            return
+        st = self._loops.get(name)
+        if st is None:
+            kind = getattr(self.data, "stage_type", None) or type(self).__name__
+            st = self._loops[name] = reg.loop(f"stage.{kind}.{name}", period_s)
+        if self._loop_paused:
+            st.discard()
+            self._loop_paused = False
+        st.begin()
+        self._loop_current = st
+
+    def _latest(self, channel: str, max_age_s: float = 1.0):
+        """Fresh value from the shared SampleBroker board, or None."""
+        b = self.broker
+        if b is None:
+            return None
+        try:
+            return b.latest(channel, max_age_s)
+        except Exception:
+            return None
+
+    def _read_channels(self, wait_s: float = 0.0):
+        """
+        SerialPad channels from the pad's background reader: the next scan if
+        wait_s > 0, else the latest snapshot. Falls back to read_channels().
+        """
+        sp = self.serial_pad
+        if not sp:
+            return None
+        try:
+            if wait_s > 0 and hasattr(sp, "wait_for_next_scan"):
+                ch = sp.wait_for_next_scan(wait_s)
+                if ch is not None:
+                    return ch
+            if hasattr(sp, "get_cached_channels"):
+                ch = sp.get_cached_channels(1.0)
+                if ch is not None:
+                    return ch
+            return sp.read_channels() if hasattr(sp, "read_channels") else None
+        except Exception:
+            return None
+
     @staticmethod
     def _read_kpa(ctrl):
         if not ctrl or not BaseStage._is_ready(ctrl):
@@ -304,6 +376,7 @@ class BaseStage:
 
     def stop(self):
         self._stop_flag = True
+        self.cancel_token.cancel()
         self._halt_devices()              # <— NEW: force hardware halt immediately
         try: self.on_stopped()
         except Exception: pass
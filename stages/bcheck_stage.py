@@ -1,6 +1,5 @@
 # stages/bcheck_stage.py
 from .base_stage import BaseStage
-import time
 
 class BCheckStage(BaseStage):
     def run(self):
@@ -18,7 +17,7 @@ class BCheckStage(BaseStage):
             # Hold until user advances, so UI flow still works
             while not self._stop_flag:
                 self._pause_barrier()
-                time.sleep(0.2)
+                self._sleep(0.2)
             return
 
         try:
@@ -34,7 +33,7 @@ class BCheckStage(BaseStage):
         # Idle loop so Pause/Continue/Stop work
         while not self._stop_flag:
             self._pause_barrier()
-            time.sleep(0.2)
+            self._sleep(0.2)
 
     # --- Pause only cell pressure ---
     def pause(self):
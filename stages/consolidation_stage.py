@@ -1,6 +1,5 @@
 # stages/consolidation_stage.py
 from .base_stage import BaseStage
-import time
 
 class ConsolidationStage(BaseStage):
     def __init__(self, data, lf, cell_pc, back_pc, serial_pad, log):
@@ -32,7 +31,10 @@ class ConsolidationStage(BaseStage):
 
     def _read_pressures_kpa(self):
         """Return (cell_kpa, back_kpa) from controllers; fall back to self.data or 0.0."""
-        def _read_one(pc, fallback):
+        def _read_one(pc, fallback, channel):
+            v = self._latest(channel)
+            if v is not None:
+                return float(v)
             if not pc:
                 return float(fallback)
             # Try common call patterns
@@ -54,7 +56,8 @@ class ConsolidationStage(BaseStage):
 
         cell_fallback = float(getattr(self.data, "current_cell_pressure", 0) or 0.0)
         back_fallback = float(getattr(self.data, "current_back_pressure", 0) or 0.0)
-        return _read_one(self.cell_pc, cell_fallback), _read_one(self.back_pc, back_fallback)
+        return (_read_one(self.cell_pc, cell_fallback, "cell_pressure_kpa"),
+                _read_one(self.back_pc, back_fallback, "back_pressure_kpa"))
 
     def run(self):
         self._stop_requested = False
@@ -81,18 +84,16 @@ class ConsolidationStage(BaseStage):
             # Idle loop until stopped
             poll_dt = 1.0
             while not (self._stop_requested or self._stop_flag):
+                self._loop_tick("hold", poll_dt)
                 self._pause_barrier()   # respects pause
-                time.sleep(poll_dt)
+                self._sleep(poll_dt)
                 # inside while not (self._stop_requested or self._stop_flag):
                 cell_now, back_now = self._read_pressures_kpa()
                 vol_now = 0.0
                 if self.serial_pad:
-                    try:
-                        ch = self.serial_pad.read_channels()
-                        # assume volume/displacement on channel 1?
-                        vol_now = ch[1] if len(ch) > 1 else 0.0
-                    except Exception:
-                        pass
+                    ch = self._read_channels() or []
+                    # assume volume/displacement on channel 1?
+                    vol_now = (ch[1] if len(ch) > 1 else None) or 0.0
 
                 # Log in a structured way
                 self.log(f"[Consolidation] Cell={cell_now:.2f} kPa | Back={back_now:.2f} kPa | Vol={vol_now:.3f} mm³")
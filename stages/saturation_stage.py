@@ -52,6 +52,14 @@ class SaturationStage(BaseStage):
         """
         ctrl = self._unwrap(dev)
 
+        # 0) shared broker board (no bus traffic)
+        if ctrl is not None:
+            chan = ("cell_pressure_kpa" if ctrl is self._unwrap(self.cell_pc) else
+                    "back_pressure_kpa" if ctrl is self._unwrap(self.back_pc) else None)
+            v = self._latest(chan, cache_s) if chan else None
+            if v is not None:
+                return float(v)
+
         # 1) cached (non-blocking)
         try:
             f = getattr(ctrl, "get_cached_pressure", None)
@@ -143,6 +151,10 @@ class SaturationStage(BaseStage):
             duration_min = float(getattr(self.data, "duration", 0.0))
         except Exception:
             duration_min = 0.0
+        if duration_min > 0.0 and self.resume_elapsed_s > 0.0:
+            # resumed after a crash: ramp from where we are over what's left
+            duration_min = max(0.0, duration_min - self.resume_elapsed_s / 60.0)
+            self.log(f"[Saturation] Resuming with {duration_min:.2f} min remaining")
 
         # Duration == 0 → single set & hold
         if duration_min <= 0.0:
@@ -155,7 +167,7 @@ class SaturationStage(BaseStage):
             self.log("[Saturation] Duration=0 → setpoint applied; holding for user.")
             while not self._stop_flag:
                 self._pause_barrier()
-                time.sleep(0.2)
+                self._sleep(0.2)
             return
 
         # 1 Hz steps over duration
@@ -194,6 +206,7 @@ class SaturationStage(BaseStage):
         for i in range(1, steps + 1):
             if self._stop_flag:
                 break
+            self._loop_tick("setpoint", step_period)
             self._pause_barrier()
 
             frac = i / steps
@@ -214,13 +227,13 @@ class SaturationStage(BaseStage):
             target = t0 + i * step_period
             while not self._stop_flag and time.monotonic() < target:
                 self._pause_barrier()
-                time.sleep(0.02)   # light nap; keeps UI responsive
+                self._sleep(0.02)   # light nap; keeps UI responsive
 
         # Hold at target until operator advances
         self.log("[Saturation] Ramp complete. Holding at target; waiting for user.")
         while not self._stop_flag:
             self._pause_barrier()
-            time.sleep(0.2)
+            self._sleep(0.2)
 
         # Graceful stop
         try:
@@ -115,11 +115,9 @@ class ShearStage(BaseStage):
 
             # Baseline load over short window
             def read_kn():
-                try:
-                    ch = self.serial_pad.read_channels()
-                    return ch[0] if (ch and ch[0] is not None) else 0.0
-                except Exception:
-                    return 0.0
+                # wait for a fresh scan so the EMA isn't fed the same snapshot twice
+                ch = self._read_channels(wait_s=0.5)
+                return ch[0] if (ch and ch[0] is not None) else 0.0
 
             samples = []
             t0 = time.time()
@@ -139,6 +137,7 @@ class ShearStage(BaseStage):
 
             # --- 4) Main loop ---
             while not (self._stop_requested or self._stop_flag):
+                self._loop_tick("control", poll_dt)
                 self._pause_barrier()
                 if self._stop_requested or self._stop_flag:
                     break
@@ -190,7 +189,7 @@ class ShearStage(BaseStage):
                         except Exception:
                             pass
 
-                time.sleep(poll_dt)
+                self._sleep(poll_dt)
 
         except Exception as e:
             self.log(f"[!] Shear stage error: {e}")
@@ -207,7 +206,10 @@ class ShearStage(BaseStage):
 
     def _read_pressures_kpa(self):
         """Return (cell_kpa, back_kpa) from controllers; fall back to self.data or 0.0."""
-        def _read_one(pc, fallback):
+        def _read_one(pc, fallback, channel):
+            v = self._latest(channel)
+            if v is not None:
+                return float(v)
             if not pc:
                 return float(fallback)
             # Try common call patterns
@@ -230,5 +232,6 @@ class ShearStage(BaseStage):
 
         cell_fallback = float(getattr(self.data, "current_cell_pressure", 0) or 0.0)
         back_fallback = float(getattr(self.data, "current_back_pressure", 0) or 0.0)
-        return _read_one(self.cell_pc, cell_fallback), _read_one(self.back_pc, back_fallback)
+        return (_read_one(self.cell_pc, cell_fallback, "cell_pressure_kpa"),
+                _read_one(self.back_pc, back_fallback, "back_pressure_kpa"))
 
@@ -0,0 +1,99 @@
+# stages/stage_executor.py
+import queue
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class CancelToken:
+    """Cooperative stop flag a stage can also sleep on (wakes immediately on cancel)."""
+
+    def __init__(self):
+        self._ev = threading.Event()
+
+    def cancel(self):
+        self._ev.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._ev.is_set()
+
+    def wait(self, timeout_s: float) -> bool:
+        """Sleep up to timeout_s; True if cancelled (early or already)."""
+        return self._ev.wait(max(0.0, float(timeout_s)))
+
+
+class StageExecutor(QObject):
+    """
+    One long-lived thread that runs stage objects one after another.
+
+    submit() hands a ready-built stage to the thread (no QThread/worker is
+    created per stage); stop_current() cancels the running stage through its
+    token/stop() and waits for it cooperatively, never terminating the thread.
+    Completion is reported through queued signals carrying the stage object,
+    so a late signal from an earlier stage can be told apart.
+    """
+
+    stage_finished = pyqtSignal(object)        # stage
+    stage_error = pyqtSignal(object, str)      # stage, message
+
+    def __init__(self, log=print):
+        super().__init__()
+        self.log = log or (lambda *a, **k: None)
+        self._q: "queue.Queue" = queue.Queue()
+        self._current = None
+        self._pending = 0                   # submitted, not yet finished; guarded by _lock
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = threading.Thread(target=self._loop, name="stage-executor", daemon=True)
+        self._thread.start()
+
+    @property
+    def current(self):
+        return self._current
+
+    def is_busy(self) -> bool:
+        return not self._idle.is_set()
+
+    def submit(self, stage):
+        with self._lock:
+            self._pending += 1
+            self._idle.clear()
+        self._q.put(stage)
+
+    def stop_current(self, timeout_s: float = 2.0) -> bool:
+        """Ask the running stage to stop; True once the executor is idle again."""
+        stage = self._current
+        if stage is not None:
+            try:
+                stage.stop()
+            except Exception:
+                pass
+        ok = self._idle.wait(max(0.0, float(timeout_s)))
+        if not ok:
+            self.log(f"[!] Stage did not stop within {timeout_s:.1f}s; it will finish in the background.")
+        return ok
+
+    def shutdown(self, timeout_s: float = 2.0):
+        self.stop_current(timeout_s)
+        self._q.put(None)
+        self._thread.join(timeout=timeout_s)
+
+    def _loop(self):
+        while True:
+            stage = self._q.get()
+            if stage is None:
+                return
+            self._current = stage
+            try:
+                stage.run()
+                self.stage_finished.emit(stage)
+            except Exception as e:
+                self.stage_error.emit(stage, str(e))
+            finally:
+                self._current = None
+                with self._lock:
+                    self._pending -= 1
+                    if self._pending == 0:
+                        self._idle.set()
@@ -0,0 +1,164 @@
+import json
+import os
+
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, QFileDialog, QInputDialog, QMessageBox
+)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
+
+from acquisition.rig import load_test_plan
+from acquisition.stations import FAILED, RUNNING
+
+
+class StationOverviewPage(QWidget):
+    """
+    One row per test station: state, current stage, latest pressures/load and
+    how long ago the station's process was last heard from. Buttons act on
+    the selected row (add a station, start a plan on it, next stage, stop, abort).
+    """
+
+    COLUMNS = ["Station", "State", "Stage", "Sample", "Cell (kPa)", "Back (kPa)",
+               "Load (kN)", "Last data (s)", "Restarts"]
+
+    def __init__(self, supervisor, parent=None, log=None):
+        super().__init__(parent)
+        self.supervisor = supervisor
+        self.log = log or (lambda *a, **k: None)
+        self.setFont(QFont("Segoe UI", 12))
+
+        title_bar = QHBoxLayout()
+        title = QLabel("Stations")
+        title.setObjectName("TitleLabel")
+        title_bar.addWidget(title)
+        title_bar.addStretch(1)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        buttons = QHBoxLayout()
+        self.btn_add = QPushButton("Add Station…")
+        self.btn_start = QPushButton("Start Plan…")
+        self.btn_next = QPushButton("Next Stage")
+        self.btn_stop = QPushButton("Stop Stage")
+        self.btn_abort = QPushButton("Abort")
+        for b in (self.btn_add, self.btn_start, self.btn_next, self.btn_stop, self.btn_abort):
+            buttons.addWidget(b)
+        buttons.addStretch(1)
+        self.btn_add.clicked.connect(self._add_station)
+        self.btn_start.clicked.connect(self._start_plan)
+        self.btn_next.clicked.connect(lambda: self._on_selected(self.supervisor.next_stage))
+        self.btn_stop.clicked.connect(lambda: self._on_selected(self.supervisor.stop_stage))
+        self.btn_abort.clicked.connect(self._abort)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(title_bar)
+        layout.addWidget(self.table, 1)
+        layout.addLayout(buttons)
+
+        # rows refresh on station changes; live values at most twice a second
+        self._dirty = True
+        supervisor.station_changed.connect(self._mark_dirty)
+        supervisor.station_reading.connect(lambda *_: self._mark_dirty())
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(500)
+        self._refresh_timer.timeout.connect(self._refresh)
+        self._refresh_timer.start()
+
+    # ---------------
+    # Table
+    # ---------------
+    def _mark_dirty(self, *_):
+        self._dirty = True
+
+    def _refresh(self):
+        if not (self._dirty or any(st.is_running() for st in self.supervisor.stations.values())):
+            return
+        self._dirty = False
+        names = self.supervisor.names()
+        if self.table.rowCount() != len(names):
+            self.table.setRowCount(len(names))
+        for row, name in enumerate(names):
+            st = self.supervisor.stations[name]
+            r = st.last_reading or {}
+            age = st.age_s()
+
+            def _num(key, fmt="{:.2f}"):
+                v = r.get(key)
+                return fmt.format(v) if isinstance(v, (int, float)) else "—"
+            state = st.state
+            if st.is_running() and age is not None and age > self.supervisor.stale_after_s:
+                state = f"{RUNNING} (no data)"
+            cells = [name, state, st.stage_name or "—", (st.test_config or {}).get("sample_id", "") or "—",
+                     _num("cell_pressure_kpa"), _num("back_pressure_kpa"), _num("axial_load_kN", "{:.3f}"),
+                     f"{age:.1f}" if age is not None else "—", str(st.restarts)]
+            for col, text in enumerate(cells):
+                item = self.table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    item.setTextAlignment(Qt.AlignCenter)
+                    self.table.setItem(row, col, item)
+                if item.text() != text:
+                    item.setText(text)
+            if st.state == FAILED:
+                self.table.item(row, 1).setForeground(Qt.red)
+
+    def _selected_name(self):
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        item = self.table.item(rows[0].row(), 0)
+        return item.text() if item else None
+
+    def _on_selected(self, fn):
+        name = self._selected_name()
+        if name:
+            fn(name)
+
+    # ---------------
+    # Actions
+    # ---------------
+    def _add_station(self):
+        name, ok = QInputDialog.getText(self, "Add Station", "Station name:")
+        if not ok or not name.strip():
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Rig JSON (devices of this station)", "",
+                                              "JSON (*.json);;All files (*)")
+        if not path:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                spec = json.load(f)
+            self.supervisor.add_station(name.strip(), spec)
+        except Exception as e:
+            QMessageBox.warning(self, "Add Station", f"Could not add station:\n{e}")
+
+    def _start_plan(self):
+        name = self._selected_name()
+        if not name:
+            return
+        path, _ = QFileDialog.getOpenFileName(self, f"Test plan for {name}", "",
+                                              "JSON (*.json);;All files (*)")
+        if not path:
+            return
+        try:
+            cfg = load_test_plan(path)
+        except Exception as e:
+            QMessageBox.warning(self, "Start Plan", f"Could not read the plan:\n{e}")
+            return
+        cfg.setdefault("sample_id", os.path.splitext(os.path.basename(path))[0])
+        self.supervisor.start_test(name, cfg)
+
+    def _abort(self):
+        name = self._selected_name()
+        if not name:
+            return
+        if QMessageBox.question(self, "Abort Test", f"Abort the test on station '{name}'?",
+                                QMessageBox.Yes | QMessageBox.No, QMessageBox.No) == QMessageBox.Yes:
+            self.supervisor.abort(name)
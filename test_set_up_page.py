@@ -51,6 +51,17 @@ class StageData:
             "hold": self.hold,
         }
 
+    @classmethod
+    def from_dict(cls, d: Dict) -> "StageData":
+        """Inverse of to_dict() (used to rebuild a stage plan from a test journal)."""
+        d = dict(d or {})
+        stage_id = d.pop("stage_id", None)
+        obj = cls()
+        obj.update_fields(d)
+        if stage_id:
+            obj.stage_id = str(stage_id)
+        return obj
+
     def update_fields(self, updates: Dict, allowed: Iterable[str] = ()):
         """
         Safe update: only apply keys that exist (and optionally only those in 'allowed').
@@ -4,7 +4,7 @@ from PyQt5.QtWidgets import (
     QScrollArea, QFrame, QTabWidget, QListView, QFileDialog, QMessageBox, QStackedLayout,
     QApplication, QDialog, QDialogButtonBox, QInputDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QStandardItem
 from collections import deque
 import pyqtgraph as pg
@@ -14,6 +14,8 @@ import re
 import csv
 from datetime import datetime
 from graph_workspace_dialog import GraphWorkspaceDialog
+from loop_timing_dialog import LoopTimingDialog
+from profiling_dialog import ProfilingDialog
 from custom_calcs_widget import CustomCalcsWidget, CalcDef
 from safe_eval import eval_expr
 from typing import List
@@ -21,6 +23,11 @@ import math
 from math import sqrt, pi
 import time
 from test_set_up_page import TestSetupPage
+from acquisition.reading_store import ReadingStore
+from acquisition.reading import Reading
+from acquisition.latency_trace import LatencyTracer
+from acquisition.run_log import RunLogReader
+import numpy as np
 
 class StageEditDialog(QDialog):
     def __init__(self, parent=None, stages=None):
@@ -185,7 +192,12 @@ class TestViewPage(QWidget):
         self._graph_cards = []
         self.start_time = None
         self.shared_data = {}
-        self._history = deque(maxlen=5000)
+        # columnar rolling window of enriched readings; graph cards read views of it.
+        # The full run is on disk (manager's run log) for export / Graph Workspace.
+        self._history = ReadingStore(allow_new_columns=True, max_rows=20000)
+        # per-device / per-graph latency of traced readings (Loop Timing → Latency)
+        self.latency = LatencyTracer()
+        self._render_ts = {}         # graph group -> monotonic time its curves were last set
         self.current_stage_index = 0
         self.is_complete = False
         self._post_stop_cancelled = False
@@ -196,13 +208,6 @@ class TestViewPage(QWidget):
         self._skip_graph_prompt = False   # 🔑 add this flag
 
 
-        self._dirty = False
-        self._render_timer = QTimer(self)
-        self._render_timer.setInterval(300)     # 0.3 s repaint cadence
-        self._render_timer.setTimerType(Qt.CoarseTimer)
-        self._render_timer.timeout.connect(self._render)
-        self._render_timer.start()
-
         # ===== Title =====
         title_row = QHBoxLayout()
         title = QLabel("Test View")
@@ -274,6 +279,12 @@ class TestViewPage(QWidget):
         self.save_btn = QPushButton("Save Graphs")
         self.save_btn.clicked.connect(self.export_graphs)
         controls.addWidget(self.save_btn)
+        self.timing_btn = QPushButton("Loop Timing")
+        self.timing_btn.clicked.connect(self._open_loop_timing)
+        controls.addWidget(self.timing_btn)
+        self.profile_btn = QPushButton("Profiling")
+        self.profile_btn.clicked.connect(self._open_profiling)
+        controls.addWidget(self.profile_btn)
 
         controls.addWidget(self.add_graph_btn)
         controls.addWidget(self.del_graph_btn)
@@ -521,8 +532,6 @@ class TestViewPage(QWidget):
             try: self._stack.setCurrentWidget(self._normal_container)
             except Exception: pass
             self._set_stage_controls_enabled(True)
-            try: self._render_timer.start()
-            except Exception: pass
             return
 
         self.is_complete = True
@@ -615,6 +624,12 @@ class TestViewPage(QWidget):
         if si != self.current_stage_index:
             self.set_current_stage(si)
 
+        # Store first (for export / workspace) — graph cards plot straight from it
+        try:
+            self._history.append(reading)
+        except Exception:
+            pass
+
         # Feed each graph card
         for card in getattr(self, "_graph_cards", []):
             xk = getattr(card, "get_x_key", lambda: None)()
@@ -624,13 +639,42 @@ class TestViewPage(QWidget):
             try:
                 card.update_data(reading)
             except Exception as e:
-                print("[Plot] update error:", e)
+                self.log(f"[!] Plot update error: {e}")
+
+    def _route_batch_to_graph_cards(self, rows):
+        """Like _route_to_graph_cards for a whole batch: store all rows, redraw each card once."""
+        pending = []
+        for r in rows:
+            si = r.get("stage_index", self.current_stage_index)
+            if si != self.current_stage_index:
+                # stage switch clears per-stage graphs; rows before it belong to the old stage
+                self._feed_cards(pending)
+                pending = []
+                self.set_current_stage(si)
+            try:
+                self._history.append(r)
+            except Exception:
+                continue
+            pending.append(r)
+        self._feed_cards(pending)
 
-        # Keep a copy in history (for export / workspace)
-        try:
-            self._history.append({k: reading.get(k) for k in reading.keys()})
-        except Exception:
-            pass
+    def _feed_cards(self, rows):
+        if not rows:
+            return
+        for i, card in enumerate(getattr(self, "_graph_cards", [])):
+            try:
+                if hasattr(card, "update_batch"):
+                    card.update_batch(rows)
+                else:
+                    for r in rows:
+                        card.update_data(r)
+                self._render_ts[f"graph:{i + 1} {card.title()}"] = time.monotonic()
+            except Exception as e:
+                self.log(f"[!] Plot update error: {e}")
+
+    def log(self, message):
+        mw = self.main_window
+        (mw.log if mw is not None and hasattr(mw, "log") else print)(message)
 
     def _gdslab_catalog(self):
         items = [
@@ -669,6 +713,43 @@ class TestViewPage(QWidget):
 
 
     def update_plot(self, reading: dict):
+        self._enrich_reading(reading)
+        self._update_live_readout(reading)
+        self._route_to_graph_cards(reading)
+
+    def update_plot_batch(self, batch):
+        """One ReadingBatch per UI frame: enrich every row, redraw once."""
+        t_deliver = time.monotonic()
+        rows = [r.to_dict() if isinstance(r, Reading) else r for r in batch
+                if isinstance(r, (dict, Reading))]
+        if not rows:
+            return
+        traces = [r.trace for r in batch if isinstance(r, Reading) and r.trace]
+        for r in rows:
+            self._enrich_reading(r)
+        t_enrich = time.monotonic()
+        self._update_live_readout(rows[-1])
+        self._render_ts.clear()
+        self._route_batch_to_graph_cards(rows)
+        if traces:
+            self._add_latency(traces, t_deliver, t_enrich)
+
+    def _add_latency(self, traces, t_deliver, t_enrich):
+        """Fold a batch's reading traces into the per-device and per-graph breakdowns."""
+        t_render = max(self._render_ts.values(), default=None)
+        for tr in traces:
+            devices = tr.get("devices") or {}
+            tail = {"record": tr.get("record"), "deliver": t_deliver, "enrich": t_enrich}
+            for dev, (t_read, t_parse, t_pub) in devices.items():
+                self.latency.add(f"device:{dev}", dict(tail, acquire=t_read, parse=t_parse,
+                                                       publish=t_pub, render=t_render))
+            # a graph point is as old as the oldest device value fused into it
+            t_acq = min((d[0] for d in devices.values()), default=None)
+            for group, t in self._render_ts.items():
+                self.latency.add(group, dict(tail, acquire=t_acq, render=t))
+
+    def _enrich_reading(self, reading: dict):
+        """Add geometry, stresses, strains, custom calcs and elapsed times in place."""
         ctx = self._calc_context_from(reading)
 
         # --- Geometry from test details
@@ -740,11 +821,8 @@ class TestViewPage(QWidget):
             if not c.enabled:
                 continue
             try:
-                val = eval_expr(c.expr, ctx)
-                print(f"[DEBUG] {c.key} = {val}  from expr={c.expr}")
-                reading[c.key] = val
-            except Exception as e:
-                print(f"[DEBUG] {c.key} failed: {e}")
+                reading[c.key] = eval_expr(c.expr, ctx)
+            except Exception:
                 reading[c.key] = float('nan')
 
 
@@ -758,10 +836,7 @@ class TestViewPage(QWidget):
             if s0 is not None:
                 reading["stage_elapsed_s"] = max(0.0, float(ts) - float(s0))
                 reading["sqrt_stage_time_s"] = math.sqrt(reading["stage_elapsed_s"])
-
-        # --- Route to outputs
-        self._update_live_readout(reading)
-        self._route_to_graph_cards(reading)
+        return reading
 
 
 
@@ -859,7 +934,6 @@ class TestViewPage(QWidget):
         }
         ctx["sigma3_kpa"] = ctx["cell_pressure_kpa"]
 
-        print("[DEBUG] _calc_context_from ->", ctx)
         return ctx
 
 
@@ -889,15 +963,61 @@ class TestViewPage(QWidget):
         return mapping.get(key, key.replace("_", " ").title())
 
 
+    def _run_log_reader(self):
+        """Reader over the manager's on-disk run log (flushed first), or None."""
+        tm = getattr(getattr(self, "main_window", None), "test_manager", None)
+        path = getattr(tm, "run_log_path", None)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            tm.flush_run_log()
+        except Exception:
+            pass
+        return RunLogReader(path)
+
+    def _load_run_history(self, span=None):
+        """Run (or one event_index.RowSpan of it) from the run log, with Calculated/Custom columns filled in."""
+        reader = self._run_log_reader()
+        if reader is None:
+            return None
+        items, _ = self._gdslab_catalog()
+        calc_keys = [key for (_label, key, group) in items if group in ("Calculated", "Custom")]
+        store = ReadingStore(allow_new_columns=True)
+        for row in reader.iter_rows(span):
+            if calc_keys:
+                row.update(self._compute_derived_for_export(row, calc_keys))
+            store.append(row)
+        return store
+
+    def _run_ranges(self):
+        """[(label, loader)] for the Graph Workspace: whole run, then each recorded stage."""
+        tm = getattr(getattr(self, "main_window", None), "test_manager", None)
+        index = getattr(tm, "event_index", None)
+        if index is None:
+            return []
+        ranges = [("Whole test", self._load_run_history)]
+        for i, st in enumerate(getattr(tm, "stages", []) or []):
+            span = index.stage_span(i)
+            if span is None:
+                continue
+            name = getattr(st, "name", f"Stage {i + 1}")
+            ranges.append((f"Stage {i + 1}: {name}", lambda sp=span: self._load_run_history(sp)))
+        resume = index.since("RESUME")
+        if resume is not None:
+            ranges.append(("Since last resume", lambda sp=resume: self._load_run_history(sp)))
+        return ranges
+
     def _open_graph_workspace(self):
-        history = list(getattr(self, "_history", []) or
-                       getattr(getattr(self, "main_window", None), "test_manager", None).data_log
-                       if getattr(getattr(self, "main_window", None), "test_manager", None) else [])
-        if not history:
+        history = self._load_run_history()
+        if history is None or not len(history):
+            history = self._history
+        if history is None or not len(history):
             QMessageBox.information(self, "No Data", "There is no data available to plot.")
             return
         try:
             dlg = GraphWorkspaceDialog(history, parent=self)
+            if history is not self._history:
+                dlg.set_ranges(self._run_ranges())
             if hasattr(dlg, "set_variable_catalog"):
                 items, desc = self._gdslab_catalog()
                 dlg.set_variable_catalog(items, desc)
@@ -905,13 +1025,39 @@ class TestViewPage(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Graph Workspace Error", str(e))
     
+    def _open_loop_timing(self):
+        def registry():
+            tm = getattr(getattr(self, "main_window", None), "test_manager", None)
+            reg = getattr(tm, "loop_timing", None)
+            if reg is None:
+                broker = getattr(getattr(self, "main_window", None), "broker", None)
+                reg = getattr(getattr(broker, "scheduler", None), "timing", None)
+            return reg
+        dlg = getattr(self, "_loop_timing_dlg", None)
+        if dlg is None:
+            dlg = self._loop_timing_dlg = LoopTimingDialog(registry, parent=self, latency=lambda: self.latency)
+        dlg.show()
+        dlg.raise_()
+
+    def _open_profiling(self):
+        def run_log_path():
+            tm = getattr(getattr(self, "main_window", None), "test_manager", None)
+            return getattr(tm, "run_log_path", None)
+        dlg = getattr(self, "_profiling_dlg", None)
+        if dlg is None:
+            dlg = self._profiling_dlg = ProfilingDialog(run_log_path, parent=self)
+        dlg.refresh_threads()
+        dlg.show()
+        dlg.raise_()
+
     def export_data_flow(self):
         """
         1) Ask where to save CSV (user names the file & picks folder).
-        2) Write self._history as CSV with a union of keys.
+        2) Stream the run log (or self._history if there is none) to CSV.
         3) Offer to open a post-test Graph Workspace so they can make/snapshot graphs.
         """
-        if not getattr(self, "_history", None):
+        reader = self._run_log_reader()
+        if reader is None and not len(self._history):
             QMessageBox.information(self, "No Data", "There is no data to export yet.")
             return
 
@@ -926,8 +1072,24 @@ class TestViewPage(QWidget):
         if not path: return
 
         # ---- CSV writing with metadata at top ----
-        rows = list(self._history)
-        if not rows:
+        # rows are streamed (never all in memory): run log if present, else the live window
+        if reader is not None:
+            source_keys = reader.fieldnames
+            rows = reader.iter_rows
+            if getattr(tm, "log_deadband", None):
+                # compressed log: offer to rebuild the evenly spaced series
+                choice = QMessageBox.question(
+                    self, "Compressed Run Log",
+                    "This run was logged with deadband compression.\n"
+                    "Rebuild evenly spaced rows at the sampling period for the export?",
+                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+                if choice == QMessageBox.Yes:
+                    period = float(getattr(tm, "sampling_period_s", 0.5) or 0.5)
+                    rows = lambda: reader.iter_uniform(period)
+        else:
+            source_keys = ["date", "stage_name"] + self._history.keys()
+            rows = self._history.rows
+        if not source_keys:
             QMessageBox.information(self, "No Data", "There is no data to export yet.")
             return
 
@@ -944,14 +1106,9 @@ class TestViewPage(QWidget):
         # Build headers from union of keys, but drop metadata-like keys if present
         # --- Ask which extra calculated/custom columns to include
         wanted = self._ask_export_calcs()  # list of keys
-        if wanted:
-            for r in rows:
-                r.update(self._compute_derived_for_export(r, wanted))
 
-        # Build headers from union of keys (after adding any wanted calcs)
-        all_keys = set()
-        for d in rows:
-            all_keys.update(d.keys())
+        # Headers: source columns plus the wanted calcs
+        all_keys = set(source_keys) | set(wanted)
 
         drop = {"sample_id","sample_height_cm","sample_diameter_cm","is_docked","sampling_period_s"}
         preferred = ["timestamp","date","test_elapsed_s","stage_elapsed_s","time_s",
@@ -976,7 +1133,9 @@ class TestViewPage(QWidget):
 
                 dw = csv.DictWriter(f, fieldnames=headers)
                 dw.writeheader()
-                for r in rows:
+                for r in rows():
+                    if wanted:
+                        r.update(self._compute_derived_for_export(r, wanted))
                     dw.writerow({k: r.get(k) for k in headers})
         except Exception as e:
             QMessageBox.critical(self, "Export Failed", f"Could not write CSV:\n{e}")
@@ -994,7 +1153,9 @@ class TestViewPage(QWidget):
         if choice == QMessageBox.Yes:
             try:
                 # Keep the Test Complete card visible; just open a modal workspace
-                dlg = GraphWorkspaceDialog(list(self._history), parent=self)
+                history = self._load_run_history()
+                dlg = GraphWorkspaceDialog(history if history is not None and len(history) else self._history,
+                                           parent=self)
                 dlg.exec_()  # modal; returns when closed
             except Exception as e:
                 QMessageBox.critical(self, "Graph Workspace Error", str(e))
@@ -1019,13 +1180,9 @@ class TestViewPage(QWidget):
         except Exception: pass
         self._set_stage_controls_enabled(True)
         self.set_paused_state(False)
-        try: self._render_timer.start()
-        except Exception: pass
 
         
     def _freeze_live_updates(self):
-        try: self._render_timer.stop()
-        except Exception: pass
         self._set_stage_controls_enabled(False)
 
     def _clear_graphs_and_timers(self):
@@ -1045,8 +1202,6 @@ class TestViewPage(QWidget):
         self.set_paused_state(False)
         # guarantee a reference start time (will be refined by first reading)
         self.test_start_ts = time.time()
-        try: self._render_timer.start()
-        except Exception: pass
 
 
     def on_test_stopped(self):
@@ -1065,14 +1220,6 @@ class TestViewPage(QWidget):
             self.stage_list.setCurrentRow(0)
             self.set_current_stage_index(0)
 
-    def _render(self):
-        if not self._dirty:
-            return
-        for g in self._graph_cards:
-            if hasattr(g, "update_data"):
-                g.update_data(self.shared_data)
-        self._dirty = False
-        
     def set_paused_state(self, paused: bool):
         self.btn_pause.setEnabled(not paused)
         self.btn_continue.setEnabled(paused)
@@ -1376,10 +1523,8 @@ class TestViewPage(QWidget):
             keys = getattr(self, "_builtin_keys", []) + calc_names
             card.set_available_series(keys)
 
-        # backfill history
-        if self._history:
-            for d in self._history:
-                card.update_data(d)
+        # plot from the shared history (no per-card copies)
+        card.bind_store(self._history)
         return card
 
 
@@ -1485,10 +1630,13 @@ class _GraphCard(QGroupBox):
         # X + multi-Y state
         self._x_key = "timestamp"
         self._series = []            # list of {"combo": QComboBox, "key": str, "curve": PlotDataItem}
-        self._data_x = deque(maxlen=1000)
-        self._data_y = {}            # key -> deque
         self._last_grouped_items = None  # cached grouped items for filling combos
-        self._history = deque(maxlen=1000)
+
+        # Data lives in a columnar store: our own until the page binds its shared
+        # history; clear_data() just moves the first visible row forward.
+        self._history = ReadingStore(allow_new_columns=True, max_rows=4096)
+        self._owns_history = True
+        self._start_row = 0          # absolute row (store.total_rows) of the first visible sample
 
         col = QVBoxLayout(self)
         col.setContentsMargins(12, 10, 12, 12)
@@ -1593,12 +1741,6 @@ class _GraphCard(QGroupBox):
     def _remove_y_series(self, combo, row_layout):
         """Remove one Y series and its curve."""
         # remove curve
-        key = combo.property("y_key")
-        if key and key in self._data_y:
-            try:
-                del self._data_y[key]
-            except Exception:
-                pass
         for i, s in enumerate(self._series):
             if s["combo"] is combo:
                 if s["curve"] is not None and self.plot:
@@ -1682,9 +1824,6 @@ class _GraphCard(QGroupBox):
                 break
 
         combo.setProperty("y_key", key)
-        # prepare deque for this key
-        if key not in self._data_y:
-            self._data_y[key] = deque(maxlen=1000)
 
     # ---------- external API from page -------------------------------------
     def set_available_series(self, keys: list[str]):
@@ -1755,14 +1894,16 @@ class _GraphCard(QGroupBox):
     def get_x_key(self):
         return self._x_key
 
+    def bind_store(self, store):
+        """Plot from a shared ReadingStore instead of our own copy."""
+        self._history = store
+        self._owns_history = False
+        self._start_row = 0
+        self._rebuild_from_history()
+
     def clear_data(self):
         """Clear only the data; keep axes, selectors, and curves."""
-        try:
-            self._data_x.clear()
-            for dq in self._data_y.values():
-                dq.clear()
-        except Exception:
-            pass
+        self._start_row = self._history.total_rows
         if self.plot:
             for s in self._series:
                 if s["curve"] is not None:
@@ -1792,50 +1933,45 @@ class _GraphCard(QGroupBox):
         self._keys_set = True
 
 
-    def _rebuild_from_history(self):
-        # clear deques
-        self._data_x.clear()
-        for k in list(self._data_y.keys()):
-            self._data_y[k].clear()
+    WINDOW_ROWS = 1000       # newest rows shown per card
+    MAX_POINTS = 2000
+    DOWNSAMPLE_OVER = 1500
 
-        def _get_num(d, key):
-            try:
-                v = float(d.get(key))
-                return v if math.isfinite(v) else None
-            except Exception:
-                return None
+    def _x_column(self, start):
+        xs = self._history.column(self._x_key, start)
+        if xs is None or not np.isfinite(xs).any():
+            alias = {"stage_elapsed_s": "time_s", "test_elapsed_s": "time_s"}.get(self._x_key)
+            if alias:
+                xs = self._history.column(alias, start)
+        return xs
 
-        # refill from history
-        for d in self._history:
-            x = _get_num(d, self._x_key)
-            if x is None:
+    def _rebuild_from_history(self):
+        """Redraw every curve from (zero-copy) views of the store columns."""
+        if self.plot is None:
+            return
+        start = max(0, self._start_row - self._history.first_row,
+                    len(self._history) - self.WINDOW_ROWS)
+        xs = self._x_column(start)
+        for s in self._series:
+            key = s["key"]
+            curve = s["curve"]
+            if curve is None or not key:
                 continue
-            self._data_x.append(x)
-            for s in self._series:
-                key = s["key"]
-                if not key:
-                    continue
-                y = _get_num(d, key)
-                if y is not None:
-                    self._data_y.setdefault(key, deque(maxlen=1000)).append(y)
-
-        if self.plot:
-            for s in self._series:
-                key = s["key"]
-                curve = s["curve"]
-                if curve is None or not key:
-                    continue
-                xs = list(self._data_x)
-                ys = list(self._data_y.get(key, []))
-                # stride/trim similar to your single-series code
-                MAX_POINTS = 2000
-                if len(xs) > MAX_POINTS:
-                    xs = xs[-MAX_POINTS:]; ys = ys[-MAX_POINTS:]
-                DOWNSAMPLE_OVER = 1500
-                if len(xs) > DOWNSAMPLE_OVER:
-                    step = max(2, len(xs)//DOWNSAMPLE_OVER)
-                    xs = xs[::step]; ys = ys[::step]
-                curve.setData(xs, ys)
+            ys = self._history.column(key, start)
+            if xs is None or ys is None:
+                curve.setData([], [])
+                continue
+            n = min(len(xs), len(ys))
+            x, y = xs[:n], ys[:n]
+            mask = np.isfinite(x) & np.isfinite(y)
+            x, y = x[mask], y[mask]
+            # stride/trim similar to your single-series code
+            if len(x) > self.MAX_POINTS:
+                x = x[-self.MAX_POINTS:]; y = y[-self.MAX_POINTS:]
+            if len(x) > self.DOWNSAMPLE_OVER:
+                step = max(2, len(x) // self.DOWNSAMPLE_OVER)
+                x = x[::step]; y = y[::step]
+            curve.setData(x, y)
 
     # ---------- live update -----------------------------------------------
     def update_data(self, data: dict):
@@ -1843,52 +1979,34 @@ class _GraphCard(QGroupBox):
         if isinstance(data, dict) and data and not self._keys_set:
             self._populate_keys_once(list(data.keys()))
 
-        # keep snapshot to rebuild if axes change
-        try:
-            self._history.append({k: data.get(k) for k in data.keys()})
-        except Exception:
-            return
-
-        # extract X
-        try:
-            x = float(data.get(self._x_key, float("nan")))
-            if x != x:  # NaN
-                alias = {"stage_elapsed_s": "time_s", "test_elapsed_s": "time_s"}.get(self._x_key)
-                if alias in data:
-                    x = float(data.get(alias))
-        except Exception:
-            return
-        if not math.isfinite(x):
-            return
-        self._data_x.append(x)
+        # standalone card keeps its own store; bound cards read the page's
+        if self._owns_history:
+            try:
+                self._history.append(data)
+            except Exception:
+                return
 
         if self.plot is None:
             keys = ", ".join(list(data.keys())[:6])
             self.body.setText(f"Live keys: {keys if keys else '—'}")
             return
 
-        # update each Y series
-        for s in self._series:
-            key = s["key"]
-            curve = s["curve"]
-            if not key or curve is None:
-                continue
-            try:
-                y = float(data.get(key, float("nan")))
-            except Exception:
-                continue
-            if not math.isfinite(y):
-                continue
-            self._data_y.setdefault(key, deque(maxlen=1000)).append(y)
-
-            # build strided data for this series
-            xs = list(self._data_x)
-            ys = list(self._data_y[key])
-            MAX_POINTS = 2000
-            if len(xs) > MAX_POINTS:
-                xs = xs[-MAX_POINTS:]; ys = ys[-MAX_POINTS:]
-            DOWNSAMPLE_OVER = 1500
-            if len(xs) > DOWNSAMPLE_OVER:
-                step = max(2, len(xs)//DOWNSAMPLE_OVER)
-                xs = xs[::step]; ys = ys[::step]
-            curve.setData(xs, ys)
+        self._rebuild_from_history()
+
+    def update_batch(self, rows):
+        """Append a block of readings and redraw once."""
+        if not rows:
+            return
+        if not self._keys_set:
+            self._populate_keys_once(list(rows[-1].keys()))
+        if self._owns_history:
+            for r in rows:
+                try:
+                    self._history.append(r)
+                except Exception:
+                    pass
+        if self.plot is None:
+            keys = ", ".join(list(rows[-1].keys())[:6])
+            self.body.setText(f"Live keys: {keys if keys else '—'}")
+            return
+        self._rebuild_from_history()
@@ -1,15 +1,28 @@
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal, QThread, QReadWriteLock
+from PyQt5.QtCore import QObject, pyqtSignal, QReadWriteLock
 from PyQt5.QtWidgets import QMessageBox
 import time
-import csv
+import os
+import json
+import shutil
+from acquisition.event_index import EventIndex
+from acquisition.latency_trace import LatencyTracer, reading_trace
+from acquisition.loop_timing import BUCKETS_MS
+from acquisition.reading import Reading
+from acquisition.reading_batch import ReadingBatcher
+from acquisition.reading_store import ReadingStore
+from acquisition.run_log import DEADBAND_TOLERANCES, RunLogWriter
+from acquisition.sample_broker import DEFAULT_SOURCE_RATES, SampleBroker, register_rig_sources
+from acquisition.sample_fusion import fuse
+from acquisition.sampling_policy import FixedPolicy, policy_for_stage
+from acquisition.test_journal import TestJournal
 from stages.automated_docking_stage import AutomatedDockingStage
 from stages.saturation_stage import SaturationStage
 from stages.bcheck_stage import BCheckStage
 from stages.consolidation_stage import ConsolidationStage
 from stages.shear_stage import ShearStage
+from stages.stage_executor import StageExecutor
 from contextlib import contextmanager
 from typing import Optional, Dict, List
-from sip import isdeleted
 
 
 STAGE_CLASS_MAP = {
@@ -20,40 +33,26 @@ STAGE_CLASS_MAP = {
     "Shear": ShearStage,
 }
 
-class StageWorker(QObject):
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
-
-    def __init__(self, stage_instance):
-        super().__init__()
-        self.stage = stage_instance
-
-    def run(self):
-        try:
-            self.stage.run()
-            self.finished.emit()
-        except Exception as e:
-            self.error.emit(str(e))
-
-    def stop(self):
-        """Forward stop request to the stage instance if supported."""
-        try:
-            if hasattr(self.stage, "stop"):
-                self.stage.stop()
-        except Exception:
-            pass
-
+# Per-stage producer rates (s) on top of the test's device rates: load and
+# frame position fast while docking/shearing, pressures/volumes slow while
+# consolidating.
+STAGE_RATE_PROFILES = {
+    "Automated Docking": {"serial_pad": 0.05, "lf": 0.1},
+    "Shear": {"serial_pad": 0.05, "lf": 0.1},
+    "Consolidation": {"cell_pc": 1.0, "back_pc": 1.0, "lf": 1.0},
+}
 
 class TriaxialTestManager(QObject):
     stage_changed = pyqtSignal(str)
     reading_updated = pyqtSignal(dict)
+    readings_batch = pyqtSignal(object)  # ReadingBatch, one per UI frame
     test_finished = pyqtSignal()
     test_started = pyqtSignal(float)     
     stage_started = pyqtSignal(float)    
     stage_completed = pyqtSignal(int)    # emits stage index when a stage completes
 
     def __init__(self, lf_controller, cell_pressure_controller, back_pressure_controller,
-                 serial_pad, test_config, main_window=None, log=print):
+                 serial_pad, test_config, main_window=None, log=print, broker=None):
         super().__init__()
         # --- inside TriaxialTestManager.__init__ ---
         def _unwrap(dev):
@@ -73,12 +72,16 @@ class TriaxialTestManager(QObject):
 
         self.current_stage_index = -1
         self.start_time = None
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._tick)
 
-        self.data_log = []
+        # columnar (float64 per channel) rolling window; the full run goes to the run log
+        self.data_log = ReadingStore(max_rows=int(test_config.get("memory_window_rows", 20000)))
         self.running = False
         self.config = test_config
+
+        # append-only on-disk run log (opened in start())
+        self.run_dir = test_config.get("run_dir", "runs")
+        self.run_log = None
+        self.run_log_path = None
         self.stages = test_config["stages"]  # ✅ ensures it's a list
 
         self.main_window = main_window
@@ -89,10 +92,66 @@ class TriaxialTestManager(QObject):
         self.test_start_ts = None
         self.stage_start_ts = None
         
-        self._last_emit_ts = 0.0
         self.sampling_period_s = float(test_config.get("sampling_period_s", 0.5))
-        self._emit_interval_s = max(0.05, self.sampling_period_s)
-        self._tick_ms = int(self._emit_interval_s * 1000)
+        # per-device producer rates (s); STAGE_RATE_PROFILES adjusts them per stage
+        self.source_rates = dict(DEFAULT_SOURCE_RATES, **(test_config.get("device_rates_s") or {}))
+
+        # One producer per device; _tick and the stages read its latest-value board
+        self._owns_broker = broker is None
+        self.broker = broker if broker is not None else SampleBroker(log=log)
+        register_rig_sources(self.broker, lf=self.lf, cell_pc=self.cell_pc,
+                             back_pc=self.back_pc, serial_pad=self.serial_pad,
+                             rates=self.source_rates)
+
+        # Rows are aligned to (now - fusion_delay_s): every device has usually
+        # reported on both sides of that instant, so values can be interpolated
+        # instead of mixing samples of different ages.
+        self.fusion_delay_s = float(test_config.get("fusion_delay_s", 0.25))
+        self.fusion_window_s = float(test_config.get("fusion_window_s", 1.5))
+        self.last_fusion_skew = {}
+
+        # Opt-in: which rows reach the run log is decided per stage type (log-time
+        # spacing in consolidation, change-triggered + load-rate boost in
+        # shear/docking, ...). Off, every sampled reading is stored.
+        self.adaptive_sampling = bool(test_config.get("adaptive_sampling", False))
+
+        # Optional deadband compression of the run log: True for the default
+        # tolerances, or a {channel: tolerance} dict; rows are still forced out
+        # every log_max_interval_s
+        db = test_config.get("log_deadband", False)
+        self.log_deadband = (dict(DEADBAND_TOLERANCES, **db) if isinstance(db, dict)
+                             else dict(DEADBAND_TOLERANCES) if db else None)
+        self.log_max_interval_s = float(test_config.get("log_max_interval_s", 60.0))
+        self.sampling_policy = FixedPolicy()
+        self.rows_skipped = 0
+
+        # stamp each reading with its devices' read/parse/publish times and its
+        # own record time; the Test View adds deliver/enrich/render
+        self.latency_trace = bool(test_config.get("latency_trace", True))
+        self.latency = LatencyTracer()      # acquire→record per device, journaled with loop timing
+
+        # False when there is no GUI to ask (acquisition process, headless runs):
+        # device prompts are answered from test_config instead of a dialog
+        self.interactive = bool(test_config.get("interactive", True))
+        self.continue_on_missing_devices = bool(test_config.get("continue_on_missing_devices", False))
+
+        # Manager ticks and stage samples are coalesced on the producer side and
+        # cross to the GUI thread as one readings_batch per UI frame.
+        self.ui_batcher = ReadingBatcher(self.readings_batch.emit,
+                                         interval_s=float(test_config.get("ui_batch_interval_s", 0.075)))
+
+        # Row recording is one more task on the broker's deadline scheduler (off
+        # the GUI thread); results reach the UI via the batcher (and reading_updated).
+        self.scheduler = self.broker.scheduler
+        # period/jitter/work stats of the scheduler tasks and the stage control loops;
+        # a per-stage LOOP_TIMING event is journaled at every stage end
+        self.loop_timing = self.scheduler.timing
+        self._timed_stage = None
+        self._open_stage = None            # stage index whose STAGE_END is still owed
+        self.acq = self.scheduler.add_task(
+            "record", self._tick, self._on_reading_acquired,
+            period_s=max(0.05, self.sampling_period_s), priority=40,
+        )
 
         self.sample_id = test_config.get("sample_id", "")
         self.sample_height_cm = float(test_config.get("sample_height_cm", 0.0))
@@ -109,8 +168,23 @@ class TriaxialTestManager(QObject):
         self._stage_paused_total = 0.0
         self._stage_pause_enter_mono = None
 
-        # event log (simple JSON-serializable dicts)
+        # event log (simple JSON-serializable dicts), mirrored to the journal; each
+        # event carries the run-log row/offset it happened at, indexed for slicing
         self.events = []
+        self.event_index = EventIndex()
+
+        # one long-lived stage thread; the next stage is built/validated while
+        # the operator is still looking at the finished one
+        self.current_stage = None
+        self.executor = StageExecutor(log=self.log)
+        self.executor.stage_finished.connect(self._on_executor_finished)
+        self.executor.stage_error.connect(self._on_executor_error)
+        self._prewarmed = None            # (index, StageData, stage instance)
+
+        # crash-safe write-ahead journal (opened with the run log in start())
+        self.journal = None
+        self.checkpoint_interval_s = float(test_config.get("checkpoint_interval_s", 5.0))
+        self._last_checkpoint_mono = 0.0
 
 
     def start(self):
@@ -123,15 +197,27 @@ class TriaxialTestManager(QObject):
         self._test_start_mono = time.monotonic()
         self._test_paused_total = 0.0
         self._test_pause_enter_mono = None
-        self.events.append({"event":"TEST_START","wall_ts": self.test_start_ts})
+        self._open_run_log()
+        self._open_journal()
+        self.loop_timing.reset()
+        self._record_event({"event":"TEST_START","wall_ts": self.test_start_ts})
+        if not self.broker.is_running():
+            self.broker.start()
         self.test_started.emit(self.test_start_ts)          # tell UI when t_test = 0
         self.current_index = 0
         self.run_stage(self.current_index)
 
+    def _on_executor_finished(self, stage):
+        if stage is not self.current_stage or not self.running:
+            return      # late completion of a stage that was already replaced (or a finished test)
+        self.log(f"[✓] Finished stage: {getattr(stage.data, 'name', '')}")
+        self._on_stage_complete()
+
+    def _on_executor_error(self, stage, msg):
+        self.log(f"[!] Error running stage: {msg}")
+
     def _on_stage_complete(self):
-        self.thread = None
-        self.worker = None
-        self.timer.stop()
+        self.acq.stop()
         # event + signal
         if self.stop_requested:
             self.log("[DEBUG] Stage ended by stop request (flag stays True)")
@@ -139,10 +225,9 @@ class TriaxialTestManager(QObject):
             self.stop_requested = False
             self.log("[DEBUG] Stage ended naturally (flag cleared)")
             
-        try:
-            self.events.append({"event":"STAGE_END","stage_index": self.current_index, "wall_ts": time.time()})
-        except Exception:
-            pass
+        self._record_stage_end()
+        self._record_loop_timing()
+        self.ui_batcher.flush()
         try:
             self.stage_completed.emit(self.current_index)
         except Exception:
@@ -151,6 +236,7 @@ class TriaxialTestManager(QObject):
         # Continue to next stage logic
         if self.current_index + 1 < len(self.stages):
             self.log("[→] Waiting for 'Next Stage' input...")
+            self._prewarm_stage(self.current_index + 1)
         else:
             self.finish()
             
@@ -205,6 +291,7 @@ class TriaxialTestManager(QObject):
             for k, v in (updates or {}).items():
                 if hasattr(s, k):
                     setattr(s, k, v)
+        self._journal_plan("edit", stage_id=stage_id, updates=updates)
         return True
 
     def add_stage(self, new_stage, index=None) -> bool:
@@ -212,6 +299,7 @@ class TriaxialTestManager(QObject):
         if index is None or index > len(self.stages):
             index = len(self.stages)
         self.stages.insert(index, new_stage)
+        self._journal_plan("add", index=index)
         return True
 
     def remove_stage(self, stage_id: str) -> bool:
@@ -220,19 +308,32 @@ class TriaxialTestManager(QObject):
         if idx is None:
             return False
         del self.stages[idx]
+        self._journal_plan("remove", stage_id=stage_id)
         return True
 
 
-    def run_stage(self, index):
+    def run_stage(self, index, resume: Optional[dict] = None):
+        """
+        Start stage `index`. `resume` ({"stage_start_ts", "elapsed_s"}) continues
+        a stage interrupted by a crash instead of starting it fresh.
+        """
         if 0 <= index < len(self.stages):
             self.current_stage_index = index  # <-- keep _tick() in sync
+            self.current_index = index
             self._resume_armed = True
             stage_data = self.stages[index]
-            self.stage_start_ts = time.time()
+            self.stage_start_ts = (resume or {}).get("stage_start_ts") or time.time()
             self._stage_start_mono = time.monotonic()
             self._stage_paused_total = 0.0
             self._stage_pause_enter_mono = None
-            self.events.append({"event":"STAGE_START","stage_index": index, "stage_name": stage_data.name, "wall_ts": self.stage_start_ts})
+            self._record_loop_timing()        # previous stage, if it was stopped rather than finished
+            self._timed_stage = index
+            self._apply_stage_rates(stage_data.stage_type)
+            self._apply_sampling_policy(stage_data.stage_type)
+            self._record_stage_end("replaced")    # previous stage, if it never reported back
+            self._record_event({"event": "STAGE_RESUME" if resume else "STAGE_START", "stage_index": index,
+                                "stage_name": stage_data.name, "wall_ts": self.stage_start_ts})
+            self._open_stage = index
             self.stage_started.emit(self.stage_start_ts) 
             self.log(f"[→] Starting stage: {stage_data.name}")
             self.stage_changed.emit(stage_data.name)
@@ -240,98 +341,84 @@ class TriaxialTestManager(QObject):
             self.start_time = time.time()
             self.is_paused = False
             self.stop_requested = False
-            self.timer.start(getattr(self, "_tick_ms", 500))  # default; we’ll make this user-configurable later
-
-            stage_class = STAGE_CLASS_MAP.get(stage_data.stage_type)
-            if stage_class:
-                u_lf   = getattr(self.lf, "driver", self.lf)
-                u_cell = getattr(self.cell_pc, "driver", self.cell_pc)
-                u_back = getattr(self.back_pc, "driver", self.back_pc)
-
-                # ✅ actually create the stage instance first
-                stage_instance = stage_class(stage_data, u_lf, u_cell, u_back, self.serial_pad, self.log)
+            self.acq.start()
+
+            # prewarmed instance (built + device-checked while waiting) or a fresh one
+            stage_instance = self._take_prewarmed(index, stage_data)
+            validated = stage_instance is not None
+            if stage_instance is None:
+                stage_instance = self._build_stage(stage_data)
+            if stage_instance is not None:
                 self.current_stage = stage_instance
 
-                if not self._check_stage_devices(stage_instance):
+                if not validated and not self._check_stage_devices(stage_instance):
                     self.log(f"[!] Stage '{stage_data.name}' aborted by user due to missing device(s).")
                     return
 
                 # ✅ now that it's real, you can attach publishers
                 stage_instance.attach_publisher(
-                    self.reading_updated.emit,
+                    self._publish_reading,
                     test_start_ts=self.test_start_ts,
                     stage_index=self.current_stage_index
                 )
+                stage_instance.broker = self.broker   # read shared device values, not the bus
+                stage_instance.loop_timing = self.loop_timing
+                stage_instance.resume_elapsed_s = float((resume or {}).get("elapsed_s") or 0.0)
                 stage_instance.mark_stage_start()  # anchor stage elapsed time
 
-                # Start in new thread
-                self.thread = QThread()
-                self.worker = StageWorker(stage_instance)
-                self.worker.moveToThread(self.thread)
-
-                self.thread.started.connect(self.worker.run)
-                self.worker.finished.connect(self.thread.quit)
-                self.worker.finished.connect(lambda: self.log(f"[✓] Finished stage: {stage_data.name}"))
-                self.worker.finished.connect(self._on_stage_complete)
-                self.worker.error.connect(lambda msg: self.log(f"[!] Error running stage: {msg}"))
-
-                self.thread.finished.connect(self.worker.deleteLater)
-                self.thread.finished.connect(self.thread.deleteLater)
-
-                self.thread.start()
+                # hand it to the long-lived stage thread
+                self.executor.submit(stage_instance)
             else:
                 self.log(f"[!] Unknown stage type: {stage_data.stage_type}")
 
+    def _build_stage(self, stage_data):
+        stage_class = STAGE_CLASS_MAP.get(stage_data.stage_type)
+        if stage_class is None:
+            return None
+        u_lf   = getattr(self.lf, "driver", self.lf)
+        u_cell = getattr(self.cell_pc, "driver", self.cell_pc)
+        u_back = getattr(self.back_pc, "driver", self.back_pc)
+        return stage_class(stage_data, u_lf, u_cell, u_back, self.serial_pad, self.log)
+
+    def _prewarm_stage(self, index: int):
+        """Build and device-check stage `index` ahead of 'Next Stage' (silently; run_stage asks if needed)."""
+        self._prewarmed = None
+        if not (0 <= index < len(self.stages)):
+            return
+        stage_data = self.stages[index]
+        try:
+            inst = self._build_stage(stage_data)
+        except Exception as e:
+            self.log(f"[!] Could not prepare stage '{stage_data.name}': {e}")
+            return
+        if inst is not None and not self._missing_stage_devices(inst):
+            self._prewarmed = (index, stage_data, inst)
+
+    def _take_prewarmed(self, index: int, stage_data):
+        pw, self._prewarmed = self._prewarmed, None
+        if pw is None or pw[0] != index or pw[1] is not stage_data:
+            return None     # plan changed since it was built
+        return pw[2]
+
 
     def _stop_thread(self):
-        """Gracefully stop the QThread running the current stage."""
-        # Ask the stage to stop
+        """Cancel the running stage and wait (cooperatively) for the stage thread to go idle."""
         try:
             if self.current_stage and hasattr(self.current_stage, "stop"):
                 self.current_stage.stop()
         except Exception:
             pass
-
-        th = getattr(self, "thread", None)
-
-        # If not a QThread or already deleted, just clear and return
-        if not isinstance(th, QThread) or isdeleted(th):
-            self.thread = None
-            self.worker = None
-            return
-
-        try:
-            if th.isRunning():
-                try: th.requestInterruption()
-                except Exception: pass
-                try: th.quit()
-                except Exception: pass
-                if not th.wait(2000):
-                    try:
-                        th.terminate()
-                        th.wait(1000)
-                    except Exception:
-                        pass
-        except RuntimeError:
-            # Underlying C++ object may have been deleted between checks
-            pass
-        finally:
-            self.thread = None
-            self.worker = None
+        if self.executor.is_busy():
+            self.executor.stop_current(timeout_s=2.0)
 
     def stop_stage(self):
         """Stop the current stage cleanly."""
         self.stop_requested = True
         self.last_stop_requested = True 
         try:
-            self.timer.stop()
+            self.acq.stop()
         except Exception:
             pass
-        if hasattr(self, "worker") and self.worker:
-            try:
-                self.worker.stop()
-            except Exception:
-                pass
         self._stop_thread()
 
 
@@ -341,28 +428,49 @@ class TriaxialTestManager(QObject):
             self._post_stop_cancelled = False  # reset
             return   # <- exit cleanly, do not finalize or end test
         self.running = False
-        self.timer.stop()
+        self.acq.stop()
         self._stop_thread()
+        self._record_stage_end("stopped")
+        self.executor.shutdown()
+        self.ui_batcher.flush()
+        self._close_run_log()
+        if self._owns_broker:
+            self.broker.stop()
+        else:
+            self._apply_stage_rates(None)
         self.log("[✓] Triaxial test complete.")
-        self.events.append({"event":"TEST_END","wall_ts": time.time()})
+        self._record_loop_timing()
+        self._record_event({"event":"TEST_END","wall_ts": time.time()})
+        self._write_loop_timing_file()
+        self._close_journal("finished")
         self.test_finished.emit()
-        try:
-            with open(f"triaxial_events_{int(time.time())}.jsonl","w") as ef:
-                for ev in self.events:
-                    import json; ef.write(json.dumps(ev)+"\n")
-        except Exception as e:
-            self.log(f"[!] Failed to write events log: {e}")
 
     def abort(self):
         self.running = False
-        self.timer.stop()
+        self.acq.stop()
         self._stop_thread()
+        self._record_stage_end("aborted")
+        self.executor.shutdown()
+        self.ui_batcher.flush()
+        self._close_run_log()
+        if self._owns_broker:
+            self.broker.stop()
+        else:
+            self._apply_stage_rates(None)
+        self._record_event({"event":"TEST_ABORT","wall_ts": time.time()})
+        self._record_loop_timing()
+        self._write_loop_timing_file()
+        self._close_journal("aborted")
         self.log("[✗] Test aborted.")
         self.test_finished.emit()  
             
     def next_stage(self):
+        stopped = self.executor.is_busy() or self.stop_requested
         self._stop_thread()
-        self._flush_controllers()
+        # an interrupted stage's late completion is ignored by _on_executor_finished
+        self._record_stage_end("next_stage")
+        # settle time only matters after interrupting motion; a finished stage already halted
+        self._flush_controllers(settle_s=0.15 if stopped else 0.0)
         idx = self.current_stage_index + 1
 
         vp = getattr(self, "view_page", None)
@@ -388,16 +496,19 @@ class TriaxialTestManager(QObject):
 
 
     def _tick(self):
+        """Build one reading. Runs on the acquisition thread, not the GUI thread."""
         if self.is_paused:
-            return
+            return None
 
-        now = time.time()
+        # common time base for this row (see fusion_delay_s)
+        t_ref = time.monotonic() - self.fusion_delay_s
+        now = time.time() - self.fusion_delay_s
 
         # Elapsed clocks (robust to None)
         t0 = self.test_start_ts or now
         s0 = self.stage_start_ts or now
-        test_elapsed  = now - t0
-        stage_elapsed = now - s0
+        test_elapsed  = max(0.0, now - t0)
+        stage_elapsed = max(0.0, now - s0)
 
         # Stage label
         try:
@@ -406,85 +517,63 @@ class TriaxialTestManager(QObject):
         except Exception:
             stage_name = f"Stage {self.current_stage_index + 1}"
 
-        readings = {
-            "timestamp": now,
-            "test_elapsed_s": round(test_elapsed, 3),
-            "stage_elapsed_s": round(stage_elapsed, 3),
-            "time_s": round(stage_elapsed, 3),
-            "stage_index": self.current_stage_index,
-            "stage_name": stage_name,
-
-            # keep date per row (overnight runs)
-            "date": time.strftime("%Y-%m-%d", time.localtime(now)),
-
-            # values filled below...
-            "cell_pressure_kpa": None, "back_pressure_kpa": None,
-            "cell_volume_mm3": None, "back_volume_mm3": None,
-            "position_mm": None, "transducers": [],
-        }
-
-        # --- helpers: cached → quick live read fallback
-        def _cached(dev, attr, freshness=1.5):
-            try:
-                fn = getattr(dev, attr, None)
-                return float(fn(freshness)) if callable(fn) else None
-            except Exception:
-                return None
+        # fixed-slot record; date/time_s/transducer_i are derived when read
+        readings = Reading()
+        readings.timestamp = now
+        readings.test_elapsed_s = test_elapsed
+        readings.stage_elapsed_s = stage_elapsed
+        readings.stage_index = self.current_stage_index
+        readings.stage_name = stage_name
+
+        # Device values come from the broker (one producer per device, each sample
+        # stamped with its own acquisition time), aligned onto t_ref; this tick
+        # never touches a bus itself.
+        board, self.last_fusion_skew = fuse(
+            self.broker,
+            ("cell_pressure_kpa", "cell_volume_mm3", "back_pressure_kpa", "back_volume_mm3",
+             "position_mm", "axial_load_kN", "pore_pressure_kpa", "axial_displacement_mm",
+             "transducers"),
+            t_ref, window_s=self.fusion_window_s,
+        )
+        for k, v in board.items():
+            setattr(readings, k, v)
+        if self.latency_trace:
+            readings.trace = tr = reading_trace(self.broker, time.monotonic())
+            for dev, (t_read, t_parse, t_pub) in tr["devices"].items():
+                self.latency.add(f"device:{dev}", {"acquire": t_read, "parse": t_parse,
+                                                   "publish": t_pub, "record": tr["record"]})
+
+        return readings
+
+    def _on_reading_acquired(self, readings: Reading):
+        """Book-keeping + emit (scheduler thread; the signal is queued to the GUI)."""
+        self.data_log.append(readings)
 
-        def _live(dev, attr, **kw):
-            try:
-                fn = getattr(dev, attr, None)
-                val = fn(**kw) if callable(fn) else None
-                return float(val) if val is not None else None
-            except Exception:
-                return None
-
-        # Fill pressures/volumes (don’t block if cache is fresh)
-        if self.cell_pc:
-            readings["cell_pressure_kpa"] = (
-                _cached(self.cell_pc, "get_cached_pressure") or
-                _live(self.cell_pc, "read_pressure_kpa", timeout_s=0.15)
-            )
-            readings["cell_volume_mm3"] = (
-                _cached(self.cell_pc, "get_cached_volume") or
-                _live(self.cell_pc, "read_volume_mm3", timeout_s=0.15)
-            )
-        if self.back_pc:
-            readings["back_pressure_kpa"] = (
-                _cached(self.back_pc, "get_cached_pressure") or
-                _live(self.back_pc, "read_pressure_kpa", timeout_s=0.15)
-            )
-            readings["back_volume_mm3"] = (
-                _cached(self.back_pc, "get_cached_volume") or
-                _live(self.back_pc, "read_volume_mm3", timeout_s=0.15)
-            )
-
-        # Frame position (best-effort)
-        if self.lf:
-            readings["position_mm"] = (
-                _cached(self.lf, "get_cached_position") or
-                _live(self.lf, "read_position_mm", timeout_s=0.1)
-            )
-
-        # SerialPad channels (if available)
+        # every reading goes to the live view; the stage's policy thins what is stored
+        record = True
         try:
-            if self.serial_pad:
-                channels = self.serial_pad.read_channels()
-                readings["transducers"] = channels
-                if channels and len(channels) >= 3:
-                    readings["axial_load_kN"]          = channels[0]
-                    readings["pore_pressure_kpa"]      = channels[1]
-                    readings["axial_displacement_mm"]  = channels[2]
+            record = self.sampling_policy.should_record(readings)
+            period = self.sampling_policy.tick_period_s(readings)
+            if period:
+                self.scheduler.set_rate("record", max(0.05, period))
         except Exception as e:
-            self.log(f"[!] Error during reading: {e}")
-
-        # book-keeping + emit (throttled)
-        self.data_log.append(readings)
+            self.log(f"[!] Sampling policy failed: {e}")
+        if not record:
+            self.rows_skipped += 1
+        elif self.run_log is not None:
+            try:
+                self.run_log.append(readings)
+            except Exception as e:
+                self.log(f"[!] Run log write failed: {e}")
         self.shared_data = readings
+        self._maybe_checkpoint(readings)
+        self._publish_reading(readings)
 
-        if (now - self._last_emit_ts) >= self._emit_interval_s:
-            self._last_emit_ts = now
-            self.reading_updated.emit(readings)
+    def _publish_reading(self, reading: dict):
+        """Hand a reading to the UI (producer thread; batched per frame)."""
+        self.ui_batcher.push(reading)
+        if self.receivers(self.reading_updated) > 0:
+            self.reading_updated.emit(reading.to_dict() if isinstance(reading, Reading) else reading)
 
 
     def pause(self):
@@ -498,13 +587,12 @@ class TriaxialTestManager(QObject):
         except Exception:
             pass
         try:
-            self.events.append({"event":"PAUSE","wall_ts": time.time(), "stage_index": self.current_stage_index})
+            self._record_event({"event":"PAUSE","wall_ts": time.time(), "stage_index": self.current_stage_index})
         except Exception:
             pass
-        # stop manager polling timer
+        # pause manager acquisition (thread stays alive, just idles)
         try:
-            if self.timer.isActive():
-                self.timer.stop()
+            self.acq.pause()
         except Exception:
             pass
         # try to pause the stage logic if the stage implements it
@@ -532,13 +620,13 @@ class TriaxialTestManager(QObject):
         except Exception:
             pass
         try:
-            self.events.append({"event":"RESUME","wall_ts": time.time(), "stage_index": self.current_stage_index})
+            self._record_event({"event":"RESUME","wall_ts": time.time(), "stage_index": self.current_stage_index})
         except Exception:
             pass
-        # restart manager polling timer
+        # restart manager acquisition at the configured sampling period
         try:
-            if not self.timer.isActive():
-                self.timer.start(500)   # same cadence you start with in run_stage()
+            if not self.acq.is_active():
+                self.acq.start()
         except Exception:
             pass
         # try to resume the stage logic if the stage implements it
@@ -551,9 +639,9 @@ class TriaxialTestManager(QObject):
 
     def stop_current_stage(self):
         self.stop_requested = True
-        try: self.timer.stop()
+        try: self.acq.stop()
         except Exception: pass
-        self._stop_thread()   # must wait out the QThread (quit/wait/terminate fallback)
+        self._stop_thread()   # cancels the stage and waits for the stage thread to go idle
 
 
     def advance_to_next_stage(self):
@@ -573,18 +661,208 @@ class TriaxialTestManager(QObject):
             self.log(f"[!] Failed to send displacement: {e}")
 
 
+    def _run_file_stem(self) -> str:
+        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in str(self.sample_id)) or "triaxial"
+        stamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(self.test_start_ts))
+        return os.path.join(self.run_dir, f"{safe_id}_{stamp}")
+
+    def _open_run_log(self, path: Optional[str] = None, append: bool = False):
+        self._close_run_log()
+        path = path or (self._run_file_stem() + ".csv")
+        try:
+            self.run_log = RunLogWriter(path, log=self.log, deadband=self.log_deadband,
+                                        max_interval_s=self.log_max_interval_s).open(append=append)
+            self.run_log_path = path
+            self.log(f"[*] Run log: {path}")
+        except Exception as e:
+            self.run_log = None
+            self.log(f"[!] Could not open run log {path}: {e}")
+
+    def _close_run_log(self):
+        if self.run_log is not None:
+            try:
+                self.run_log.close()
+            except Exception as e:
+                self.log(f"[!] Failed to close run log: {e}")
+
+    def _apply_sampling_policy(self, stage_type: Optional[str]):
+        self.sampling_policy = (policy_for_stage(stage_type, self.sampling_period_s)
+                                if self.adaptive_sampling else FixedPolicy())
+        self.sampling_policy.reset()
+        self.scheduler.set_rate("record", max(0.05, self.sampling_period_s))
+
+    def _apply_stage_rates(self, stage_type: Optional[str]):
+        """Set each device producer's rate for this stage type (None = test defaults)."""
+        rates = dict(self.source_rates, **STAGE_RATE_PROFILES.get(stage_type, {}))
+        for name, period_s in rates.items():
+            self.broker.set_source_rate(name, period_s)
+
+    # ---------------
+    # Journal (crash recovery)
+    # ---------------
+    def _stage_plan(self) -> List[dict]:
+        out = []
+        for st in self.stages:
+            if hasattr(st, "to_dict"):
+                out.append(st.to_dict())
+            else:
+                out.append({k: v for k, v in vars(st).items() if not k.startswith("_") and k != "readings"})
+        return out
+
+    def _open_journal(self, path: Optional[str] = None, append: bool = False):
+        self._close_journal(None)
+        path = path or (self._run_file_stem() + ".journal.jsonl")
+        try:
+            self.journal = TestJournal(path, log=self.log).open(append=append)
+        except Exception as e:
+            self.journal = None
+            self.log(f"[!] Could not open test journal {path}: {e}")
+            return
+        if not append:
+            config = {k: v for k, v in self.config.items() if k != "stages"}
+            self.journal.write("header", test_start_ts=self.test_start_ts, run_log_path=self.run_log_path,
+                               config=config, stages=self._stage_plan())
+
+    def _close_journal(self, reason: Optional[str]):
+        if self.journal is None:
+            return
+        if reason:
+            self.journal.write("end", reason=reason)
+        self.journal.close()
+        self.journal = None
+
+    def _record_event(self, ev: dict):
+        if self.run_log is not None:
+            ev["row"], ev["offset"] = self.run_log.position()
+        ev["data_row"] = self.data_log.total_rows
+        self.events.append(ev)
+        self.event_index.add(ev)
+        if self.journal is not None:
+            self.journal.write("event", **ev)
+
+    def _record_stage_end(self, reason: Optional[str] = None):
+        """STAGE_END for the open stage (once): natural end, Next Stage, finish or abort."""
+        idx, self._open_stage = self._open_stage, None
+        if idx is None:
+            return
+        ev = {"event": "STAGE_END", "stage_index": idx, "wall_ts": time.time()}
+        if reason:
+            ev["reason"] = reason
+        try:
+            self._record_event(ev)
+        except Exception:
+            pass
+
+    def _record_loop_timing(self):
+        """Journal the loop timing of the stage that just ended (once), then start the stats afresh."""
+        idx, self._timed_stage = self._timed_stage, None
+        if idx is None:
+            return
+        try:
+            loops = {k: v for k, v in self.loop_timing.snapshot().items() if v["count"]}
+            latency = self.latency.snapshot()
+            if loops or latency:
+                self._record_event({"event": "LOOP_TIMING", "stage_index": idx,
+                                    "wall_ts": time.time(), "loops": loops, "latency": latency})
+            self.loop_timing.reset()
+            self.latency.reset()
+        except Exception as e:
+            self.log(f"[!] Loop timing dump failed: {e}")
+
+    def _write_loop_timing_file(self):
+        """All LOOP_TIMING records of the run next to the run log (<run>.timing.json)."""
+        if not self.run_log_path:
+            return
+        recs = [e for e in self.events if e.get("event") == "LOOP_TIMING"]
+        if not recs:
+            return
+        path = os.path.splitext(self.run_log_path)[0] + ".timing.json"
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"buckets_ms": [b if b != float("inf") else None for b in BUCKETS_MS],
+                           "stages": recs}, f, indent=1)
+        except Exception as e:
+            self.log(f"[!] Could not write loop timing file: {e}")
+
+    def _journal_plan(self, change: str, **info):
+        if self.journal is not None:
+            self.journal.write("plan", change=change, stages=self._stage_plan(), **info)
+
+    def _maybe_checkpoint(self, readings: dict):
+        if self.journal is None:
+            return
+        nowm = time.monotonic()
+        if (nowm - self._last_checkpoint_mono) < self.checkpoint_interval_s:
+            return
+        self._last_checkpoint_mono = nowm
+        self.flush_run_log()
+        self.journal.write(
+            "checkpoint",
+            stage_index=self.current_stage_index,
+            stage_start_ts=self.stage_start_ts,
+            stage_elapsed_s=readings.get("stage_elapsed_s"),
+            test_elapsed_s=readings.get("test_elapsed_s"),
+            rows=self.run_log.total_rows_written() if self.run_log is not None else None,
+        )
+
+    def resume_from_journal(self, state):
+        """
+        Continue a test interrupted by a crash/reboot (state = JournalState).
+        The stage plan, clocks, run log and journal are picked up where they
+        stopped; the interrupted stage restarts from its last checkpoint.
+        """
+        idx = state.stage_index
+        self.log(f"[*] Resuming interrupted test from {state.path} (stage {idx + 1}).")
+        self.running = True
+        self.test_start_ts = state.test_start_ts or time.time()
+        self.test_date_str = time.strftime("%Y-%m-%d", time.localtime(self.test_start_ts))
+        self._test_start_mono = time.monotonic() - state.test_elapsed_s
+        self._test_paused_total = 0.0
+        self._test_pause_enter_mono = None
+        self.events = list(state.events)
+        self.event_index = EventIndex(self.events)
+
+        if state.run_log_path:
+            self._open_run_log(state.run_log_path, append=True)
+        self._open_journal(state.path, append=True)
+        self._record_event({"event": "TEST_RECOVERED", "wall_ts": time.time(), "stage_index": idx})
+        if not self.broker.is_running():
+            self.broker.start()
+        self.test_started.emit(self.test_start_ts)
+
+        self.current_index = idx
+        if state.stage_completed(idx):
+            # crashed between stages: wait for 'Next Stage' like a normal stage end
+            self.current_stage_index = idx
+            self.stage_completed.emit(idx)
+            return
+        cp = state.checkpoint or {}
+        stage_start_ts = cp.get("stage_start_ts") if cp.get("stage_index") == idx else None
+        self.run_stage(idx, resume={"stage_start_ts": stage_start_ts,
+                                    "elapsed_s": state.stage_elapsed_s if stage_start_ts else 0.0})
+
+    def run_log_span(self, stage_index: Optional[int] = None, since: Optional[str] = None):
+        """RowSpan of the run log for one stage or since the latest `since` event (None = whole log)."""
+        if stage_index is not None:
+            return self.event_index.stage_span(stage_index)
+        if since:
+            return self.event_index.since(since)
+        return None
+
+    def flush_run_log(self):
+        """Push buffered rows to disk so readers see everything acquired so far."""
+        if self.run_log is not None:
+            self.run_log.flush()
+
     def _save_log_to_csv(self):
         filename = f"triaxial_log_{int(time.time())}.csv"
-        self.log(f"[*] Saving log to {filename}")
-        if not self.data_log:
+        if not self.run_log_path:
             return
-        with open(filename, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.data_log[0].keys())
-            writer.writeheader()
-            for row in self.data_log:
-                writer.writerow(row)
+        self.log(f"[*] Saving log to {filename}")
+        self.flush_run_log()
+        shutil.copyfile(self.run_log_path, filename)
 
-    def _flush_controllers(self):
+    def _flush_controllers(self, settle_s: float = 0.15):
         """Abort any lingering device activity and purge FTDI buffers."""
         ctrls = [self.cell_pc, self.back_pc, self.lf]
         for c in ctrls:
@@ -606,9 +884,26 @@ class TriaxialTestManager(QObject):
                         break
                     except Exception:
                         pass
-        time.sleep(0.15)
+        if settle_s > 0:
+            time.sleep(settle_s)
 
     def _check_stage_devices(self, stage) -> bool:
+        missing = self._missing_stage_devices(stage)
+        if not missing:
+            return True
+        if not self.interactive:
+            self.log("[!] Devices not connected: " + ", ".join(missing)
+                     + ("; continuing." if self.continue_on_missing_devices else "; stage not started."))
+            return self.continue_on_missing_devices
+        # (keep your Yes/No dialog if you like)
+        from PyQt5.QtWidgets import QMessageBox
+        msg = "The following devices are not connected:\n - " + "\n - ".join(missing) + "\n\nContinue anyway?"
+        resp = QMessageBox.warning(None, "Device(s) Not Connected", msg,
+                                   QMessageBox.Yes | QMessageBox.No)
+        return resp == QMessageBox.Yes
+
+    @staticmethod
+    def _missing_stage_devices(stage) -> List[str]:
         def _unwrap(dev): return getattr(dev, "driver", dev)
         def _ready(dev):
             dev = _unwrap(dev)
@@ -629,15 +924,7 @@ class TriaxialTestManager(QObject):
             missing.append("Load Frame")
         if hasattr(stage, "serial_pad") and stage.serial_pad and not _ready(stage.serial_pad):
             missing.append("Serial Pad")
-
-        if not missing:
-            return True
-        # (keep your Yes/No dialog if you like)
-        from PyQt5.QtWidgets import QMessageBox
-        msg = "The following devices are not connected:\n - " + "\n - ".join(missing) + "\n\nContinue anyway?"
-        resp = QMessageBox.warning(None, "Device(s) Not Connected", msg,
-                                   QMessageBox.Yes | QMessageBox.No)
-        return resp == QMessageBox.Yes
+        return missing
 
 
 